@@ -0,0 +1,4 @@
+"""Benchmarks of the smithpy hot paths.
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
@@ -0,0 +1,361 @@
+"""Benchmark cases.
+
+Every case is registered with :func:`case` and returns the zero-argument
+callable to time; setup work happens before that and is not measured.
+Inputs are fixed so results are comparable between runs.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+import smithpy
+
+from smithpy.chart import render_design
+from smithpy.components import Component, PackedChain
+from smithpy.decimate import decimate
+from smithpy.engine import ChainCache, chain_points, component_trace, to_gamma
+from smithpy.loadpull import load_response, load_statistics, parse_loads
+from smithpy.netlist import read_ladder, read_spice
+from smithpy.network import chain_response
+from smithpy.overlays import OVERLAYS, OverlayCache, overlay_key, render_overlay, to_ppm
+from smithpy.parsing import (
+    parse_complex_impedance, parse_frequency, parse_lc_value, parse_length, parse_ohm_value,
+    parse_values,
+)
+from smithpy.spatial import PointIndex
+
+from .fake_canvas import RecordingCanvas
+
+try:  # the GUI cases need tkinter importable, but never open a window
+    from smithpy.app import SmithChartApp
+except ImportError as exc:  # pragma: no cover - depends on the Python build
+    SmithChartApp = None
+    GUI_MISSING = f"smithpy.app not importable: {exc}"
+else:
+    GUI_MISSING = ""
+
+# name -> (group, setup function returning the callable to time)
+CASES: dict[str, tuple] = {}
+
+FREQ = 1e9
+Z0 = 50.0
+ZA = 25 + 10j
+
+COMPONENTS = {
+    "L_series": {"type": "L", "value": 10e-9, "orient": "series"},
+    "L_shunt": {"type": "L", "value": 10e-9, "orient": "shunt"},
+    "C_series": {"type": "C", "value": 2e-12, "orient": "series"},
+    "C_shunt": {"type": "C", "value": 2e-12, "orient": "shunt"},
+    "R_series": {"type": "R", "value": 20.0, "orient": "series"},
+    "R_shunt": {"type": "R", "value": 200.0, "orient": "shunt"},
+    "TL": {"type": "TL", "length": 60.0, "z0": 75.0},
+    "STUB_open": {"type": "STUB", "length": 40.0, "z0": 50.0, "kind": "open"},
+    "STUB_short": {"type": "STUB", "length": 40.0, "z0": 50.0, "kind": "short"},
+}
+
+PARSE_INPUTS = {
+    "parse_lc_value": ["10 nH", "2.2pF", "47 uH", "0.5 mF", "100 fF", "3.3 nh"],
+    "parse_ohm_value": ["50", "75 ohm", "0.1", "1000 Ohm", "22.5", "4.7k", "4k7", "2.2 MΩ"],
+    "parse_frequency": ["1e9", "900M", "2.4 GHz", "10 kHz"],
+    "parse_length": [("45", "deg"), ("0.125", "lambda"), ("90°", "deg"), ("0.25 λ", "lambda")],
+    "parse_complex_impedance": ["50+0j", "25 + 10j", "-3j", "100-50j", "1e3+2e2j"],
+}
+
+
+def case(name: str, group: str):
+    """Register a benchmark setup function under ``name``."""
+    def register(setup):
+        CASES[name] = (group, setup)
+        return setup
+    return register
+
+
+def long_chain(length: int) -> list[dict]:
+    """Return a chain cycling through all component kinds."""
+    kinds = list(COMPONENTS.values())
+    return [dict(kinds[i % len(kinds)]) for i in range(length)]
+
+
+def _register_traces():
+    for label, comp in COMPONENTS.items():
+        for steps in (200, 2000):
+            def setup(comp=comp, steps=steps):
+                return lambda: component_trace(ZA, comp, FREQ, Z0, steps)
+            case(f"trace.{label}.{steps}", "engine")(setup)
+
+
+def _register_batch():
+    chains = [long_chain(8 + i % 5) for i in range(1000)]
+    loads = ZA * np.linspace(0.5, 2.0, len(chains))
+    freqs = np.linspace(0.5e9, 1.5e9, 11)
+
+    @case("batch.1000x11.chain_response", "engine")
+    def dicts():
+        return lambda: [chain_response(c, za, Z0, freqs, FREQ) for c, za in zip(chains, loads)]
+
+    @case("batch.1000x11.packed", "engine")
+    def packed():
+        chain = PackedChain.from_chains(chains, loads, Z0, FREQ)
+        return lambda: chain.response(freqs)
+
+    @case("batch.1000.pack", "engine")
+    def pack():
+        return lambda: PackedChain.from_chains(chains, loads, Z0, FREQ)
+
+    for label, comp in COMPONENTS.items():
+        def setup(comp=comp):
+            typed = Component.from_dict(comp).prepare(FREQ, Z0)
+            return lambda: typed.trace(ZA, 200)
+        case(f"trace.{label}.200.typed", "engine")(setup)
+
+
+def _register_netlist():
+    # a distributed line model: 5000 LC sections and a stub at the load
+    sections = 5000
+    spice = ["line model", "V1 n0 0 AC 1"]
+    for i in range(sections):
+        spice += [f"L{i} n{i} n{i + 1} 0.25n", f"C{i} n{i + 1} 0 0.1p"]
+    spice += [f"T1 n{sections} 0 stub 0 Z0=50 TD=10p", ".end"]
+    ladder = ["C shunt 0.1p", "L series 0.25n"] * sections
+
+    @case("netlist.read_spice.10001", "parsing")
+    def spice_case():
+        return lambda: read_spice(spice)
+
+    @case("netlist.read_ladder.10000", "parsing")
+    def ladder_case():
+        return lambda: read_ladder(ladder)
+
+
+def _register_decimate():
+    # canvas coordinates of a 50 component chain sampled with 2000 steps each
+    gamma = to_gamma(chain_points(long_chain(50), ZA, Z0, FREQ, 2000), Z0)
+    trace = np.column_stack([300 + 140 * gamma.real, 150 - 140 * gamma.imag])
+    u = np.linspace(0, 1, 20000)
+    spiral = np.column_stack([300 + 140 * u * np.cos(80 * u), 150 + 140 * u * np.sin(80 * u)])
+
+    @case("decimate.chain_trace.100k", "engine")
+    def chain_case():
+        return lambda: decimate(trace)
+
+    @case("decimate.spiral.20000", "engine")
+    def spiral_case():
+        return lambda: decimate(spiral)
+
+
+def _register_render():
+    design = {"name": "bench", "za": ZA, "z0": Z0, "freq": FREQ, "components": long_chain(10)}
+    sweep = np.linspace(0.5 * FREQ, 1.5 * FREQ, 1001)
+
+    @case("render.design.10.svg", "render")
+    def svg_case():
+        return lambda: render_design(design).to_svg()
+
+    @case("render.design.10.sweep.svg", "render")
+    def sweep_case():
+        return lambda: render_design(design, freqs=sweep).to_svg()
+
+
+def _register_loadpull():
+    rng = np.random.default_rng(0)
+    loads = rng.uniform(5, 100, 100000) + 1j * rng.uniform(-50, 50, 100000)
+    chain = long_chain(10)
+    text = "\n".join(f"{z.real:.3f}, {z.imag:.3f}" for z in loads[:10000])
+
+    @case("loadpull.response.100k", "engine")
+    def response():
+        return lambda: load_statistics(load_response(chain, loads, Z0, FREQ), Z0, 2.0)
+
+    @case("loadpull.parse_loads.10000", "parsing")
+    def parse():
+        return lambda: parse_loads(text)
+
+
+def _register_overlays():
+    # a 600x300 canvas with the chart filling its height
+    size = (600, 300, (300, 150), 140.0)
+    chain = long_chain(6)
+    for kind in OVERLAYS:
+        def setup(kind=kind):
+            return lambda: to_ppm(render_overlay(kind, *size, False, chain, Z0, FREQ))
+        case(f"overlay.{kind}.600x300", "engine")(setup)
+
+    @case("overlay.response.600x300.cached", "engine")
+    def cached():
+        cache = OverlayCache()
+        key = overlay_key("response", *size, False, chain, Z0, FREQ)
+        return lambda: cache.get(key, lambda: render_overlay("response", *size, False,
+                                                             chain, Z0, FREQ))
+
+
+def _register_spatial():
+    # a dense Monte Carlo cloud, a sampled trace and a sweep locus
+    rng = np.random.default_rng(0)
+    cloud = rng.normal(0.2, 0.05, 100000) + 1j * rng.normal(-0.1, 0.05, 100000)
+    trace = 0.7 * np.exp(1j * np.linspace(0, 6, 2000))
+    sweep = 0.5 * np.exp(1j * np.linspace(-3, 3, 1001))
+    # mouse positions over the cloud, the curves and empty chart area
+    queries = np.concatenate([cloud[:100], trace[::20], rng.uniform(-1, 1, 100) + 0j])
+
+    @case("spatial.build.100k", "engine")
+    def build():
+        return lambda: PointIndex().update("montecarlo", cloud)
+
+    @case("spatial.nearest.100k", "engine")
+    def nearest():
+        index = PointIndex()
+        for name, points in (("montecarlo", cloud), ("trace", trace), ("sweep", sweep)):
+            index.update(name, points)
+        it = iter(np.resize(queries, 1 << 20).tolist())
+        # about ten pixels on a chart with a 140 px radius
+        return lambda: index.nearest(next(it), 0.07)
+
+
+def _register_parsing():
+    for func in (parse_lc_value, parse_ohm_value, parse_frequency, parse_complex_impedance):
+        def setup(func=func, values=PARSE_INPUTS[func.__name__]):
+            return lambda: [func(v) for v in values]
+        case(f"parse.{func.__name__}", "parsing")(setup)
+
+    @case("parse.parse_values.bom_10000", "parsing")
+    def bom():
+        # a BOM column: many rows, few distinct values
+        values = [f"{v}{p}" for v in ("1", "2.2", "4.7", "10", "47") for p in ("", "k", "M", "m")]
+        column = [values[i % len(values)] for i in range(10000)]
+        return lambda: parse_values(column, "ohm")
+
+    @case("parse.parse_values.numeric_10000", "parsing")
+    def numeric():
+        column = [str(i * 0.5) for i in range(10000)]
+        return lambda: parse_values(column)
+
+    @case("parse.parse_length", "parsing")
+    def setup():
+        values = PARSE_INPUTS["parse_length"]
+        return lambda: [parse_length(v, mode) for v, mode in values]
+
+
+def _register_cli():
+    # cold start of a batch run: interpreter, imports and one small design
+    design = json.dumps({"za": [ZA.real, ZA.imag], "z0": Z0, "freq": FREQ,
+                         "components": list(COMPONENTS.values())})
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(os.path.abspath(smithpy.__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+
+    @case("cli.eval.cold_start", "cli")
+    def cold_start():
+        command = [sys.executable, "-m", "smithpy", "eval", "-"]
+        return lambda: subprocess.run(command, input=design, env=env, check=True,
+                                      capture_output=True, text=True)
+
+    @case("cli.import", "cli")
+    def import_cli():
+        # also guards the batch path against pulling in tkinter
+        command = [sys.executable, "-c",
+                   "import sys, smithpy.cli; sys.exit('tkinter' in sys.modules)"]
+        return lambda: subprocess.run(command, env=env, check=True)
+
+
+class _NoJobs:
+    def cancel(self, name=None):
+        pass
+
+
+class _Var:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class ChainHost:
+    """Minimal object the real chain methods of ``SmithChartApp`` run on."""
+
+    if SmithChartApp is not None:
+        update_point = SmithChartApp.update_point
+        chain_inputs = SmithChartApp.chain_inputs
+        compute_chain = SmithChartApp.compute_chain
+        store_chain = SmithChartApp.store_chain
+        chain_components = SmithChartApp.chain_components
+        gamma_tol = SmithChartApp.gamma_tol
+        draw_traces = SmithChartApp.draw_traces
+        draw_one_chart = SmithChartApp.draw_one_chart
+        canvas_size = SmithChartApp.canvas_size
+
+    def __init__(self, components, steps=200, analytic=False, width=600, height=300):
+        self.components = components
+        self.preview = None
+        self.za = ZA
+        self.z0 = Z0
+        self.freq = FREQ
+        self.trace_steps = steps
+        self.trace_tol = 0.0
+        self.radius = self.radius_y = min(width, height) // 2 - 10
+        self.analytic_arcs = _Var(analytic)
+        self.chain_cache = ChainCache()
+        self.jobs = _NoJobs()
+        self.canvas = RecordingCanvas(width, height)
+        self.trace_items = {self.canvas: []}
+
+
+def _register_gui():
+    for length in (10, 50):
+        for analytic in (False, True):
+            mode = "arcs" if analytic else "sampled"
+
+            def cold(length=length, analytic=analytic):
+                host = ChainHost(long_chain(length), analytic=analytic)
+
+                def run():
+                    host.chain_cache.invalidate()
+                    host.update_point()
+                return run
+            case(f"update_point.{length}.{mode}.cold", "gui")(cold)
+
+        def edit_last(length=length):
+            # the common slider case: only the last component changes
+            host = ChainHost(long_chain(length))
+            host.update_point()
+            values = iter(np.linspace(1e-9, 20e-9, 1 << 20))
+
+            def run():
+                host.components[-1] = {"type": "L", "value": next(values), "orient": "series"}
+                host.update_point()
+            return run
+        case(f"update_point.{length}.sampled.edit_last", "gui")(edit_last)
+
+    for width, height in ((600, 300), (1200, 800), (2400, 1600)):
+        def grid(width=width, height=height):
+            host = ChainHost([], width=width, height=height)
+            return lambda: host.draw_one_chart(host.canvas, "impedance")
+        case(f"draw_one_chart.{width}x{height}", "gui")(grid)
+
+    @case("draw_traces.50.reuse", "gui")
+    def traces():
+        host = ChainHost(long_chain(50))
+        host.update_point()
+        center = (300, 150)
+        host.draw_traces(host.canvas, host.trace_gamma, host.trace_bounds, center, host.radius)
+        return lambda: host.draw_traces(host.canvas, host.trace_gamma, host.trace_bounds,
+                                        center, host.radius)
+
+
+_register_traces()
+_register_batch()
+_register_parsing()
+_register_netlist()
+_register_decimate()
+_register_render()
+_register_loadpull()
+_register_overlays()
+_register_spatial()
+_register_cli()
+if SmithChartApp is not None:
+    _register_gui()
@@ -0,0 +1,92 @@
+"""Recording stand-in for ``tkinter.Canvas`` used by rendering benchmarks.
+
+It keeps the created items like Tk does (kind, coordinates, options and
+tags) but never draws, so the Python side of the rendering code can be
+timed on a machine without a display.
+"""
+from __future__ import annotations
+
+import itertools
+
+
+class RecordingCanvas:
+    """Canvas that stores items instead of drawing them."""
+
+    def __init__(self, width: int = 600, height: int = 300):
+        self.width = width
+        self.height = height
+        self.items: dict[int, dict] = {}
+        self.created = 0
+        self.deleted = 0
+        self._ids = itertools.count(1)
+
+    def __getitem__(self, key):
+        return {"width": self.width, "height": self.height}[key]
+
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    def _create(self, kind, coords, options):
+        if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+            coords = coords[0]
+        tags = options.get("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        item = next(self._ids)
+        self.items[item] = {"kind": kind, "coords": list(coords), "options": options,
+                            "tags": tuple(tags)}
+        self.created += 1
+        return item
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, options)
+
+    def create_arc(self, *coords, **options):
+        return self._create("arc", coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def _find(self, tag_or_id):
+        if tag_or_id == "all":
+            return list(self.items)
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        return [i for i, item in self.items.items() if tag_or_id in item["tags"]]
+
+    def find_withtag(self, tag_or_id):
+        return tuple(self._find(tag_or_id))
+
+    def delete(self, *tags):
+        for tag in tags:
+            for item in self._find(tag):
+                del self.items[item]
+                self.deleted += 1
+
+    def coords(self, item, *coords):
+        if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+            coords = coords[0]
+        if coords:
+            self.items[item]["coords"] = list(coords)
+        return self.items[item]["coords"]
+
+    def itemconfigure(self, tag_or_id, **options):
+        for item in self._find(tag_or_id):
+            self.items[item]["options"].update(options)
+
+    itemconfig = itemconfigure
+
+    def tag_lower(self, *args):
+        pass
+
+    def tag_raise(self, *args):
+        pass
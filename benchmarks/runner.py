@@ -0,0 +1,140 @@
+"""Run the benchmark cases, store the timings as JSON and compare baselines.
+
+Examples
+--------
+Save a baseline, change the code, then check for regressions::
+
+    python -m benchmarks --output baseline.json
+    python -m benchmarks --baseline baseline.json --output current.json
+
+The run exits with status 1 if any case got slower than the baseline by
+more than ``--threshold``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+# timing runs per case; the minimum is the most stable figure
+DEFAULT_REPEAT = 5
+# minimum duration of one timing run in seconds
+DEFAULT_MIN_TIME = 0.05
+# allowed slowdown against the baseline, as a fraction
+DEFAULT_THRESHOLD = 0.25
+
+
+def _import_cases():
+    try:
+        import smithpy  # noqa: F401
+    except ImportError:
+        # running from a source checkout without installing
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        sys.path.insert(0, os.path.join(root, "src"))
+    from . import cases
+    return cases
+
+
+def measure(func, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> dict:
+    """Return per-call timings of ``func`` in seconds."""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 2
+    times = [t / number for t in timer.repeat(repeat, number)]
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def metadata(cases) -> dict:
+    import numpy
+    import smithpy
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": numpy.__version__,
+        "smithpy": smithpy.__version__,
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "gui_skipped": cases.GUI_MISSING,
+    }
+
+
+def run(pattern: str | None = None, repeat: int = DEFAULT_REPEAT,
+        min_time: float = DEFAULT_MIN_TIME, out=sys.stdout) -> dict:
+    """Run all cases whose name contains ``pattern``."""
+    cases = _import_cases()
+    results = {}
+    for name, (group, setup) in sorted(cases.CASES.items()):
+        if pattern and pattern not in name:
+            continue
+        timing = measure(setup(), repeat, min_time)
+        results[name] = {"group": group, **timing}
+        print(f"{name:45s} {timing['min'] * 1e6:12.2f} us", file=out)
+    return {"meta": metadata(cases), "results": results}
+
+
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """Return ``(name, baseline_s, current_s, ratio, regressed)`` per common case."""
+    rows = []
+    base = baseline["results"]
+    for name, timing in sorted(results["results"].items()):
+        if name not in base:
+            continue
+        ratio = timing["min"] / base[name]["min"]
+        rows.append((name, base[name]["min"], timing["min"], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n")[0])
+    parser.add_argument("-k", "--filter", help="only run cases whose name contains this text")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    parser.add_argument("-b", "--baseline", help="compare against results saved with --output")
+    parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction (default: %(default)s)")
+    parser.add_argument("-r", "--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="timing runs per case (default: %(default)s)")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help="minimum seconds per timing run (default: %(default)s)")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (group, _) in sorted(_import_cases().CASES.items()):
+            print(f"{group:8s} {name}")
+        return 0
+    results = run(args.filter, args.repeat, args.min_time)
+    if results["meta"]["gui_skipped"]:
+        print(f"GUI cases skipped: {results['meta']['gui_skipped']}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2, sort_keys=True)
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    rows = compare(results, baseline, args.threshold)
+    print(f"\n{'case':45s} {'baseline':>12s} {'current':>12s} {'ratio':>7s}")
+    for name, base, cur, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:45s} {base * 1e6:10.2f}us {cur * 1e6:10.2f}us {ratio:7.2f}{flag}")
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than the baseline by more than "
+              f"{args.threshold:.0%}")
+        return 1
+    return 0
+
+
+__all__ = ["measure", "run", "compare", "main"]
@@ -1,9 +1,10 @@
-"""Command line entry point for running the Smith chart GUI."""
+"""Command line entry point: ``python -m smithpy`` runs :func:`smithpy.cli.main`."""
+import sys
 
 try:  # support running via ``python src/smithpy/__main__.py``
-    from .app import main
+    from .cli import main
 except ImportError:  # pragma: no cover - direct execution fallback
-    from app import main
+    from cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
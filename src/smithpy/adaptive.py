@@ -0,0 +1,77 @@
+"""Adaptive sampling of curves in the reflection plane.
+
+A fixed number of steps wastes points on nearly straight parts of a trace
+and under-samples sharp turns, e.g. a stub passing a pole of ``tan`` or a
+resonance in a frequency sweep.  :func:`adaptive_sample` starts from a
+coarse grid and bisects every interval whose midpoint deviates from the
+chord by more than a tolerance or whose chord is too long, so the point
+density follows the curvature and speed of the curve.  The tolerance is
+given in Γ units; divide a pixel tolerance by the chart radius in pixels.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+# intervals of the initial uniform grid
+INITIAL_INTERVALS = 16
+# maximum number of bisection rounds
+MAX_DEPTH = 14
+# longest allowed chord as a multiple of the tolerance
+MAX_STEP_RATIO = 40.0
+
+
+def adaptive_sample(func, start: float, stop: float, tol: float,
+                    initial: int = INITIAL_INTERVALS, max_depth: int = MAX_DEPTH,
+                    max_step: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Sample the complex curve ``func`` on ``[start, stop]`` adaptively.
+
+    Parameters
+    ----------
+    func:
+        Vectorized function mapping a parameter array to complex points.
+    start, stop:
+        Parameter range; both end points are included.
+    tol:
+        Maximum distance between the midpoint of an interval and the
+        midpoint of its chord.
+    initial:
+        Number of intervals of the starting grid.
+    max_depth:
+        Maximum number of bisections of an initial interval.
+    max_step:
+        Longest allowed chord, ``MAX_STEP_RATIO * tol`` if omitted.
+
+    Returns
+    -------
+    tuple
+        The sorted parameters and the curve points at them.
+    """
+    if tol <= 0:
+        raise ValueError("tolerance must be positive")
+    if max_step is None:
+        max_step = MAX_STEP_RATIO * tol
+    t = np.linspace(start, stop, initial + 1)
+    f = np.asarray(func(t), dtype=complex)
+    active = np.ones(initial, dtype=bool)
+    for _ in range(max_depth):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        # only intervals split in the previous round are tested again
+        tm = (t[idx] + t[idx + 1]) / 2
+        fm = np.asarray(func(tm), dtype=complex)
+        fa, fb = f[idx], f[idx + 1]
+        with np.errstate(invalid="ignore"):
+            split = (np.abs(fm - (fa + fb) / 2) > tol) | (np.abs(fb - fa) > max_step)
+        if not split.any():
+            break
+        t = np.insert(t, idx[split] + 1, tm[split])
+        f = np.insert(f, idx[split] + 1, fm[split])
+        # both halves of a split interval stay active, all others are done
+        flags = np.zeros(active.size, dtype=bool)
+        flags[idx[split]] = True
+        active = np.repeat(flags, np.where(flags, 2, 1))
+    return t, f
+
+
+__all__ = ["INITIAL_INTERVALS", "MAX_DEPTH", "adaptive_sample"]
@@ -1,17 +1,136 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import cProfile
 import math
+import os
+import pstats
+import sys
+
+import numpy as np
 
 try:  # allow running as a module or a script
-    from .dialogs import ComponentDialog
+    from .chart import canvas_points, draw_grid, path_shape, trace_arcs, trace_polylines
+    from .decimate import decimate, decimate_bounds
+    from .dialogs import ComponentDialog, LoadsDialog, SynthesisDialog
+    from .engine import (
+        TRACE_STEPS, ChainCache, component_trace, match_metrics, sweep_frequencies,
+        to_gamma,
+    )
+    from .export import export_response
+    from .jobs import CancelToken, JobManager
+    from .loadpull import load_response, load_statistics, read_loads
+    from .netlist import read_netlist
+    from .network import adaptive_response, chain_response
+    from .overlays import OverlayCache, overlay_key, render_overlay, to_ppm
     from .parsing import parse_complex_impedance
+    from .profiling import PROFILER
+    from .scheduler import RenderScheduler
+    from .spatial import PointIndex
+    from .tolerance import MC_SAMPLES, monte_carlo, tolerance_yield
+    from .touchstone import read_touchstone
 except ImportError:  # pragma: no cover - direct execution fallback
-    from dialogs import ComponentDialog
+    from chart import canvas_points, draw_grid, path_shape, trace_arcs, trace_polylines
+    from decimate import decimate, decimate_bounds
+    from dialogs import ComponentDialog, LoadsDialog, SynthesisDialog
+    from engine import (
+        TRACE_STEPS, ChainCache, component_trace, match_metrics, sweep_frequencies,
+        to_gamma,
+    )
+    from export import export_response
+    from jobs import CancelToken, JobManager
+    from loadpull import load_response, load_statistics, read_loads
+    from netlist import read_netlist
+    from network import adaptive_response, chain_response
+    from overlays import OverlayCache, overlay_key, render_overlay, to_ppm
     from parsing import parse_complex_impedance
+    from profiling import PROFILER
+    from scheduler import RenderScheduler
+    from spatial import PointIndex
+    from tolerance import MC_SAMPLES, monte_carlo, tolerance_yield
+    from touchstone import read_touchstone
+
+# default frequency sweep
+SWEEP_START = 500e6
+SWEEP_STOP = 1.5e9
+SWEEP_POINTS = 1001
+# pixel tolerance of adaptive trace and sweep sampling, 0 uses uniform steps
+TRACE_TOL = 0.0
+# work (points x components) above which computations run as background jobs
+BACKGROUND_POINTS = 100000
+# frequencies per chunk of a background sweep, between progress reports
+SWEEP_CHUNK = 65536
+# default VSWR spec for the Monte Carlo yield
+MC_VSWR = 2.0
+# functions listed by --profile
+PROFILE_TOP = 30
+# delay before redrawing the charts after the last resize event
+RESIZE_DELAY_MS = 100
+# distance in pixels within which the hover readout snaps to a plotted point
+SNAP_PIXELS = 10
+# colour of each point cloud drawn with draw_cloud
+CLOUD_COLORS = {"montecarlo": "orange", "loads": "gray50", "load_inputs": "purple"}
+# View menu overlay entries: (label, overlay kind)
+OVERLAY_CHOICES = (
+    ("No overlay", ""),
+    ("VSWR rings", "vswr"),
+    ("Q contours", "q"),
+    ("Mismatch loss", "mismatch"),
+    ("Load response", "response"),
+)
+
+
+def component_label(comp):
+    """Return the component list text for ``comp``."""
+    if comp["type"] in ("L", "C", "R"):
+        text = f"{comp['type']} {comp['orient']} = {comp['disp']}"
+    elif comp["type"] == "TL":
+        text = f"TL {comp['disp']} Z0={comp['z0']}"
+    else:
+        text = f"Stub {comp['kind']} {comp['disp']} Z0={comp['z0']}"
+    if comp.get("tol"):
+        text += f" \u00b1{comp['tol']:g}%"
+    return text
+
+
+class ChartCanvas(tk.Canvas):
+    """Canvas that reports item creation, updates and deletion to the profiler.
+
+    Only the item types the app draws are counted.
+    """
+
+    def create_arc(self, *args, **kw):
+        PROFILER.count("items created")
+        return super().create_arc(*args, **kw)
+
+    def create_image(self, *args, **kw):
+        PROFILER.count("items created")
+        return super().create_image(*args, **kw)
+
+    def create_line(self, *args, **kw):
+        PROFILER.count("items created")
+        return super().create_line(*args, **kw)
+
+    def create_oval(self, *args, **kw):
+        PROFILER.count("items created")
+        return super().create_oval(*args, **kw)
+
+    def create_rectangle(self, *args, **kw):
+        PROFILER.count("items created")
+        return super().create_rectangle(*args, **kw)
+
+    def create_text(self, *args, **kw):
+        PROFILER.count("items created")
+        return super().create_text(*args, **kw)
+
+    def coords(self, *args):
+        if len(args) > 1:
+            PROFILER.count("items moved")
+        return super().coords(*args)
+
+    def delete(self, *args):
+        PROFILER.count("delete calls")
+        super().delete(*args)
 
-PI2 = 2 * 3.141592653589793
-# default number of intermediate points for each component
-TRACE_STEPS = 200
 
 class SmithChartApp(tk.Tk):
     def __init__(self):
@@ -32,14 +151,36 @@ class SmithChartApp(tk.Tk):
         self.freq = 1e9  # 1 GHz for calculations
         self.z0 = 50.0
         self.za = 50+0j
+        # frequency dependent load read from a Touchstone file
+        self.za_data = None
+        self.za_data_name = ""
         self.trace_steps = TRACE_STEPS
+        self.trace_tol = TRACE_TOL
+        # traces of unchanged chain prefixes are reused between updates
+        self.chain_cache = ChainCache()
 
         menubar = tk.Menu(self)
         filem = tk.Menu(menubar, tearoff=0)
         filem.add_command(label="Reset", command=self.reset_app)
+        filem.add_command(label="Load Z_A from Touchstone...", command=self.load_za_file)
+        filem.add_command(label="Load Z_A list...", command=self.load_loads_file)
+        filem.add_command(label="Import netlist...", command=self.import_netlist_file)
+        filem.add_command(label="Export response...", command=self.export_response_file)
         filem.add_separator()
         filem.add_command(label="Quit", command=self.destroy)
         menubar.add_cascade(label="File", menu=filem)
+        viewm = tk.Menu(menubar, tearoff=0)
+        self.profile_overlay = tk.BooleanVar(value=False)
+        viewm.add_checkbutton(label="Profiling overlay", variable=self.profile_overlay,
+                              command=self.toggle_profile_overlay)
+        viewm.add_separator()
+        self.overlay_kind = tk.StringVar(value="")
+        for label, kind in OVERLAY_CHOICES:
+            viewm.add_radiobutton(label=label, value=kind, variable=self.overlay_kind,
+                                  command=lambda: self.scheduler.invalidate("overlay"))
+        menubar.add_cascade(label="View", menu=viewm)
+        # profiling switched on from the command line stays on
+        self.profile_always = PROFILER.enabled
         helpm = tk.Menu(menubar, tearoff=0)
         helpm.add_command(label="About", command=lambda: messagebox.showinfo("About", "Interactive Smith Chart"))
         menubar.add_cascade(label="Help", menu=helpm)
@@ -72,6 +213,14 @@ class SmithChartApp(tk.Tk):
         self.steps_entry = ttk.Entry(settings, width=6)
         self.steps_entry.grid(row=2, column=1)
         self.steps_entry.insert(0, str(self.trace_steps))
+        # draw traces as exact arcs instead of sampled polylines
+        self.analytic_arcs = tk.BooleanVar(value=True)
+        ttk.Checkbutton(settings, text="Analytic arcs", variable=self.analytic_arcs,
+                        command=self.invalidate_chain).grid(row=2, column=2, columnspan=3, sticky="w")
+        ttk.Label(settings, text="Tol [px]").grid(row=3, column=0, sticky="w")
+        self.tol_entry = ttk.Entry(settings, width=6)
+        self.tol_entry.grid(row=3, column=1)
+        self.tol_entry.insert(0, str(self.trace_tol))
 
         self.za_mode = tk.StringVar(value="Z")
         self.za_label = ttk.Label(settings, text="Z_A")
@@ -80,24 +229,89 @@ class SmithChartApp(tk.Tk):
         self.za_entry.grid(row=1, column=1, columnspan=3, sticky="we")
         self.za_entry.insert(0, "50+0j")
         ttk.OptionMenu(settings, self.za_mode, self.za_mode.get(), "Z", "Y", command=lambda _: self.update_za_label()).grid(row=1, column=4)
-        ttk.Button(settings, text="Apply", command=self.apply_settings).grid(row=0, column=5, rowspan=3, sticky="ns")
+        ttk.Button(settings, text="Apply", command=self.apply_settings).grid(row=0, column=5, rowspan=4, sticky="ns")
 
-        self.canvas = tk.Canvas(top_canvas, width=600, height=300, bg="white")
+        # frequency sweep of the final impedance
+        sweep = ttk.LabelFrame(right, text="Sweep")
+        sweep.pack(fill="x", padx=5, pady=5)
+        self.sweep_on = tk.BooleanVar(value=False)
+        self.sweep_freqs = None
+        self.sweep_range = None
+        self.sweep_f = None
+        self.sweep_z = None
+        self.sweep_metrics = None
+        self.sweep_stale = True
+        ttk.Label(sweep, text="Start [MHz]").grid(row=0, column=0, sticky="w")
+        self.sweep_start_entry = ttk.Entry(sweep, width=8)
+        self.sweep_start_entry.grid(row=0, column=1)
+        self.sweep_start_entry.insert(0, str(SWEEP_START / 1e6))
+        ttk.Label(sweep, text="Stop [MHz]").grid(row=0, column=2, sticky="w")
+        self.sweep_stop_entry = ttk.Entry(sweep, width=8)
+        self.sweep_stop_entry.grid(row=0, column=3)
+        self.sweep_stop_entry.insert(0, str(SWEEP_STOP / 1e6))
+        ttk.Label(sweep, text="Points").grid(row=1, column=0, sticky="w")
+        self.sweep_points_entry = ttk.Entry(sweep, width=8)
+        self.sweep_points_entry.grid(row=1, column=1)
+        self.sweep_points_entry.insert(0, str(SWEEP_POINTS))
+        self.sweep_scale = tk.StringVar(value="linear")
+        ttk.OptionMenu(sweep, self.sweep_scale, self.sweep_scale.get(), "linear", "log").grid(row=1, column=2, columnspan=2, sticky="we")
+        ttk.Checkbutton(sweep, text="Show", variable=self.sweep_on, command=self.apply_sweep).grid(row=2, column=0, sticky="w")
+        ttk.Button(sweep, text="Apply", command=self.apply_sweep).grid(row=2, column=1, columnspan=3, sticky="we")
+
+        # Monte Carlo tolerance analysis of the final impedance
+        mc = ttk.LabelFrame(right, text="Monte Carlo")
+        mc.pack(fill="x", padx=5, pady=5)
+        self.mc_on = tk.BooleanVar(value=False)
+        self.mc_seed = 0
+        self.mc_z = None
+        self.mc_gamma = None
+        self.mc_yield = None
+        self.mc_stale = True
+        self.mc_samples = MC_SAMPLES
+        self.mc_vswr = MC_VSWR
+        ttk.Label(mc, text="Samples").grid(row=0, column=0, sticky="w")
+        self.mc_samples_entry = ttk.Entry(mc, width=8)
+        self.mc_samples_entry.grid(row=0, column=1)
+        self.mc_samples_entry.insert(0, str(self.mc_samples))
+        ttk.Label(mc, text="VSWR max").grid(row=0, column=2, sticky="w")
+        self.mc_vswr_entry = ttk.Entry(mc, width=6)
+        self.mc_vswr_entry.grid(row=0, column=3)
+        self.mc_vswr_entry.insert(0, str(self.mc_vswr))
+        ttk.Checkbutton(mc, text="Show", variable=self.mc_on, command=self.apply_montecarlo).grid(row=1, column=0, sticky="w")
+        ttk.Button(mc, text="Run", command=lambda: self.apply_montecarlo(reseed=True)).grid(row=1, column=1, columnspan=3, sticky="we")
+
+        # the chain terminated with a whole list of loads (load-pull clouds)
+        loads = ttk.LabelFrame(right, text="Loads")
+        loads.pack(fill="x", padx=5, pady=5)
+        self.loads = None
+        self.loads_name = ""
+        self.loads_z = None
+        self.loads_gamma = None
+        self.loads_stats = None
+        self.loads_stale = True
+        ttk.Button(loads, text="Paste...", command=lambda: LoadsDialog(self)).grid(row=0, column=0, sticky="we")
+        ttk.Button(loads, text="Open...", command=self.load_loads_file).grid(row=0, column=1, sticky="we")
+        ttk.Button(loads, text="Clear", command=lambda: self.set_loads(None)).grid(row=0, column=2, sticky="we")
+
+        self.canvas = ChartCanvas(top_canvas, width=600, height=300, bg="white")
         self.canvas.pack(fill="both", expand=True)
-        self.adm_canvas = tk.Canvas(bottom_canvas, width=600, height=300, bg="white")
+        self.adm_canvas = ChartCanvas(bottom_canvas, width=600, height=300, bg="white")
         self.adm_canvas.pack(fill="both", expand=True)
 
         self.comp_listbox = tk.Listbox(right, width=40)
         self.comp_listbox.pack(fill="y", padx=5)
         self.comp_listbox.bind("<Double-Button-1>", self.edit_component)
 
-        self.circ_canvas = tk.Canvas(right, width=200, height=120, bg="white")
+        self.circ_canvas = ChartCanvas(right, width=200, height=120, bg="white")
         self.circ_canvas.pack(fill="x", padx=5)
 
         # status bar for coordinates
         self.coord_var = tk.StringVar(value="Bereit")
         self.status = ttk.Label(self, textvariable=self.coord_var, relief="sunken", anchor="w")
         self.status.pack(side="bottom", fill="x")
+        # readout of the point under the mouse or the pinned point
+        self.hover_var = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.hover_var, anchor="w").pack(side="bottom", fill="x")
 
         self.update_za_label()
 
@@ -109,144 +323,191 @@ class SmithChartApp(tk.Tk):
                      state="readonly").pack(fill="x", padx=5, pady=2)
         ttk.Button(control, text="Add", command=self.add_component).pack(fill="x", padx=5, pady=2)
         ttk.Button(control, text="Remove Last", command=self.remove_last).pack(fill="x", padx=5, pady=2)
+        ttk.Button(control, text="Synthesize...", command=self.open_synthesis).pack(fill="x", padx=5, pady=2)
 
-        self.canvas.bind("<Configure>", self.on_canvas_resize)
-        self.adm_canvas.bind("<Configure>", self.on_canvas_resize)
+        for canvas in (self.canvas, self.adm_canvas):
+            canvas.bind("<Configure>", self.on_canvas_resize)
+            canvas.bind("<Motion>", self.on_canvas_motion)
+            canvas.bind("<Leave>", self.on_canvas_leave)
+            canvas.bind("<Button-1>", self.on_canvas_click)
+            canvas.bind("<Button-3>", self.on_canvas_unpin)
 
-        self.draw_chart()
-        self.update_point()
-        self.draw_circuit()
+        # canvas size each grid was last drawn for
+        self.grid_sizes = {}
+        self.resize_job = None
+        self.point = self.canvas.create_oval(0, 0, 0, 0, fill="red")
+        self.adm_point = self.adm_canvas.create_oval(0, 0, 0, 0, fill="red")
+        # (hover, pinned) marker rings of the readout on each chart
+        self.readout_items = {
+            canvas: (canvas.create_oval(0, 0, 0, 0, outline="black", state="hidden"),
+                     canvas.create_oval(0, 0, 0, 0, outline="magenta", width=2, state="hidden"))
+            for canvas in (self.canvas, self.adm_canvas)
+        }
+        # rendered overlay images and the (key, image, item) shown per canvas
+        self.overlay_cache = OverlayCache()
+        self.overlay_items = {}
+        # one polyline item per component, reused between updates
+        self.trace_items = {self.canvas: [], self.adm_canvas: []}
+        # (kind, item) per component when traces are drawn as arcs
+        self.arc_items = {self.canvas: [], self.adm_canvas: []}
+        # one dot per occupied pixel of each point cloud
+        self.cloud_items = {name: {self.canvas: [], self.adm_canvas: []} for name in CLOUD_COLORS}
+        # (component, index) shown while a dialog slider is dragged
+        self.preview = None
+        self.chain_stale = True
+        self.trace_gamma = to_gamma(np.array([self.za]), self.z0)
+        self.trace_bounds = []
+        self.trace_arcs = None
+        self.final_z = self.za
+        # trace, sweep and Monte Carlo points for snapping the hover readout;
+        # hover is (canvas, x, y) of the mouse, pinned the Γ of the last click
+        self.point_index = PointIndex()
+        self.hover = None
+        self.pinned = None
+        # heavy computations run here; name -> progress of running jobs
+        self.jobs = JobManager(self)
+        self.busy = {}
+        self.scheduler = RenderScheduler(self, [
+            ("grid", self.draw_chart),
+            ("overlay", self.draw_overlays),
+            ("traces", self.render_traces),
+            ("sweep", self.render_sweep),
+            ("montecarlo", self.render_montecarlo),
+            ("loads", self.render_loads),
+            ("marker", self.draw_markers),
+            ("hover", self.draw_hover),
+            ("schematic", self.draw_circuit),
+            ("status", self.update_status),
+        ], on_frame=self.draw_profile_overlay)
+        self.scheduler.invalidate()
 
-    def draw_one_chart(self, canvas, mode="impedance"):
-        canvas.delete("all")
+    def canvas_size(self, canvas):
         w = canvas.winfo_width()
         h = canvas.winfo_height()
         if w <= 1 or h <= 1:
             w = int(canvas["width"])
             h = int(canvas["height"])
-        center = w // 2, h // 2
-        radius = min(w, h) // 2 - 10
-        cx, cy = center
-        r = radius
-        # dynamic fonts for chart annotations
-        text_font = ("TkDefaultFont", max(8, int(r / 18)))
-        title_font = ("TkDefaultFont", max(10, int(r / 14)))
-        canvas.create_oval(cx - r, cy - r, cx + r, cy + r)
-        canvas.create_line(cx - r, cy, cx + r, cy, fill="lightgray")
-        if mode == "impedance":
-            canvas.create_text(cx + r + 15, cy, text="Re(z/Z0)", anchor="w", font=text_font)
-            canvas.create_text(cx - r - 15, cy, text="-Re(z/Z0)", anchor="e", font=text_font)
-            canvas.create_text(cx, cy - r - 15, text="Im(z/Z0)", anchor="s", font=text_font)
-            canvas.create_text(cx, cy + r + 15, text="-Im(z/Z0)", anchor="n", font=text_font)
-            canvas.create_text(cx, 10, text="Impedanzebene", anchor="n", font=title_font)
-        else:
-            canvas.create_text(cx + r + 15, cy, text="Re(y/Y0)", anchor="w", font=text_font)
-            canvas.create_text(cx - r - 15, cy, text="-Re(y/Y0)", anchor="e", font=text_font)
-            canvas.create_text(cx, cy - r - 15, text="Im(y/Y0)", anchor="s", font=text_font)
-            canvas.create_text(cx, cy + r + 15, text="-Im(y/Y0)", anchor="n", font=text_font)
-            canvas.create_text(cx, 10, text="Admittanzebene", anchor="n", font=title_font)
-
-        # ticks and labels on the real axis
-        real_vals = [0, 0.2, 0.5, 1, 2, 5]
-        for val in real_vals:
-            if val == 0:
-                x = cx - r
-            else:
-                x = cx + r * (val - 1) / (val + 1)
-            canvas.create_line(x, cy - 5, x, cy + 5, fill="gray")
-            canvas.create_text(x, cy + 10, text=str(val), fill="gray", font=text_font, anchor="n")
-        canvas.create_line(cx + r, cy - 5, cx + r, cy + 5, fill="gray")
-        canvas.create_text(cx + r, cy + 10, text="∞", fill="gray", font=text_font, anchor="n")
-
-        # ticks and labels on the imaginary axis at the outer radius
-        imag_vals = [0.2, 0.5, 1, 2, 5]
-        for val in imag_vals:
-            theta = 2 * math.atan(1 / val)
-            x = cx + r * math.cos(theta)
-            y = cy - r * math.sin(theta)
-            canvas.create_line(x, y, x + 5 * math.cos(theta), y - 5 * math.sin(theta), fill="gray")
-            label = f"+j{val}" if mode == "impedance" else f"+jb{val}"
-            canvas.create_text(x + 10 * math.cos(theta), y - 10 * math.sin(theta), text=label, fill="gray", font=text_font)
-            x = cx + r * math.cos(theta)
-            y = cy + r * math.sin(theta)
-            canvas.create_line(x, y, x + 5 * math.cos(theta), y + 5 * math.sin(theta), fill="gray")
-            label = f"-j{val}" if mode == "impedance" else f"-jb{val}"
-            canvas.create_text(x + 10 * math.cos(theta), y + 10 * math.sin(theta), text=label, fill="gray", font=text_font)
-
-        # constant resistance/conductance circles
-        for val in [0.2, 0.5, 1, 2, 5]:
-            cr = r / (1 + val)
-            off = r * val / (1 + val)
-            canvas.create_oval(cx + off - cr, cy - cr, cx + off + cr, cy + cr, outline="lightgray")
-            label = f"r={val}" if mode == "impedance" else f"g={val}"
-            canvas.create_text(cx + off + cr + 15, cy, text=label, anchor="w", fill="gray", font=text_font)
-
-        # constant reactance/susceptance arcs
-        for val in [0.2, 0.5, 1, 2, 5]:
-            cr = r / val
-            canvas.create_arc(cx - cr, cy - cr, cx + cr, cy + cr, start=90, extent=180, style='arc', outline="lightgray")
-            canvas.create_arc(cx - cr, cy - cr, cx + cr, cy + cr, start=-90, extent=180, style='arc', outline="lightgray")
-        return center, radius
+        return w, h
+
+    def draw_one_chart(self, canvas, mode="impedance"):
+        """Draw the static grid of one chart as items tagged ``"grid"``."""
+        canvas.delete("grid")
+        w, h = self.canvas_size(canvas)
+        return draw_grid(canvas, w, h, mode)
 
     def draw_chart(self):
-        self.center, self.radius = self.draw_one_chart(self.canvas, "impedance")
-        self.center_y, self.radius_y = self.draw_one_chart(self.adm_canvas, "admittance")
-        self.point = self.canvas.create_oval(self.center[0], self.center[1], self.center[0], self.center[1], fill="red")
-        self.adm_point = self.adm_canvas.create_oval(self.center_y[0], self.center_y[1], self.center_y[0], self.center_y[1], fill="red")
+        """Redraw the grid of each chart whose canvas size has changed."""
+        size = self.canvas_size(self.canvas)
+        if self.grid_sizes.get(self.canvas) != size:
+            self.center, self.radius = self.draw_one_chart(self.canvas, "impedance")
+            self.grid_sizes[self.canvas] = size
+        size = self.canvas_size(self.adm_canvas)
+        if self.grid_sizes.get(self.adm_canvas) != size:
+            self.center_y, self.radius_y = self.draw_one_chart(self.adm_canvas, "admittance")
+            self.grid_sizes[self.adm_canvas] = size
+
+    def draw_overlays(self):
+        """Show the selected overlay under the grid of both charts.
+
+        The image is only rendered when one of its inputs changed (chart
+        size, overlay kind and, for the load response, the chain, Z0 and
+        frequency); otherwise the shown or a cached image is reused.
+        """
+        kind = self.overlay_kind.get()
+        for canvas, center, radius, admittance in (
+                (self.canvas, self.center, self.radius, False),
+                (self.adm_canvas, self.center_y, self.radius_y, True)):
+            shown = self.overlay_items.get(canvas)
+            if not kind or radius <= 0:
+                if shown is not None:
+                    canvas.delete(shown[2])
+                    del self.overlay_items[canvas]
+                continue
+            w, h = self.canvas_size(canvas)
+            # the committed chain: slider previews would re-render every frame
+            args = (kind, w, h, center, radius, admittance,
+                    self.components, self.z0, self.freq)
+            key = overlay_key(*args)
+            if shown is not None and shown[0] == key:
+                continue
+
+            def create(args=args):
+                with PROFILER.span("render overlay"):
+                    ppm = to_ppm(render_overlay(*args))
+                return tk.PhotoImage(master=self, data=ppm, format="PPM")
+            image = self.overlay_cache.get(key, create)
+            if shown is None:
+                item = canvas.create_image(0, 0, image=image, anchor="nw", tags="overlay")
+            else:
+                item = shown[2]
+                canvas.itemconfigure(item, image=image)
+            canvas.tag_lower(item)
+            self.overlay_items[canvas] = (key, image, item)
 
     def on_canvas_resize(self, event):
-        self.draw_chart()
-        self.update_point()
+        # coalesce a burst of <Configure> events into one redraw
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+        self.resize_job = self.after(RESIZE_DELAY_MS, self.finish_resize)
+
+    def finish_resize(self):
+        self.resize_job = None
+        if self.trace_tol > 0:
+            # the pixel tolerance depends on the chart size
+            self.chain_stale = True
+            self.sweep_stale = True
+        self.scheduler.invalidate("grid", "overlay", "traces", "sweep", "montecarlo", "loads",
+                                  "marker", "hover")
 
     def add_inductor(self):
         dlg = ComponentDialog(self, "L", index=len(self.components))
         self.wait_window(dlg)
+        self.end_preview()
         if dlg.res:
             comp = {"type": "L", **dlg.res}
             self.components.append(comp)
-            self.comp_listbox.insert(tk.END, f"L {comp['orient']} = {comp['disp']}")
-            self.update_point()
-            self.draw_circuit()
+            self.comp_listbox.insert(tk.END, component_label(comp))
+            self.invalidate_chain("schematic")
 
     def add_resistor(self):
         dlg = ComponentDialog(self, "R", index=len(self.components))
         self.wait_window(dlg)
+        self.end_preview()
         if dlg.res:
             comp = {"type": "R", **dlg.res}
             self.components.append(comp)
-            self.comp_listbox.insert(tk.END, f"R {comp['orient']} = {comp['disp']}")
-            self.update_point()
-            self.draw_circuit()
+            self.comp_listbox.insert(tk.END, component_label(comp))
+            self.invalidate_chain("schematic")
 
     def add_capacitor(self):
         dlg = ComponentDialog(self, "C", index=len(self.components))
         self.wait_window(dlg)
+        self.end_preview()
         if dlg.res:
             comp = {"type": "C", **dlg.res}
             self.components.append(comp)
-            self.comp_listbox.insert(tk.END, f"C {comp['orient']} = {comp['disp']}")
-            self.update_point()
-            self.draw_circuit()
+            self.comp_listbox.insert(tk.END, component_label(comp))
+            self.invalidate_chain("schematic")
 
     def add_tline(self):
         dlg = ComponentDialog(self, "TL", index=len(self.components))
         self.wait_window(dlg)
+        self.end_preview()
         if dlg.res:
             comp = {"type": "TL", **dlg.res}
             self.components.append(comp)
-            self.comp_listbox.insert(tk.END, f"TL {comp['disp']} Z0={comp['z0']}")
-            self.update_point()
-            self.draw_circuit()
+            self.comp_listbox.insert(tk.END, component_label(comp))
+            self.invalidate_chain("schematic")
 
     def add_stub(self):
         dlg = ComponentDialog(self, "STUB", index=len(self.components))
         self.wait_window(dlg)
+        self.end_preview()
         if dlg.res:
             comp = {"type": "STUB", **dlg.res}
             self.components.append(comp)
-            self.comp_listbox.insert(tk.END, f"Stub {comp['kind']} {comp['disp']} Z0={comp['z0']}")
-            self.update_point()
-            self.draw_circuit()
+            self.comp_listbox.insert(tk.END, component_label(comp))
+            self.invalidate_chain("schematic")
 
     def add_component(self):
         kind = self.comp_type.get()
@@ -265,8 +526,7 @@ class SmithChartApp(tk.Tk):
         if self.components:
             self.components.pop()
             self.comp_listbox.delete(tk.END)
-            self.update_point()
-            self.draw_circuit()
+            self.invalidate_chain("schematic")
 
     def reset_app(self):
         self.components.clear()
@@ -274,6 +534,7 @@ class SmithChartApp(tk.Tk):
         self.freq = 1e9
         self.z0 = 50.0
         self.za = 50+0j
+        self.za_data = None
         self.trace_steps = TRACE_STEPS
         self.freq_entry.delete(0, tk.END)
         self.freq_entry.insert(0, str(self.freq / 1e6))
@@ -281,13 +542,39 @@ class SmithChartApp(tk.Tk):
         self.z0_entry.insert(0, str(self.z0))
         self.steps_entry.delete(0, tk.END)
         self.steps_entry.insert(0, str(self.trace_steps))
+        self.trace_tol = TRACE_TOL
+        self.tol_entry.delete(0, tk.END)
+        self.tol_entry.insert(0, str(self.trace_tol))
+        self.analytic_arcs.set(True)
+        self.pinned = None
+        self.set_loads(None)
+        self.overlay_kind.set("")
         self.za_mode.set("Z")
         self.update_za_label()
         self.za_entry.delete(0, tk.END)
         self.za_entry.insert(0, "50+0j")
-        self.draw_chart()
-        self.update_point()
-        self.draw_circuit()
+        self.sweep_on.set(False)
+        self.sweep_freqs = None
+        self.sweep_start_entry.delete(0, tk.END)
+        self.sweep_start_entry.insert(0, str(SWEEP_START / 1e6))
+        self.sweep_stop_entry.delete(0, tk.END)
+        self.sweep_stop_entry.insert(0, str(SWEEP_STOP / 1e6))
+        self.sweep_points_entry.delete(0, tk.END)
+        self.sweep_points_entry.insert(0, str(SWEEP_POINTS))
+        self.sweep_scale.set("linear")
+        self.mc_on.set(False)
+        self.mc_samples_entry.delete(0, tk.END)
+        self.mc_samples_entry.insert(0, str(MC_SAMPLES))
+        self.mc_vswr_entry.delete(0, tk.END)
+        self.mc_vswr_entry.insert(0, str(MC_VSWR))
+        self.preview = None
+        self.jobs.cancel()
+        self.busy.clear()
+        self.invalidate_chain("schematic")
+
+    def destroy(self):
+        self.jobs.shutdown()
+        super().destroy()
 
     def update_za_label(self):
         self.za_label.config(text="Z_A" if self.za_mode.get() == "Z" else "Y_A")
@@ -297,21 +584,122 @@ class SmithChartApp(tk.Tk):
             self.freq = float(self.freq_entry.get()) * 1e6
             self.z0 = float(self.z0_entry.get())
             self.trace_steps = int(self.steps_entry.get())
-            if self.trace_steps < 1:
+            self.trace_tol = float(self.tol_entry.get())
+            if self.trace_steps < 1 or self.trace_tol < 0:
                 raise ValueError
-            if self.za_mode.get() == "Z":
+            if self.za_data is not None and self.za_entry.get() == self.za_data_name:
+                self.za = complex(self.za_data.impedance_at(self.freq))
+            elif self.za_mode.get() == "Z":
                 self.za = parse_complex_impedance(self.za_entry.get())
+                self.za_data = None
             else:
                 ya = parse_complex_impedance(self.za_entry.get())
                 if ya == 0:
                     raise ValueError
                 self.za = 1 / ya
+                self.za_data = None
         except ValueError:
-            messagebox.showerror("Error", "Invalid frequency, Z0, steps or Z_A/Y_A")
+            messagebox.showerror("Error", "Invalid frequency, Z0, steps, tolerance or Z_A/Y_A")
             return
-        self.draw_chart()
-        self.update_point()
-        self.draw_circuit()
+        self.invalidate_chain("schematic")
+
+    def load_za_file(self):
+        path = filedialog.askopenfilename(
+            title="Load Z_A",
+            filetypes=[("Touchstone", "*.s1p *.s2p"), ("All files", "*")],
+        )
+        if not path:
+            return
+        try:
+            data = read_touchstone(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not read {path}: {e}")
+            return
+        self.za_data = data
+        self.za_data_name = os.path.basename(path)
+        self.za_mode.set("Z")
+        self.update_za_label()
+        self.za_entry.delete(0, tk.END)
+        self.za_entry.insert(0, self.za_data_name)
+        self.za = complex(data.impedance_at(self.freq))
+        self.invalidate_chain("schematic")
+
+    def import_netlist_file(self):
+        """Replace the chain with the components of a ladder or SPICE netlist."""
+        path = filedialog.askopenfilename(
+            title="Import netlist",
+            filetypes=[("Netlists", "*.cir *.sp *.spi *.spice *.net *.ckt *.txt *.lad"),
+                       ("All files", "*")],
+        )
+        if not path:
+            return
+        try:
+            components = read_netlist(path, z0=self.z0, ref_freq=self.freq)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not import {path}: {e}")
+            return
+        self.load_components(components)
+
+    def export_response_file(self):
+        """Write the input response over the Sweep band to a file."""
+        try:
+            start = float(self.sweep_start_entry.get()) * 1e6
+            stop = float(self.sweep_stop_entry.get()) * 1e6
+            points = int(self.sweep_points_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Invalid sweep start, stop or points")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export response",
+            defaultextension=".s1p",
+            filetypes=[("Touchstone", "*.s1p"), ("NumPy", "*.npy"), ("NumPy archive", "*.npz")],
+        )
+        if not path:
+            return
+        za = self.za_data.impedance_at if self.za_data is not None else self.za
+        try:
+            export_response(path, self.components, za, self.z0, start, stop, points,
+                            self.sweep_scale.get(), ref_freq=self.freq)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not export {path}: {e}")
+
+    def apply_sweep(self):
+        if self.sweep_on.get():
+            try:
+                self.sweep_range = (
+                    float(self.sweep_start_entry.get()) * 1e6,
+                    float(self.sweep_stop_entry.get()) * 1e6,
+                    self.sweep_scale.get(),
+                )
+                start, stop, scale = self.sweep_range
+                self.sweep_freqs = sweep_frequencies(
+                    start, stop, int(self.sweep_points_entry.get()), scale)
+            except ValueError:
+                messagebox.showerror("Error", "Invalid sweep start, stop or points")
+                return
+        else:
+            self.sweep_freqs = None
+        self.sweep_stale = True
+        self.scheduler.invalidate("sweep", "hover", "status")
+
+    def apply_montecarlo(self, reseed=False):
+        try:
+            samples = int(self.mc_samples_entry.get())
+            vswr = float(self.mc_vswr_entry.get())
+            if samples < 1 or vswr < 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Invalid Monte Carlo samples or VSWR")
+            return
+        self.mc_samples = samples
+        self.mc_vswr = vswr
+        if reseed:
+            self.mc_on.set(True)
+            self.mc_seed += 1
+        self.mc_stale = True
+        # the load list yield uses the same VSWR limit
+        self.loads_stale = True
+        self.scheduler.invalidate("montecarlo", "loads", "hover", "status")
 
     def edit_component(self, event):
         sel = self.comp_listbox.curselection()
@@ -321,115 +709,544 @@ class SmithChartApp(tk.Tk):
         comp = self.components[idx]
         dlg = ComponentDialog(self, comp["type"], comp, index=idx)
         self.wait_window(dlg)
+        self.end_preview()
         if dlg.res:
             for k, v in dlg.res.items():
                 comp[k] = v
-            # update listbox text
-            if comp["type"] in ("L", "C", "R"):
-                text = f"{comp['type']} {comp['orient']} = {comp['disp']}"
-            elif comp["type"] == "TL":
-                text = f"TL {comp['disp']} Z0={comp['z0']}"
-            else:
-                text = f"Stub {comp['kind']} {comp['disp']} Z0={comp['z0']}"
             self.comp_listbox.delete(idx)
-            self.comp_listbox.insert(idx, text)
-            self.update_point()
-            self.draw_circuit()
+            self.comp_listbox.insert(idx, component_label(comp))
+            self.invalidate_chain("schematic")
+
+    def invalidate_chain(self, *layers):
+        """Recompute the traces on the next frame and redraw ``layers`` too."""
+        self.chain_stale = True
+        self.sweep_stale = True
+        self.mc_stale = True
+        self.loads_stale = True
+        self.scheduler.invalidate("traces", "overlay", "sweep", "montecarlo", "loads", "marker",
+                                  "hover", "status", *layers)
+
+    def open_synthesis(self):
+        SynthesisDialog(self)
+
+    def load_components(self, components):
+        """Replace the whole chain, e.g. with a synthesized or imported network.
+
+        The list box is filled in one call and the chart is recomputed once,
+        on the next frame.
+        """
+        self.preview = None
+        self.components = [dict(c) for c in components]
+        self.comp_listbox.delete(0, tk.END)
+        if self.components:
+            self.comp_listbox.insert(tk.END, *map(component_label, self.components))
+        self.invalidate_chain("schematic")
 
     def preview_update(self, temp_comp, index):
+        # only the latest slider value is kept; intermediate ones are skipped
+        self.preview = (temp_comp, index)
+        self.invalidate_chain()
+
+    def end_preview(self):
+        if self.preview is not None:
+            self.preview = None
+            self.invalidate_chain()
+
+    def chain_components(self):
+        """Return the component list with the slider preview applied."""
+        if self.preview is None:
+            return self.components
+        temp_comp, index = self.preview
         comps = self.components[:]
         if index is None or index >= len(comps):
             comps.append(temp_comp)
         else:
             comps[index] = temp_comp
-        self.update_point(comps)
+        return comps
 
     def compute_trace(self, Z_start, comp, steps=None):
-        """Return a list of impedances along the path for component."""
+        """Return an array of impedances along the path for component."""
         steps = steps or self.trace_steps
-        res = []
-        w = PI2 * self.freq
-        typ = comp.get("type")
-        for i in range(1, steps + 1):
-            t = i / steps
-            if typ == "L":
-                L = comp["value"]
-                if comp.get("orient") == "series":
-                    Z = Z_start + 1j * w * L * t
-                else:
-                    Y = 1 / Z_start + (-1j / (w * L)) * t
-                    Z = 1 / Y
-            elif typ == "C":
-                C = comp["value"]
-                if comp.get("orient") == "series":
-                    Z = Z_start + (-1j / (w * C)) * t
-                else:
-                    Y = 1 / Z_start + 1j * w * C * t
-                    Z = 1 / Y
-            elif typ == "R":
-                R = comp["value"]
-                if comp.get("orient") == "series":
-                    Z = Z_start + R * t
-                else:
-                    Y = 1 / Z_start + (1 / R) * t
-                    Z = 1 / Y
-            elif typ == "TL":
-                beta_l = math.radians(comp["length"]) * t
-                Z0 = comp.get("z0", self.z0)
-                Z = Z0 * (Z_start + 1j * Z0 * math.tan(beta_l)) / (
-                    Z0 + 1j * Z_start * math.tan(beta_l)
-                )
-            elif typ == "STUB":
-                beta_l = math.radians(comp["length"]) * t
-                Z0 = comp.get("z0", self.z0)
-                if comp["kind"] == "short":
-                    Zin = 1j * Z0 * math.tan(beta_l)
-                else:
-                    Zin = -1j * Z0 / math.tan(beta_l)
-                Y = 1 / Z_start + 1 / Zin
-                Z = 1 / Y
+        return component_trace(Z_start, comp, self.freq, self.z0, steps, self.gamma_tol())
+
+    def gamma_tol(self):
+        """Return the adaptive sampling tolerance in Γ units, 0 if disabled."""
+        if self.trace_tol <= 0:
+            return 0.0
+        return self.trace_tol / max(self.radius, self.radius_y, 1)
+
+    def draw_traces(self, canvas, gamma, bounds, center, radius):
+        """Draw one polyline per ``(start, stop)`` slice of ``gamma``.
+
+        Existing trace items are moved with ``coords`` and only missing
+        ones are created.  A negative ``radius`` mirrors the points, which
+        is how the admittance chart reuses the impedance reflection
+        coefficients.  Only the vertices the canvas can resolve are drawn
+        (see :func:`smithpy.decimate.decimate`).  Returns the canvas
+        position of the last point.
+        """
+        xy = canvas_points(gamma, center, radius)
+        last = xy[-1]
+        with PROFILER.span("decimate"):
+            kept = decimate(xy, breaks=[i for ab in bounds for i in (ab[0], ab[1] - 1)])
+            PROFILER.count("points decimated", xy.shape[0] - kept.size)
+            xy = xy[kept]
+            bounds = decimate_bounds(kept, bounds)
+        items = self.trace_items[canvas]
+        for i, (a, b) in enumerate(bounds):
+            coords = xy[a:b].ravel().tolist()
+            if i < len(items):
+                canvas.coords(items[i], coords)
             else:
-                Z = Z_start
-            res.append(Z)
-        return res
+                items.append(canvas.create_line(coords, fill="blue", tags="trace"))
+        for item in items[len(bounds):]:
+            canvas.delete(item)
+        del items[len(bounds):]
+        return last
 
-    def update_point(self, components=None):
-        comps = components if components is not None else self.components
-        Z = self.za
-        pts_z = []
-        pts_y = []
-        cx, cy = self.center
-        cyx, cyy = self.center_y
-        r = self.radius
-        ry = self.radius_y
-        gamma = (Z - self.z0) / (Z + self.z0)
-        pts_z.append((cx + gamma.real * r, cy - gamma.imag * r))
-        Y = 1 / Z if Z != 0 else complex('inf')
-        gamma_y = (Y - 1/self.z0) / (Y + 1/self.z0) if Y != complex('inf') else complex(1)
-        pts_y.append((cyx + gamma_y.real * ry, cyy - gamma_y.imag * ry))
-        for comp in comps:
-            trace = self.compute_trace(Z, comp)
-            for Zt in trace:
-                gamma = (Zt - self.z0) / (Zt + self.z0)
-                pts_z.append((cx + gamma.real * r, cy - gamma.imag * r))
-                Yt = 1 / Zt if Zt != 0 else complex('inf')
-                gamma_y = (Yt - 1/self.z0) / (Yt + 1/self.z0) if Yt != complex('inf') else complex(1)
-                pts_y.append((cyx + gamma_y.real * ry, cyy - gamma_y.imag * ry))
-            Z = trace[-1]
-
-        self.canvas.delete("trace")
-        self.adm_canvas.delete("trace")
-        for i in range(len(pts_z)-1):
-            self.canvas.create_line(*pts_z[i], *pts_z[i+1], fill="blue", tags="trace", smooth=True)
-        for i in range(len(pts_y)-1):
-            self.adm_canvas.create_line(*pts_y[i], *pts_y[i+1], fill="blue", tags="trace", smooth=True)
-
-        x, y = pts_z[-1]
+    def draw_arcs(self, canvas, paths, center, radius):
+        """Draw one arc, circle or polyline item per path, reusing items."""
+        items = self.arc_items[canvas]
+        for i, path in enumerate(paths):
+            kind, coords, opts = path_shape(path, center, radius)
+            if i < len(items) and items[i][0] == kind:
+                canvas.coords(items[i][1], coords)
+                if opts:
+                    canvas.itemconfigure(items[i][1], **opts)
+                continue
+            if kind == "arc":
+                item = canvas.create_arc(coords, style="arc", outline="blue", tags="trace", **opts)
+            elif kind == "oval":
+                item = canvas.create_oval(coords, outline="blue", tags="trace")
+            else:
+                item = canvas.create_line(coords, fill="blue", tags="trace")
+            if i < len(items):
+                canvas.delete(items[i][1])
+                items[i] = (kind, item)
+            else:
+                items.append((kind, item))
+        for _, item in items[len(paths):]:
+            canvas.delete(item)
+        del items[len(paths):]
+
+    def run_job(self, name, func, args, store, cost, layers):
+        """Run ``func(token, *args)`` and pass the result to ``store``.
+
+        Cheap work (``cost`` below ``BACKGROUND_POINTS``) runs right away so
+        slider drags stay immediate; anything else becomes background job
+        ``name``, superseding the previous one, and ``layers`` are redrawn
+        once its result arrives.
+        """
+        if cost < BACKGROUND_POINTS:
+            self.jobs.cancel(name)
+            self.busy.pop(name, None)
+            store(func(CancelToken(), *args))
+            return
+
+        def done(result):
+            self.busy.pop(name, None)
+            store(result)
+            self.scheduler.invalidate(*layers, "hover", "status")
+
+        def failed(exc):
+            self.busy.pop(name, None)
+            self.scheduler.invalidate("status")
+            messagebox.showerror("Error", f"{name} failed: {exc}")
+
+        def progress(fraction):
+            self.busy[name] = fraction
+            self.scheduler.invalidate("status")
+
+        self.busy[name] = 0.0
+        self.jobs.submit(name, func, *args, callback=done, error=failed, progress=progress)
+
+    def render_traces(self):
+        if self.chain_stale:
+            self.chain_stale = False
+            inputs = self.chain_inputs()
+            comps, steps, analytic = inputs[0], inputs[4], inputs[6]
+            cost = len(comps) * (1 if analytic else steps)
+            self.run_job("chain", self.compute_chain, inputs, self.store_chain, cost,
+                         ("traces", "marker"))
+        self.redraw_traces()
+
+    def redraw_traces(self):
+        """Project the last computed traces onto both charts."""
+        gamma, bounds, arcs = self.trace_gamma, self.trace_bounds, self.trace_arcs
+        for canvas, center, radius in ((self.canvas, self.center, self.radius),
+                                       (self.adm_canvas, self.center_y, -self.radius_y)):
+            if arcs is not None:
+                self.draw_traces(canvas, gamma, [], center, radius)
+                self.draw_arcs(canvas, arcs, center, radius)
+            else:
+                self.draw_arcs(canvas, [], center, radius)
+                self.draw_traces(canvas, gamma, bounds, center, radius)
+
+    def render_sweep(self):
+        """Evaluate the chain over the sweep band and draw its locus."""
+        if self.sweep_freqs is None:
+            self.sweep_f = self.sweep_z = self.sweep_metrics = None
+            self.canvas.delete("sweep")
+            self.adm_canvas.delete("sweep")
+            return
+        if self.sweep_stale:
+            self.sweep_stale = False
+            comps = [dict(c) for c in self.chain_components()]
+            za = self.za_data.impedance_at if self.za_data is not None else self.za
+            args = (comps, za, self.z0, self.sweep_freqs, self.sweep_range,
+                    self.gamma_tol(), self.freq)
+            self.run_job("sweep", self.compute_sweep, args, self.store_sweep,
+                         self.sweep_freqs.size * max(len(comps), 1), ("sweep",))
+        if self.sweep_metrics is None:
+            return
+        gamma = self.sweep_metrics["gamma"]
+        for canvas, center, r in ((self.canvas, self.center, self.radius),
+                                  (self.adm_canvas, self.center_y, -self.radius_y)):
+            xy = canvas_points(gamma, center, r)
+            coords = xy[decimate(xy)].ravel().tolist()
+            if len(coords) < 4:
+                coords *= 2
+            items = canvas.find_withtag("sweep")
+            if items:
+                canvas.coords(items[0], coords)
+            else:
+                canvas.create_line(coords, fill="green", tags="sweep")
+
+    def compute_sweep(self, token, comps, za, z0, freqs, band, tol, ref_freq):
+        """Return ``(freqs, z)`` of the sweep; runs in a job, so no Tk access."""
+        # line lengths are set at the centre frequency from Settings
+        if tol > 0:
+            start, stop, scale = band
+            return adaptive_response(comps, za, z0, start, stop, tol, scale, ref_freq=ref_freq)
+        z = np.empty(freqs.size, dtype=complex)
+        for first in range(0, freqs.size, SWEEP_CHUNK):
+            f = freqs[first:first + SWEEP_CHUNK]
+            z[first:first + f.size] = chain_response(comps, za(f) if callable(za) else za,
+                                                     z0, f, ref_freq=ref_freq)
+            token.progress((first + f.size) / freqs.size)
+        return freqs, z
+
+    def store_sweep(self, result):
+        self.sweep_f, self.sweep_z = result
+        self.sweep_metrics = match_metrics(self.sweep_z, self.z0)
+        self.scheduler.invalidate("status")
+
+    def compute_montecarlo(self, token, comps, za, z0, freq, samples, seed, vswr):
+        """Return the Monte Carlo end points and yield; runs in a job."""
+        z = monte_carlo(comps, za, z0, freq, samples, seed=seed, progress=token.progress)
+        return z, tolerance_yield(z, z0, vswr=vswr)
+
+    def store_montecarlo(self, result):
+        self.mc_z, self.mc_yield = result
+        self.scheduler.invalidate("status")
+
+    def render_montecarlo(self):
+        """Evaluate the perturbed chains and draw the cloud of end points."""
+        if not self.mc_on.get():
+            self.mc_z = self.mc_yield = None
+            for canvas in self.cloud_items["montecarlo"]:
+                self.draw_cloud(canvas, np.empty(0, dtype=complex), (0, 0), 0)
+            return
+        if self.mc_stale:
+            self.mc_stale = False
+            comps = [dict(c) for c in self.chain_components()]
+            # the same seed keeps the cloud steady while the chain is edited
+            args = (comps, self.za, self.z0, self.freq, self.mc_samples, self.mc_seed, self.mc_vswr)
+            self.run_job("montecarlo", self.compute_montecarlo, args, self.store_montecarlo,
+                         self.mc_samples * max(len(comps), 1), ("montecarlo",))
+        if self.mc_z is None:
+            return
+        gamma = to_gamma(self.mc_z, self.z0)
+        self.draw_cloud(self.canvas, gamma, self.center, self.radius)
+        self.draw_cloud(self.adm_canvas, gamma, self.center_y, -self.radius_y)
+
+    def set_loads(self, loads, name=""):
+        """Terminate the chain with every impedance in ``loads`` (``None`` clears)."""
+        if loads is not None and not len(loads):
+            loads = None
+        self.loads = loads
+        self.loads_name = name if loads is not None else ""
+        self.loads_z = self.loads_gamma = self.loads_stats = None
+        self.loads_stale = True
+        self.scheduler.invalidate("loads", "hover", "status")
+
+    def load_loads_file(self):
+        path = filedialog.askopenfilename(
+            title="Load Z_A list",
+            filetypes=[("Load lists", "*.csv *.txt *.dat"), ("All files", "*")],
+        )
+        if not path:
+            return
+        try:
+            loads = read_loads(path, admittance=self.za_mode.get() == "Y")
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not read {path}: {e}")
+            return
+        self.set_loads(loads, os.path.basename(path))
+
+    def compute_loads(self, token, comps, loads, z0, freq, vswr):
+        """Return the matched loads, both clouds in Γ and their statistics."""
+        z = load_response(comps, loads, z0, freq)
+        gamma = (to_gamma(loads, z0), to_gamma(z, z0))
+        return z, gamma, load_statistics(z, z0, vswr)
+
+    def store_loads(self, result):
+        self.loads_z, self.loads_gamma, self.loads_stats = result
+        self.scheduler.invalidate("status")
+
+    def render_loads(self):
+        """Draw the load list and the impedances the chain turns it into."""
+        if self.loads is None:
+            for name in ("loads", "load_inputs"):
+                for canvas in self.cloud_items[name]:
+                    self.draw_cloud(canvas, np.empty(0, dtype=complex), (0, 0), 0, name)
+            return
+        if self.loads_stale:
+            self.loads_stale = False
+            comps = [dict(c) for c in self.chain_components()]
+            args = (comps, self.loads, self.z0, self.freq, self.mc_vswr)
+            # the chain matrix is built once, so the cost is one step per load
+            self.run_job("loads", self.compute_loads, args, self.store_loads,
+                         self.loads.size, ("loads",))
+        if self.loads_gamma is None:
+            return
+        for name, gamma in zip(("loads", "load_inputs"), self.loads_gamma):
+            self.draw_cloud(self.canvas, gamma, self.center, self.radius, name)
+            self.draw_cloud(self.adm_canvas, gamma, self.center_y, -self.radius_y, name)
+
+    def draw_cloud(self, canvas, gamma, center, radius, name="montecarlo"):
+        """Draw one dot per canvas pixel hit by ``gamma`` as cloud ``name``.
+
+        Many samples land on the same pixel, so only the distinct pixels are
+        drawn; items are reused like in :meth:`draw_traces`.
+        """
+        cx, cy = center
+        px = np.empty((gamma.size, 2), dtype=np.int64)
+        px[:, 0] = np.rint(cx + gamma.real * radius)
+        px[:, 1] = np.rint(cy - gamma.imag * radius)
+        px = np.unique(px, axis=0)
+        items = self.cloud_items[name][canvas]
+        for i, (x, y) in enumerate(px.tolist()):
+            if i < len(items):
+                canvas.coords(items[i], x, y, x + 1, y + 1)
+            else:
+                items.append(canvas.create_rectangle(x, y, x + 1, y + 1, outline=CLOUD_COLORS[name], tags=name))
+        for item in items[len(px):]:
+            canvas.delete(item)
+        del items[len(px):]
+
+    def draw_markers(self):
+        g = self.trace_gamma[-1]
+        x = self.center[0] + g.real * self.radius
+        y = self.center[1] - g.imag * self.radius
         self.canvas.coords(self.point, x-5, y-5, x+5, y+5)
-        x, y = pts_y[-1]
+        self.canvas.tag_raise(self.point)
+        x = self.center_y[0] - g.real * self.radius_y
+        y = self.center_y[1] + g.imag * self.radius_y
         self.adm_canvas.coords(self.adm_point, x-5, y-5, x+5, y+5)
+        self.adm_canvas.tag_raise(self.adm_point)
+
+    def canvas_gamma(self, canvas, x, y):
+        """Return the reflection coefficient at pixel ``(x, y)`` of ``canvas``.
+
+        On the admittance chart this is still the Γ of the impedance, i.e.
+        the point mirrored through the centre.
+        """
+        if canvas is self.canvas:
+            (cx, cy), r = self.center, self.radius
+        else:
+            (cx, cy), r = self.center_y, -self.radius_y
+        return complex(x - cx, cy - y) / r
+
+    def on_canvas_motion(self, event):
+        # only the latest position is drawn, at most once per frame
+        self.hover = (event.widget, event.x, event.y)
+        self.scheduler.invalidate("hover")
+
+    def on_canvas_leave(self, event):
+        self.hover = None
+        self.scheduler.invalidate("hover")
+
+    def on_canvas_click(self, event):
+        g = self.canvas_gamma(event.widget, event.x, event.y)
+        snap = self.snap_point(g)
+        self.pinned = snap[2] if snap else g
+        self.scheduler.invalidate("hover")
+
+    def on_canvas_unpin(self, event):
+        self.pinned = None
+        self.scheduler.invalidate("hover")
+
+    def sync_point_index(self):
+        """Re-index the plotted points whose data changed since the last call."""
+        index = self.point_index
+        index.update("trace", self.trace_gamma, self.trace_gamma)
+        if self.sweep_metrics is None:
+            index.remove("sweep")
+        else:
+            index.update("sweep", self.sweep_metrics["gamma"], self.sweep_metrics)
+        if self.mc_z is None:
+            index.remove("montecarlo")
+        elif index.source("montecarlo") is not self.mc_z:
+            self.mc_gamma = to_gamma(self.mc_z, self.z0)
+            index.update("montecarlo", self.mc_gamma, self.mc_z)
+        for name, gamma in zip(("loads", "load_inputs"), self.loads_gamma or (None, None)):
+            if gamma is None:
+                index.remove(name)
+            else:
+                index.update(name, gamma, gamma)
+
+    def snap_point(self, g):
+        """Return ``(layer, index, gamma)`` of the plotted point nearest ``g``.
+
+        Only points within :data:`SNAP_PIXELS` are considered; returns
+        ``None`` if there is none.
+        """
+        found = self.point_index.nearest(g, SNAP_PIXELS / max(self.radius, 1))
+        if found is None:
+            return None
+        name, i, _ = found
+        if name == "trace":
+            point = self.trace_gamma[i]
+        elif name == "sweep":
+            point = self.sweep_metrics["gamma"][i]
+        elif name == "montecarlo":
+            point = self.mc_gamma[i]
+        else:
+            point = self.loads_gamma[name == "load_inputs"][i]
+        return name, i, complex(point)
+
+    def describe_point(self, name, i):
+        """Return where plotted point ``i`` of layer ``name`` comes from."""
+        if name == "sweep":
+            return f"sweep at {self.sweep_f[i] / 1e6:.3f} MHz"
+        if name == "montecarlo":
+            return f"Monte Carlo sample {i + 1}"
+        if name == "loads":
+            return f"load {i + 1}"
+        if name == "load_inputs":
+            return f"load {i + 1} through the chain"
+        if i == 0:
+            return "load"
+        # trace slices overlap by one point: the start of each component
+        ends = [b - 1 for _, b in self.trace_bounds]
+        c = min(int(np.searchsorted(ends, i)), len(ends) - 1)
+        comps = self.chain_components()
+        text = f"component {c + 1}"
+        if c < len(comps):
+            text += f" ({component_label(comps[c])})"
+        start, stop = self.trace_bounds[c]
+        # the fraction of the component is only known for evenly spaced points
+        if self.analytic_arcs.get() or self.gamma_tol() <= 0:
+            t = (i - start) / (stop - 1 - start)
+            comp = comps[c] if c < len(comps) else {}
+            if "length" in comp:
+                text += f" at {comp['length'] * t:.1f}\u00b0"
+            else:
+                text += f" at {t * 100:.0f} %"
+        return text
+
+    def point_readout(self, g):
+        """Return the Z, Y and Γ text of reflection coefficient ``g``."""
+        if g == 1:
+            parts = ["Z = \u221E \u03a9"]
+        else:
+            Z = self.z0 * (1 + g) / (1 - g)
+            parts = [f"Z = {Z.real:.2f} {Z.imag:+.2f}j \u03a9"]
+            if Z != 0:
+                Y = 1 / Z
+                parts.append(f"Y = {Y.real:.4f} {Y.imag:+.4f}j S")
+        angle = math.degrees(math.atan2(g.imag, g.real))
+        parts.append(f"\u0393 = {abs(g):.3f} \u2220 {angle:.1f}\u00b0")
+        return ", ".join(parts)
+
+    def move_readout_marker(self, which, g):
+        """Show marker ``which`` (0 hover, 1 pinned) at ``g``, or hide it for ``None``."""
+        for canvas, items in self.readout_items.items():
+            item = items[which]
+            if g is None:
+                canvas.itemconfigure(item, state="hidden")
+                continue
+            if canvas is self.canvas:
+                x = self.center[0] + g.real * self.radius
+                y = self.center[1] - g.imag * self.radius
+            else:
+                x = self.center_y[0] - g.real * self.radius_y
+                y = self.center_y[1] + g.imag * self.radius_y
+            canvas.coords(item, x - 6, y - 6, x + 6, y + 6)
+            canvas.itemconfigure(item, state="normal")
+            canvas.tag_raise(item)
+
+    def draw_hover(self):
+        """Show the readout of the mouse position and of the pinned point."""
+        if self.hover is None and self.pinned is None:
+            self.hover_var.set("")
+            self.move_readout_marker(0, None)
+            self.move_readout_marker(1, None)
+            return
+        with PROFILER.span("point index"):
+            self.sync_point_index()
+        lines = []
+        marker = None
+        if self.hover is not None:
+            g = self.canvas_gamma(*self.hover)
+            line = "Cursor: " + self.point_readout(g)
+            snap = self.snap_point(g)
+            if snap is not None:
+                name, i, marker = snap
+                line += f" | {self.describe_point(name, i)}: {self.point_readout(marker)}"
+            lines.append(line)
+        self.move_readout_marker(0, marker)
+        marker = None
+        if self.pinned is not None:
+            snap = self.snap_point(self.pinned)
+            if snap is None:
+                marker = self.pinned
+                lines.append("Pinned: " + self.point_readout(marker))
+            else:
+                name, i, marker = snap
+                lines.append(f"Pinned {self.describe_point(name, i)}: "
+                             + self.point_readout(marker))
+        self.move_readout_marker(1, marker)
+        self.hover_var.set("\n".join(lines))
+
+    def update_point(self, components=None):
+        """Recompute the traces of ``components`` (default: current chain) now."""
+        self.jobs.cancel("chain")
+        self.store_chain(self.compute_chain(CancelToken(), *self.chain_inputs(components)))
+        self.chain_stale = False
+
+    def chain_inputs(self, components=None):
+        """Return a snapshot of the arguments of :meth:`compute_chain`."""
+        comps = components if components is not None else self.chain_components()
+        return ([dict(c) for c in comps], self.za, self.z0, self.freq,
+                self.trace_steps, self.gamma_tol(), self.analytic_arcs.get())
+
+    def compute_chain(self, token, comps, za, z0, freq, steps, tol, analytic):
+        """Return ``(gamma, bounds, arcs, final_z)`` of a chain.
+
+        This may run in a background job, so it only touches its arguments
+        and the (locked) chain cache.
+        """
+        # arcs only need the end point of each component
+        with PROFILER.span("chain evaluate"):
+            traces = self.chain_cache.evaluate(comps, za, z0, freq, 1 if analytic else steps,
+                                               0.0 if analytic else tol, token.progress)
+        Z = complex(traces[-1][-1]) if traces else za
+        with PROFILER.span("gamma mapping"):
+            gamma, bounds = trace_polylines(za, traces, z0)
+        arcs = None
+        if analytic:
+            PROFILER.count("arcs computed", len(comps))
+            arcs = trace_arcs(comps, za, traces, freq, z0, steps, tol)
+        return gamma, bounds, arcs, Z
+
+    def store_chain(self, result):
+        self.trace_gamma, self.trace_bounds, self.trace_arcs, self.final_z = result
 
+    def update_status(self):
         # show numeric values for the current point in impedance and admittance form
+        Z = self.final_z
         zn = Z / self.z0
         gamma = (Z - self.z0) / (Z + self.z0)
         Y = 1 / Z if Z != 0 else complex('inf')
@@ -445,8 +1262,62 @@ class SmithChartApp(tk.Tk):
         if yn != complex('inf'):
             text += f"g = {yn.real:.3f}, b = {yn.imag:.3f}\n"
         text += f"\u0393 = {gamma.real:.3f} {gamma.imag:+.3f}j"
+        if self.sweep_metrics is not None:
+            m = self.sweep_metrics
+            text += (
+                f"\nSweep: RL min = {m['return_loss'].min():.2f} dB, "
+                f"VSWR max = {m['vswr'].max():.2f}, "
+                f"ML max = {m['mismatch_loss'].max():.2f} dB"
+            )
+        if self.busy:
+            text += "\nComputing: " + ", ".join(
+                f"{name} {fraction * 100:.0f} %" for name, fraction in self.busy.items())
+        if self.mc_yield is not None:
+            text += (
+                f"\nMonte Carlo: yield = {self.mc_yield * 100:.1f} % "
+                f"(VSWR \u2264 {self.mc_vswr:g}, n = {self.mc_z.size})"
+            )
+        if self.loads_stats is not None:
+            st = self.loads_stats
+            text += (
+                f"\nLoads {self.loads_name}: n = {st['count']}, "
+                f"RL min/median = {st['rl_min']:.2f}/{st['rl_median']:.2f} dB, "
+                f"VSWR max = {st['vswr_max']:.2f}, "
+                f"yield = {st['yield'] * 100:.1f} % (VSWR \u2264 {self.mc_vswr:g})"
+            )
         self.coord_var.set(text)
 
+    def toggle_profile_overlay(self):
+        if self.profile_overlay.get():
+            PROFILER.enable()
+        else:
+            self.canvas.delete("profile")
+            if not self.profile_always:
+                PROFILER.disable()
+        self.scheduler.invalidate()
+
+    def draw_profile_overlay(self):
+        """Show the spans and counters of the last frame and of background jobs."""
+        if not self.profile_overlay.get():
+            return
+        spans, counters, seconds = PROFILER.last_frame
+        lines = [f"frame {seconds * 1e3:.1f} ms, max {PROFILER.fps():.0f} fps"]
+        lines += [f"{name}: {t * 1e3:.2f} ms" for name, t in
+                  sorted(spans.items(), key=lambda kv: -kv[1])]
+        lines += [f"{name}: {value}" for name, value in sorted(counters.items())]
+        if PROFILER.job_spans:
+            lines.append("background jobs (last run)")
+            lines += [f"{name}: {t * 1e3:.2f} ms" for name, t in
+                      sorted(PROFILER.job_spans.items(), key=lambda kv: -kv[1])]
+        text = "\n".join(lines)
+        items = self.canvas.find_withtag("profile")
+        if items:
+            self.canvas.itemconfigure(items[0], text=text)
+            self.canvas.tag_raise(items[0])
+        else:
+            self.canvas.create_text(8, 8, text=text, anchor="nw", font="TkFixedFont",
+                                    fill="darkred", tags="profile")
+
     def draw_circuit(self):
         c = self.circ_canvas
         c.delete("all")
@@ -463,6 +1334,8 @@ class SmithChartApp(tk.Tk):
         # draw components starting at the load and moving toward the source
         x = load_x - 20
         for comp in self.components:
+            if x < 0:
+                break  # the rest of a long chain is off the canvas
             if comp["type"] in ("L", "C", "R", "TL") and comp.get("orient") == "shunt":
                 # draw shunt element below the line
                 c.create_line(x, y, x, y+20)
@@ -489,10 +1362,44 @@ class SmithChartApp(tk.Tk):
                 x -= 40
         c.create_line(src_x+10, y, x, y)
 
-def main():
-    app = SmithChartApp()
-    app.mainloop()
+def run(profile=None):
+    """Open the window and run the Tk main loop until it is closed.
+
+    With ``profile``, a file name, the session runs under cProfile: the
+    data is written to that file and the slowest functions and the timing
+    spans are printed to stderr on exit.  Command line options are parsed
+    by :mod:`smithpy.cli`.
+    """
+    if not profile:
+        app = SmithChartApp()
+        app.mainloop()
+        return
+    PROFILER.enable()
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        app = SmithChartApp()
+        app.mainloop()
+    finally:
+        prof.disable()
+        prof.dump_stats(profile)
+        stats = pstats.Stats(prof, stream=sys.stderr)
+        stats.sort_stats("cumulative").print_stats(PROFILE_TOP)
+        print(PROFILER.summary(), file=sys.stderr)
+
+
+def main() -> int:
+    """Run the GUI with the options of ``smithpy gui`` from ``sys.argv``.
+
+    Kept as the entry point of direct script runs and older launchers;
+    the options are parsed by :mod:`smithpy.cli`.
+    """
+    try:
+        from .cli import main as cli_main
+    except ImportError:  # pragma: no cover - direct execution fallback
+        from cli import main as cli_main
+    return cli_main(["gui", *sys.argv[1:]])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""Closed-form geometry of component traces in the reflection plane.
+
+Every path drawn by a component is part of a circle in the Γ-plane:
+
+* lumped series (shunt) elements move along a straight line in the
+  impedance (admittance) plane, which maps to a circle through Γ = 1
+  (Γ = -1), i.e. a constant r/x (g/b) circle;
+* an ideal line rotates the reflection coefficient referenced to its own
+  impedance, which maps to a circle symmetric about the real axis;
+* a stub adds a susceptance running along a constant-g circle.
+
+So a trace can be drawn as one arc primitive whose cost does not depend on
+the number of trace steps and which is exact at any zoom.  Angles follow
+the Tk convention: degrees, counter-clockwise with Im(Γ) pointing up.
+"""
+from __future__ import annotations
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from .engine import apply_component, to_gamma
+except ImportError:  # pragma: no cover - direct execution fallback
+    from engine import apply_component, to_gamma
+
+# points closer than this (in Γ) are treated as equal
+_EPS = 1e-12
+
+
+class Arc(NamedTuple):
+    """Circular arc in the Γ-plane.
+
+    ``extent`` is negative for clockwise arcs; ``abs(extent) >= 360`` means
+    the path covers the full circle.
+    """
+
+    center: complex
+    radius: float
+    start: float
+    extent: float
+
+    def point(self, angle: float) -> complex:
+        """Return the point of the circle at ``angle`` degrees."""
+        return self.center + self.radius * complex(math.cos(math.radians(angle)),
+                                                   math.sin(math.radians(angle)))
+
+
+class Segment(NamedTuple):
+    """Straight path in the Γ-plane (a circle of infinite radius)."""
+
+    start: complex
+    end: complex
+
+
+def _circle(a: complex, b: complex, c: complex):
+    """Return the centre and radius of the circle through three points."""
+    d = 2 * (a.real * (b.imag - c.imag) + b.real * (c.imag - a.imag)
+             + c.real * (a.imag - b.imag))
+    if abs(d) < _EPS:
+        return None
+    aa, bb, cc = abs(a) ** 2, abs(b) ** 2, abs(c) ** 2
+    x = (aa * (b.imag - c.imag) + bb * (c.imag - a.imag) + cc * (a.imag - b.imag)) / d
+    y = (aa * (c.real - b.real) + bb * (a.real - c.real) + cc * (b.real - a.real)) / d
+    center = complex(x, y)
+    return center, abs(a - center)
+
+
+def _angle(center: complex, p: complex) -> float:
+    return math.degrees(math.atan2(p.imag - center.imag, p.real - center.real))
+
+
+def _clockwise(a0: float, a1: float) -> float:
+    return -((a0 - a1) % 360.0)
+
+
+def _lumped_arc(g0: complex, g1: complex, pole: complex):
+    # the straight path in the z/y plane only reaches infinity (``pole``) for t -> oo
+    if abs(g0 - pole) < _EPS or abs(g1 - pole) < _EPS:
+        return None
+    circle = _circle(g0, g1, pole)
+    if circle is None:
+        return Segment(g0, g1)
+    center, radius = circle
+    a0, a1, ap = _angle(center, g0), _angle(center, g1), _angle(center, pole)
+    ccw = (a1 - a0) % 360.0
+    if (ap - a0) % 360.0 < ccw:
+        return Arc(center, radius, a0, _clockwise(a0, a1))
+    return Arc(center, radius, a0, ccw)
+
+
+def _rotation_arc(center: complex, radius: float, g0: complex, g1: complex,
+                  turn: float) -> Arc | Segment:
+    # ``turn`` is the clockwise rotation in degrees of the underlying parameter
+    if radius < _EPS:
+        return Segment(g0, g1)
+    a0, a1 = _angle(center, g0), _angle(center, g1)
+    if abs(turn) >= 360.0:
+        return Arc(center, radius, a0, math.copysign(360.0, -turn))
+    if turn >= 0:
+        return Arc(center, radius, a0, _clockwise(a0, a1))
+    return Arc(center, radius, a0, (a1 - a0) % 360.0)
+
+
+def component_arc(z_start: complex, comp: dict, freq: float, z0: float = 50.0,
+                  ref_freq: float | None = None):
+    """Return the path of ``comp`` starting at ``z_start`` as a primitive.
+
+    The result is an :class:`Arc`, a :class:`Segment` for paths on a
+    straight line, or ``None`` if the path has no closed form (e.g. it
+    starts at a short or open circuit); such paths have to be sampled with
+    :func:`smithpy.engine.component_trace`.  The end point matches
+    ``apply_component(z_start, comp, freq, z0, 1.0, ref_freq)``.
+    """
+    z_start = complex(z_start)
+    z_end = complex(apply_component(z_start, comp, freq, z0, 1.0, ref_freq))
+    if not (np.isfinite(z_start) and np.isfinite(z_end)):
+        return None
+    g0 = complex(to_gamma(z_start, z0))
+    g1 = complex(to_gamma(z_end, z0))
+    typ = comp.get("type")
+    if typ in ("L", "C", "R"):
+        return _lumped_arc(g0, g1, 1 + 0j if comp.get("orient") == "series" else -1 + 0j)
+    if typ not in ("TL", "STUB"):
+        return None
+    theta = comp["length"]
+    if ref_freq is not None:
+        theta = theta * freq / ref_freq
+    zl = comp.get("z0", z0)
+    if typ == "TL":
+        # rotation of the line-referenced Γ mapped into the system Γ-plane
+        k = (zl - z0) / (zl + z0)
+        rho = abs((z_start - zl) / (z_start + zl))
+        lo, hi = (k - rho) / (1 - k * rho), (k + rho) / (1 + k * rho)
+        return _rotation_arc(complex((lo + hi) / 2), abs(hi - lo) / 2, g0, g1, 2 * theta)
+    # the admittance runs along its constant-g circle, one turn per 180 degrees
+    if abs(g0 + 1) < _EPS:
+        return None
+    circle = _circle(g0, complex(to_gamma(1 / (1 / z_start + 1j / zl), z0)), -1 + 0j)
+    if circle is None:
+        return None
+    # a short stub of zero length is a short circuit, so its path starts at Γ = -1
+    start = -1 + 0j if comp["kind"] == "short" else g0
+    return _rotation_arc(*circle, start, g1, 2 * theta)
+
+
+__all__ = ["Arc", "Segment", "component_arc"]
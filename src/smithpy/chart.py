@@ -0,0 +1,564 @@
+"""Smith chart drawing shared by the GUI and the off-screen renderer.
+
+:func:`draw_grid` and the trace helpers draw onto any object with the item
+API of ``tkinter.Canvas`` (``create_line``, ``create_oval``, ``create_arc``,
+``create_text``), so the window and exported images show the same chart.
+:class:`OffscreenCanvas` records such items without a display and writes
+them as SVG, or as PNG if Pillow is installed.
+
+:func:`render_design` draws what the GUI shows for a design (grid, labels,
+component traces, end marker and optionally a sweep locus) and
+:func:`render_designs` renders many designs in parallel worker processes::
+
+    designs = load_designs(open("designs.jsonl").read())
+    render_designs(designs, "figures", fmt="png")
+"""
+from __future__ import annotations
+
+import io
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from .arcs import Arc, Segment, component_arc
+    from .decimate import decimate, decimate_bounds
+    from .engine import TRACE_STEPS, component_trace, evaluate_chain, to_gamma
+    from .network import chain_response
+except ImportError:  # pragma: no cover - direct execution fallback
+    from arcs import Arc, Segment, component_arc
+    from decimate import decimate, decimate_bounds
+    from engine import TRACE_STEPS, component_trace, evaluate_chain, to_gamma
+    from network import chain_response
+
+CHARTS = ("impedance", "admittance")
+RENDER_FORMATS = ("svg", "png")
+# normalized values of the grid circles, arcs and axis labels
+GRID_VALUES = (0.2, 0.5, 1, 2, 5)
+# arcs with a larger radius in pixels are drawn as short polylines, since
+# X11 canvas coordinates are limited to 16 bits
+ARC_MAX_RADIUS = 20000
+ARC_POLY_POINTS = 16
+# PNG images are drawn this many times larger and scaled down for smooth lines
+PNG_SUPERSAMPLE = 2
+# zlib level of PNG files; the charts are mostly white, so higher levels
+# gain little size for a lot of encoding time
+PNG_COMPRESS_LEVEL = 1
+# TrueType fonts tried for PNG text before Pillow's built-in font, which
+# lacks symbols such as the infinity sign
+PNG_FONTS = ("DejaVuSans.ttf", "Arial.ttf", "LiberationSans-Regular.ttf")
+# Tk font sizes are in points; pixels per point at the usual 96 dpi
+PIXELS_PER_POINT = 96 / 72
+# Tk colour names that SVG and Pillow do not know
+TK_COLORS = {"gray50": "#7f7f7f", "grey50": "#7f7f7f"}
+
+
+def chart_geometry(width: int, height: int):
+    """Return the ``(center, radius)`` of a chart drawn on a canvas of this size."""
+    return (width // 2, height // 2), min(width, height) // 2 - 10
+
+
+def draw_grid(canvas, width: int, height: int, mode: str = "impedance"):
+    """Draw the static grid of one chart as items tagged ``"grid"``.
+
+    Returns the ``(center, radius)`` of the unit circle in pixels.
+    """
+    center, radius = chart_geometry(width, height)
+    cx, cy = center
+    r = radius
+    # dynamic fonts for chart annotations
+    text_font = ("TkDefaultFont", max(8, int(r / 18)))
+    title_font = ("TkDefaultFont", max(10, int(r / 14)))
+    canvas.create_oval(cx - r, cy - r, cx + r, cy + r, tags="grid")
+    canvas.create_line(cx - r, cy, cx + r, cy, fill="lightgray", tags="grid")
+    axis = "z/Z0" if mode == "impedance" else "y/Y0"
+    canvas.create_text(cx + r + 15, cy, text=f"Re({axis})", anchor="w", font=text_font, tags="grid")
+    canvas.create_text(cx - r - 15, cy, text=f"-Re({axis})", anchor="e", font=text_font, tags="grid")
+    canvas.create_text(cx, cy - r - 15, text=f"Im({axis})", anchor="s", font=text_font, tags="grid")
+    canvas.create_text(cx, cy + r + 15, text=f"-Im({axis})", anchor="n", font=text_font, tags="grid")
+    title = "Impedanzebene" if mode == "impedance" else "Admittanzebene"
+    canvas.create_text(cx, 10, text=title, anchor="n", font=title_font, tags="grid")
+
+    # ticks and labels on the real axis
+    for val in (0, *GRID_VALUES):
+        if val == 0:
+            x = cx - r
+        else:
+            x = cx + r * (val - 1) / (val + 1)
+        canvas.create_line(x, cy - 5, x, cy + 5, fill="gray", tags="grid")
+        canvas.create_text(x, cy + 10, text=str(val), fill="gray", font=text_font, anchor="n", tags="grid")
+    canvas.create_line(cx + r, cy - 5, cx + r, cy + 5, fill="gray", tags="grid")
+    canvas.create_text(cx + r, cy + 10, text="∞", fill="gray", font=text_font, anchor="n", tags="grid")
+
+    # ticks and labels on the imaginary axis at the outer radius
+    for val in GRID_VALUES:
+        theta = 2 * math.atan(1 / val)
+        x = cx + r * math.cos(theta)
+        y = cy - r * math.sin(theta)
+        canvas.create_line(x, y, x + 5 * math.cos(theta), y - 5 * math.sin(theta), fill="gray", tags="grid")
+        label = f"+j{val}" if mode == "impedance" else f"+jb{val}"
+        canvas.create_text(x + 10 * math.cos(theta), y - 10 * math.sin(theta), text=label, fill="gray", font=text_font, tags="grid")
+        x = cx + r * math.cos(theta)
+        y = cy + r * math.sin(theta)
+        canvas.create_line(x, y, x + 5 * math.cos(theta), y + 5 * math.sin(theta), fill="gray", tags="grid")
+        label = f"-j{val}" if mode == "impedance" else f"-jb{val}"
+        canvas.create_text(x + 10 * math.cos(theta), y + 10 * math.sin(theta), text=label, fill="gray", font=text_font, tags="grid")
+
+    # constant resistance/conductance circles
+    for val in GRID_VALUES:
+        cr = r / (1 + val)
+        off = r * val / (1 + val)
+        canvas.create_oval(cx + off - cr, cy - cr, cx + off + cr, cy + cr, outline="lightgray", tags="grid")
+        label = f"r={val}" if mode == "impedance" else f"g={val}"
+        canvas.create_text(cx + off + cr + 15, cy, text=label, anchor="w", fill="gray", font=text_font, tags="grid")
+
+    # constant reactance/susceptance arcs
+    for val in GRID_VALUES:
+        cr = r / val
+        canvas.create_arc(cx - cr, cy - cr, cx + cr, cy + cr, start=90, extent=180, style='arc', outline="lightgray", tags="grid")
+        canvas.create_arc(cx - cr, cy - cr, cx + cr, cy + cr, start=-90, extent=180, style='arc', outline="lightgray", tags="grid")
+    canvas.tag_lower("grid")
+    return center, radius
+
+
+def trace_polylines(za: complex, traces, z0: float = 50.0):
+    """Return ``(gamma, bounds)`` of component traces joined into one array.
+
+    Each polyline ``gamma[start:stop]`` starts at the end point of the
+    previous component; ``gamma[0]`` is the load.
+    """
+    gamma = to_gamma(np.concatenate([[za], *traces]), z0)
+    bounds = []
+    start = 0
+    for trace in traces:
+        bounds.append((start, start + trace.size + 1))
+        start += trace.size
+    return gamma, bounds
+
+
+def trace_arcs(components, za: complex, traces, freq: float, z0: float = 50.0,
+               steps: int = TRACE_STEPS, tol: float = 0.0) -> list:
+    """Return the path of every component as an arc, segment or Γ array.
+
+    ``traces`` are the evaluated traces of ``components`` (only their end
+    points are used).  Components without a closed form are sampled.
+    """
+    arcs = []
+    z = za
+    for comp, trace in zip(components, traces):
+        arc = component_arc(z, comp, freq, z0)
+        if arc is None:
+            # no closed form, fall back to sampling this component
+            sampled = component_trace(z, comp, freq, z0, steps, tol)
+            arc = to_gamma(np.concatenate([[z], sampled]), z0)
+        arcs.append(arc)
+        z = complex(trace[-1])
+    return arcs
+
+
+def path_shape(path, center, radius):
+    """Return ``(kind, coords, options)`` of a canvas item drawing ``path``.
+
+    A negative ``radius`` mirrors the path for the admittance chart.
+    """
+    cx, cy = center
+    if isinstance(path, Arc):
+        r = path.radius * abs(radius)
+        if r <= ARC_MAX_RADIUS:
+            x = cx + path.center.real * radius
+            y = cy - path.center.imag * radius
+            bbox = [x - r, y - r, x + r, y + r]
+            if abs(path.extent) >= 360:
+                return "oval", bbox, {}
+            start = path.start + (180 if radius < 0 else 0)
+            return "arc", bbox, {"start": start, "extent": path.extent}
+        angles = path.start + np.linspace(0, path.extent, ARC_POLY_POINTS)
+        path = np.array([path.point(a) for a in angles])
+    elif isinstance(path, Segment):
+        path = np.array([path.start, path.end])
+    xy = np.empty((path.size, 2))
+    xy[:, 0] = cx + path.real * radius
+    xy[:, 1] = cy - path.imag * radius
+    return "line", xy.ravel().tolist(), {}
+
+
+def canvas_points(gamma, center, radius) -> np.ndarray:
+    """Return the ``(n, 2)`` canvas coordinates of reflection coefficients."""
+    cx, cy = center
+    gamma = np.asarray(gamma)
+    xy = np.empty((gamma.size, 2))
+    xy[:, 0] = cx + gamma.real * radius
+    xy[:, 1] = cy - gamma.imag * radius
+    return xy
+
+
+def draw_chain(canvas, gamma, bounds, arcs, center, radius) -> None:
+    """Draw the traces of a chain as new items tagged ``"trace"``."""
+    if arcs is not None:
+        for path in arcs:
+            kind, coords, opts = path_shape(path, center, radius)
+            if kind == "arc":
+                canvas.create_arc(coords, style="arc", outline="blue", tags="trace", **opts)
+            elif kind == "oval":
+                canvas.create_oval(coords, outline="blue", tags="trace")
+            else:
+                canvas.create_line(coords, fill="blue", tags="trace")
+        return
+    xy = canvas_points(gamma, center, radius)
+    kept = decimate(xy, breaks=[i for ab in bounds for i in (ab[0], ab[1] - 1)])
+    xy = xy[kept]
+    for a, b in decimate_bounds(kept, bounds):
+        canvas.create_line(xy[a:b].ravel().tolist(), fill="blue", tags="trace")
+
+
+def draw_marker(canvas, gamma: complex, center, radius) -> None:
+    """Draw the red dot marking the impedance at the end of the chain."""
+    x, y = canvas_points(gamma, center, radius)[0]
+    canvas.create_oval(x - 5, y - 5, x + 5, y + 5, fill="red", tags="marker")
+
+
+def draw_locus(canvas, gamma, center, radius) -> None:
+    """Draw a sweep locus as a green polyline tagged ``"sweep"``."""
+    xy = canvas_points(gamma, center, radius)
+    coords = xy[decimate(xy)].ravel().tolist()
+    if len(coords) < 4:
+        coords *= 2
+    canvas.create_line(coords, fill="green", tags="sweep")
+
+
+def _color(name):
+    if not name:
+        return "none"
+    return TK_COLORS.get(name, name)
+
+
+def _font_px(font, scale: float = 1.0) -> float:
+    size = font[1] if isinstance(font, (tuple, list)) and len(font) > 1 else 10
+    # negative Tk font sizes are in pixels
+    return (-size if size < 0 else size * PIXELS_PER_POINT) * scale
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+# Tk text anchors as (SVG text-anchor, SVG dominant-baseline, x, y fractions
+# of the text box to the left and above the anchor point)
+_ANCHORS = {
+    "center": ("middle", "central", 0.5, 0.5),
+    "n": ("middle", "hanging", 0.5, 0.0),
+    "s": ("middle", "text-after-edge", 0.5, 1.0),
+    "e": ("end", "central", 1.0, 0.5),
+    "w": ("start", "central", 0.0, 0.5),
+    "ne": ("end", "hanging", 1.0, 0.0),
+    "nw": ("start", "hanging", 0.0, 0.0),
+    "se": ("end", "text-after-edge", 1.0, 1.0),
+    "sw": ("start", "text-after-edge", 0.0, 1.0),
+}
+
+
+def _png_font(size: int):
+    from PIL import ImageFont
+
+    for name in PNG_FONTS:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:  # Pillow < 10.1 has one bitmap font size
+        return ImageFont.load_default()
+
+
+class OffscreenCanvas:
+    """Stand-in for ``tkinter.Canvas`` that records items for export.
+
+    Only item creation, ``delete``, ``tag_lower`` and ``find_withtag`` are
+    supported, which is what the chart drawing functions use.  Items keep
+    the Tk defaults: outlines are black and one pixel wide, ovals are not
+    filled.
+    """
+
+    def __init__(self, width: int = 600, height: int = 600, background: str = "white"):
+        self.width = width
+        self.height = height
+        self.background = background
+        # [kind, coords, options, tags]
+        self.items: list[list] = []
+        # (canvas, x, y) of the canvases placed on top of the items
+        self.panels: list[tuple] = []
+
+    def __getitem__(self, key):
+        return {"width": self.width, "height": self.height}[key]
+
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    def _create(self, kind, coords, options):
+        if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+            coords = coords[0]
+        tags = options.pop("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        self.items.append([kind, [float(c) for c in coords], options, tuple(tags)])
+        return len(self.items)
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, options)
+
+    def create_arc(self, *coords, **options):
+        return self._create("arc", coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def find_withtag(self, tag) -> tuple:
+        return tuple(i + 1 for i, item in enumerate(self.items) if tag == "all" or tag in item[3])
+
+    def delete(self, *tags) -> None:
+        self.items = [item for item in self.items
+                      if not any(tag == "all" or tag in item[3] for tag in tags)]
+
+    def tag_lower(self, tag) -> None:
+        """Move the items tagged ``tag`` below all others, keeping their order."""
+        self.items.sort(key=lambda item: tag not in item[3])
+
+    def place(self, other: "OffscreenCanvas", x: int = 0, y: int = 0) -> None:
+        """Show ``other`` with its top left corner at ``(x, y)``.
+
+        Like a separate Tk canvas, its items are clipped to its own size.
+        """
+        self.panels.append((other, x, y))
+
+    def to_svg(self) -> str:
+        """Return the items as an SVG document."""
+        out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" '
+               f'height="{self.height}" viewBox="0 0 {self.width} {self.height}">']
+        self._svg_body(out)
+        out.append("</svg>")
+        return "\n".join(out) + "\n"
+
+    def _svg_body(self, out: list) -> None:
+        out.append(f'<rect width="100%" height="100%" fill="{_color(self.background)}"/>')
+        for kind, c, opts, _ in self.items:
+            width = opts.get("width", 1)
+            if kind == "line":
+                points = " ".join(f"{x:.2f},{y:.2f}" for x, y in zip(c[0::2], c[1::2]))
+                out.append(f'<polyline points="{points}" fill="none" '
+                           f'stroke="{_color(opts.get("fill", "black"))}" stroke-width="{width}" '
+                           'stroke-linejoin="round"/>')
+            elif kind in ("oval", "rectangle", "arc"):
+                x0, y0, x1, y1 = min(c[0], c[2]), min(c[1], c[3]), max(c[0], c[2]), max(c[1], c[3])
+                stroke = f'stroke="{_color(opts.get("outline", "black"))}" stroke-width="{width}"'
+                fill = _color(opts.get("fill", ""))
+                if kind == "rectangle":
+                    out.append(f'<rect x="{x0:.2f}" y="{y0:.2f}" width="{x1 - x0:.2f}" '
+                               f'height="{y1 - y0:.2f}" fill="{fill}" {stroke}/>')
+                    continue
+                rx, ry = (x1 - x0) / 2, (y1 - y0) / 2
+                cx, cy = x0 + rx, y0 + ry
+                extent = opts.get("extent", 90.0) if kind == "arc" else 360.0
+                if abs(extent) >= 360:
+                    out.append(f'<ellipse cx="{cx:.2f}" cy="{cy:.2f}" rx="{rx:.2f}" '
+                               f'ry="{ry:.2f}" fill="{fill}" {stroke}/>')
+                    continue
+                # Tk angles run counter-clockwise with y pointing up
+                a0 = math.radians(opts.get("start", 0.0))
+                a1 = a0 + math.radians(extent)
+                p0 = (cx + rx * math.cos(a0), cy - ry * math.sin(a0))
+                p1 = (cx + rx * math.cos(a1), cy - ry * math.sin(a1))
+                large = int(abs(extent) > 180)
+                sweep = int(extent < 0)
+                out.append(f'<path d="M {p0[0]:.2f} {p0[1]:.2f} A {rx:.2f} {ry:.2f} 0 '
+                           f'{large} {sweep} {p1[0]:.2f} {p1[1]:.2f}" fill="none" {stroke}/>')
+            elif kind == "text":
+                anchor, baseline, _, _ = _ANCHORS[opts.get("anchor", "center")]
+                out.append(f'<text x="{c[0]:.2f}" y="{c[1]:.2f}" text-anchor="{anchor}" '
+                           f'dominant-baseline="{baseline}" font-family="sans-serif" '
+                           f'font-size="{_font_px(opts.get("font")):.1f}" '
+                           f'fill="{_color(opts.get("fill", "black"))}">'
+                           f'{_escape(str(opts.get("text", "")))}</text>')
+        for panel, x, y in self.panels:
+            # nested SVG viewports clip their content
+            out.append(f'<svg x="{x}" y="{y}" width="{panel.width}" height="{panel.height}">')
+            panel._svg_body(out)
+            out.append("</svg>")
+
+    def to_png(self, supersample: int = PNG_SUPERSAMPLE) -> bytes:
+        """Return the items as a PNG image; needs Pillow."""
+        try:
+            import PIL.Image  # noqa: F401
+        except ImportError:
+            raise ImportError("PNG output needs Pillow (pip install pillow)") from None
+        image = self._png_image(supersample, {})
+        if supersample > 1:
+            # box averaging over whole pixels, much faster than a resampling filter
+            image = image.reduce(supersample)
+        buf = io.BytesIO()
+        image.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+        return buf.getvalue()
+
+    def _png_image(self, s: int, fonts: dict):
+        """Return the canvas as a Pillow image ``s`` times the canvas size."""
+        from PIL import Image, ImageDraw
+
+        image = Image.new("RGB", (self.width * s, self.height * s), _color(self.background))
+        draw = ImageDraw.Draw(image)
+        for kind, c, opts, _ in self.items:
+            c = [v * s for v in c]
+            width = max(1, round(opts.get("width", 1) * s))
+            if kind == "line":
+                draw.line(c, fill=_color(opts.get("fill", "black")), width=width, joint="curve")
+            elif kind in ("oval", "rectangle", "arc"):
+                box = [min(c[0], c[2]), min(c[1], c[3]), max(c[0], c[2]), max(c[1], c[3])]
+                outline = _color(opts.get("outline", "black"))
+                fill = opts.get("fill") or None
+                if kind == "rectangle":
+                    draw.rectangle(box, outline=outline, fill=fill and _color(fill), width=width)
+                elif kind == "oval" or abs(opts.get("extent", 90.0)) >= 360:
+                    draw.ellipse(box, outline=outline, fill=fill and _color(fill), width=width)
+                else:
+                    # Pillow draws clockwise from the start angle, y pointing down
+                    start = opts.get("start", 0.0)
+                    end = start + opts.get("extent", 90.0)
+                    draw.arc(box, -max(start, end), -min(start, end), fill=outline, width=width)
+            elif kind == "text":
+                size = max(1, round(_font_px(opts.get("font"), s)))
+                if size not in fonts:
+                    fonts[size] = _png_font(size)
+                text = str(opts.get("text", ""))
+                left, top, right, bottom = draw.textbbox((0, 0), text, font=fonts[size])
+                _, _, fx, fy = _ANCHORS[opts.get("anchor", "center")]
+                x = c[0] - left - fx * (right - left)
+                y = c[1] - top - fy * (bottom - top)
+                draw.text((x, y), text, fill=_color(opts.get("fill", "black")), font=fonts[size])
+        for panel, x, y in self.panels:
+            image.paste(panel._png_image(s, fonts), (x * s, y * s))
+        return image
+
+    def save(self, path) -> None:
+        """Write the canvas to ``path`` as SVG or PNG, following the extension."""
+        ext = os.path.splitext(os.fspath(path))[1].lower().lstrip(".")
+        if ext not in RENDER_FORMATS:
+            raise ValueError(f"unknown image format: {path}")
+        if ext == "png":
+            data = self.to_png()
+            with open(path, "wb") as fh:
+                fh.write(data)
+        else:
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write(self.to_svg())
+
+
+def render_design(design: dict, charts=CHARTS, width: int = 600, height: int = 600,
+                  analytic: bool = True, steps: int = TRACE_STEPS, tol: float = 0.0,
+                  freqs=None) -> OffscreenCanvas:
+    """Draw ``design`` like the GUI does and return the canvas.
+
+    Parameters
+    ----------
+    design:
+        Design as returned by :func:`smithpy.design.parse_design`.
+    charts:
+        ``"impedance"`` and/or ``"admittance"``; several charts are stacked
+        vertically, each ``width`` x ``height`` pixels.
+    analytic, steps, tol:
+        Draw traces as exact arcs, or as polylines of ``steps`` points per
+        component (adaptive with ``tol`` in Γ units if positive).
+    freqs:
+        Optional sweep frequencies whose locus is drawn too; line lengths
+        refer to the design's ``freq``.
+    """
+    if isinstance(charts, str):
+        charts = (charts,)
+    comps, za, z0, freq = design["components"], design["za"], design["z0"], design["freq"]
+    traces = evaluate_chain(comps, za, z0, freq, 1 if analytic else steps, 0.0 if analytic else tol)
+    gamma, bounds = trace_polylines(za, traces, z0)
+    arcs = trace_arcs(comps, za, traces, freq, z0, steps, tol) if analytic else None
+    locus = None
+    if freqs is not None:
+        locus = to_gamma(chain_response(comps, za, z0, freqs, ref_freq=freq), z0)
+    out = OffscreenCanvas(width, height * len(charts))
+    for row, mode in enumerate(charts):
+        if mode not in CHARTS:
+            raise ValueError(f"unknown chart: {mode}")
+        canvas = OffscreenCanvas(width, height)
+        center, radius = draw_grid(canvas, width, height, mode)
+        # the admittance chart shows the same points mirrored (Γ_y = -Γ)
+        signed = radius if mode == "impedance" else -radius
+        draw_chain(canvas, gamma, bounds, arcs, center, signed)
+        if locus is not None:
+            draw_locus(canvas, locus, center, signed)
+        draw_marker(canvas, gamma[-1], center, signed)
+        out.place(canvas, 0, row * height)
+    return out
+
+
+def design_filenames(designs, fmt: str = "svg") -> list[str]:
+    """Return unique file names for ``designs``: index and sanitized name."""
+    digits = len(str(max(len(designs) - 1, 0)))
+    names = []
+    for i, design in enumerate(designs):
+        slug = re.sub(r"[^\w.-]+", "_", str(design.get("name", ""))).strip("._") or "design"
+        names.append(f"{i:0{digits}d}-{slug}.{fmt}")
+    return names
+
+
+def _render_file(task) -> str:
+    design, path, options = task
+    render_design(design, **options).save(path)
+    return path
+
+
+def render_designs(designs, directory, fmt: str = "svg", workers: int | None = None,
+                   **options) -> list[str]:
+    """Render every design into ``directory`` and return the file paths.
+
+    The designs are split over ``workers`` processes (default: one per
+    CPU); ``workers=1`` renders in this process.  ``options`` are passed
+    to :func:`render_design`.
+    """
+    if fmt not in RENDER_FORMATS:
+        raise ValueError(f"unknown image format: {fmt}")
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, name) for name in design_filenames(designs, fmt)]
+    tasks = [(design, path, options) for design, path in zip(designs, paths)]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        return [_render_file(task) for task in tasks]
+    # a few chunks per worker balance the load with little pickling overhead
+    chunk = max(1, len(tasks) // (4 * workers))
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(_render_file, tasks, chunksize=chunk))
+
+
+__all__ = [
+    "CHARTS",
+    "RENDER_FORMATS",
+    "GRID_VALUES",
+    "chart_geometry",
+    "draw_grid",
+    "trace_polylines",
+    "trace_arcs",
+    "path_shape",
+    "draw_chain",
+    "draw_marker",
+    "draw_locus",
+    "OffscreenCanvas",
+    "render_design",
+    "design_filenames",
+    "render_designs",
+]
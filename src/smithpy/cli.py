@@ -0,0 +1,318 @@
+"""Command line interface: the GUI and headless batch commands.
+
+``smithpy`` without a command (or ``smithpy gui``) opens the chart window.
+The batch commands evaluate design files (see :mod:`smithpy.design`)
+without a window::
+
+    smithpy eval designs.json --freq 900M --freq 1G
+    smithpy eval - --start 0.5G --stop 1.5G --points 101 --format csv < designs.jsonl
+    smithpy export design.json response.s1p --start 0.5G --stop 1.5G --points 100001
+    smithpy render designs.jsonl -o figures --format png --jobs 8
+
+Only the ``gui`` command imports :mod:`smithpy.app`, so batch runs (chart
+rendering included) never load tkinter and start about as fast as NumPy imports.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from . import __version__
+    from .chart import CHARTS, RENDER_FORMATS, render_designs
+    from .components import PackedChain
+    from .design import load_designs
+    from .engine import TRACE_STEPS, match_metrics, sweep_frequencies
+    from .export import export_response
+    from .network import chain_response
+    from .parsing import parse_frequency
+except ImportError:  # pragma: no cover - direct execution fallback
+    from chart import CHARTS, RENDER_FORMATS, render_designs
+    from components import PackedChain
+    from design import load_designs
+    from engine import TRACE_STEPS, match_metrics, sweep_frequencies
+    from export import export_response
+    from network import chain_response
+    from parsing import parse_frequency
+    __version__ = "unknown"
+
+COMMANDS = ("gui", "eval", "export", "render")
+OUTPUT_FORMATS = ("table", "csv", "json", "jsonl")
+# designs packed and evaluated together by ``eval``
+BATCH_DESIGNS = 1024
+CSV_FIELDS = ("design", "freq", "z_re", "z_im", "gamma_re", "gamma_im",
+              "return_loss", "vswr", "mismatch_loss")
+
+
+def _frequency_arg(text: str) -> float:
+    try:
+        return parse_frequency(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def read_designs(paths) -> list[dict]:
+    """Load the designs of all ``paths``; ``"-"`` reads standard input."""
+    designs = []
+    for path in paths:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            with open(path, encoding="utf-8") as fh:
+                text = fh.read()
+        designs.extend(load_designs(text))
+    return designs
+
+
+def _frequencies(args):
+    if args.freq:
+        return np.asarray(args.freq, dtype=float)
+    if args.start is not None:
+        return sweep_frequencies(args.start, args.stop, args.points, args.scale)
+    return None
+
+
+def evaluate_design(design: dict, freqs) -> dict:
+    """Return the input impedance and match figures of ``design`` at ``freqs``.
+
+    Line lengths refer to the design's own ``freq``.
+    """
+    z = chain_response(design["components"], design["za"], design["z0"], freqs,
+                       ref_freq=design["freq"])
+    return {"freqs": np.asarray(freqs), "z": z, **match_metrics(z, design["z0"])}
+
+
+def evaluate_designs(designs, freqs=None, batch: int = BATCH_DESIGNS):
+    """Yield ``(design, result)`` like :func:`evaluate_design` for every design.
+
+    The designs are packed into a :class:`~smithpy.components.PackedChain`
+    ``batch`` at a time and evaluated together.  Without ``freqs`` each
+    design is evaluated at its own ``freq``.
+    """
+    for first in range(0, len(designs), batch):
+        block = designs[first:first + batch]
+        packed = PackedChain.from_designs(block)
+        z = packed.response(freqs)
+        metrics = match_metrics(z, packed.z0[:, None])
+        for i, design in enumerate(block):
+            own = np.array([design["freq"]]) if freqs is None else np.asarray(freqs)
+            yield design, {"freqs": own, "z": z[i],
+                           **{key: value[i] for key, value in metrics.items()}}
+
+
+def _pairs(values) -> list:
+    return [[float(v.real), float(v.imag)] for v in values]
+
+
+def _result_dict(design: dict, result: dict) -> dict:
+    return {
+        "name": design["name"],
+        "z0": design["z0"],
+        "freq": result["freqs"].tolist(),
+        "z": _pairs(result["z"]),
+        "gamma": _pairs(result["gamma"]),
+        "return_loss": result["return_loss"].tolist(),
+        "vswr": result["vswr"].tolist(),
+        "mismatch_loss": result["mismatch_loss"].tolist(),
+    }
+
+
+def _rows(design: dict, result: dict):
+    for i, freq in enumerate(result["freqs"]):
+        z = result["z"][i]
+        gamma = result["gamma"][i]
+        yield (design["name"], freq, z.real, z.imag, gamma.real, gamma.imag,
+               result["return_loss"][i], result["vswr"][i], result["mismatch_loss"][i])
+
+
+def write_results(out, designs, freq_args, fmt: str = "table") -> int:
+    """Evaluate ``designs`` and write the results to ``out`` as ``fmt``.
+
+    Results are written design by design, except for ``json`` which
+    produces a single list.  Returns the number of designs.
+    """
+    if fmt == "csv":
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(CSV_FIELDS)
+    elif fmt == "table":
+        out.write(f"{'design':20s} {'freq [Hz]':>12s} {'Re(Z)':>10s} {'Im(Z)':>10s} "
+                  f"{'|G|':>7s} {'RL [dB]':>8s} {'VSWR':>8s}\n")
+    collected = []
+    for design, result in evaluate_designs(designs, _frequencies(freq_args)):
+        if fmt == "json":
+            collected.append(_result_dict(design, result))
+        elif fmt == "jsonl":
+            out.write(json.dumps(_result_dict(design, result)) + "\n")
+        elif fmt == "csv":
+            writer.writerows(_rows(design, result))
+        else:
+            for name, freq, zr, zi, gr, gi, rl, vswr, _ in _rows(design, result):
+                out.write(f"{name[:20]:20s} {freq:12.6g} {zr:10.4g} {zi:10.4g} "
+                          f"{abs(complex(gr, gi)):7.4f} {rl:8.3f} {vswr:8.3f}\n")
+    if fmt == "json":
+        json.dump(collected, out, indent=2)
+        out.write("\n")
+    return len(designs)
+
+
+def _add_sweep_arguments(parser, required: bool = False) -> None:
+    parser.add_argument("--start", type=_frequency_arg, required=required,
+                        help="first sweep frequency (e.g. 500M)")
+    parser.add_argument("--stop", type=_frequency_arg, required=required,
+                        help="last sweep frequency")
+    parser.add_argument("--points", type=int, default=101,
+                        help="number of sweep points (default: %(default)s)")
+    parser.add_argument("--scale", choices=("linear", "log"), default="linear",
+                        help="sweep spacing (default: %(default)s)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="smithpy", description="Smith chart tool")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    gui = sub.add_parser("gui", help="open the Smith chart window (default)")
+    gui.add_argument("--profile", nargs="?", const="smithpy.prof", metavar="FILE",
+                     help="profile the session, write cProfile data to FILE "
+                          "(default: smithpy.prof) and print a summary on exit")
+
+    ev = sub.add_parser("eval", help="evaluate design files",
+                        description="Evaluate designs at their own frequency, at --freq "
+                                    "values or over a sweep.")
+    ev.add_argument("designs", nargs="+", metavar="DESIGN",
+                    help="design file (JSON or JSON Lines); '-' reads standard input")
+    ev.add_argument("-f", "--freq", type=_frequency_arg, action="append",
+                    help="evaluation frequency; may be given several times")
+    _add_sweep_arguments(ev)
+    ev.add_argument("--format", choices=OUTPUT_FORMATS, default="table",
+                    help="output format (default: %(default)s)")
+    ev.add_argument("-o", "--output", help="write the results to this file")
+
+    ex = sub.add_parser("export", help="stream a sweep of one design to .s1p/.npy/.npz")
+    ex.add_argument("design", help="design file; '-' reads standard input")
+    ex.add_argument("output", help="output file; the format follows the extension")
+    ex.add_argument("--index", type=int, default=0,
+                    help="design to export if the file holds several (default: %(default)s)")
+    _add_sweep_arguments(ex, required=True)
+
+    rd = sub.add_parser("render", help="draw the charts of designs to SVG or PNG files",
+                        description="Draw the Smith charts of every design like the window "
+                                    "does, one image per design, using several processes.")
+    rd.add_argument("designs", nargs="+", metavar="DESIGN",
+                    help="design file (JSON or JSON Lines); '-' reads standard input")
+    rd.add_argument("-o", "--output-dir", default=".",
+                    help="directory for the images (default: current directory)")
+    rd.add_argument("--format", choices=RENDER_FORMATS, default="svg",
+                    help="image format; png needs Pillow (default: %(default)s)")
+    rd.add_argument("--width", type=int, default=600,
+                    help="chart width in pixels (default: %(default)s)")
+    rd.add_argument("--height", type=int, default=600,
+                    help="height of each chart in pixels (default: %(default)s)")
+    rd.add_argument("--charts", choices=(*CHARTS, "both"), default="both",
+                    help="charts to draw; both are stacked (default: %(default)s)")
+    rd.add_argument("--sampled", action="store_true",
+                    help="draw traces from sampled points instead of exact arcs")
+    rd.add_argument("--steps", type=int, default=TRACE_STEPS,
+                    help="points per component with --sampled (default: %(default)s)")
+    _add_sweep_arguments(rd)
+    rd.add_argument("-j", "--jobs", type=int,
+                    help="worker processes (default: one per CPU)")
+    return parser
+
+
+def run_gui(args) -> int:
+    # imported here so that the batch commands never load tkinter
+    try:
+        from .app import run as gui_run
+    except ImportError as exc:
+        if not __package__:  # pragma: no cover - direct execution fallback
+            from app import run as gui_run
+        else:
+            print(f"smithpy: cannot start the GUI: {exc}", file=sys.stderr)
+            return 1
+    gui_run(profile=args.profile)
+    return 0
+
+
+def run_eval(args) -> int:
+    if args.freq and args.start is not None:
+        raise ValueError("use either --freq or --start/--stop")
+    if (args.start is None) != (args.stop is None):
+        raise ValueError("--start and --stop go together")
+    designs = read_designs(args.designs)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as fh:
+            write_results(fh, designs, args, args.format)
+    else:
+        write_results(sys.stdout, designs, args, args.format)
+    return 0
+
+
+def run_export(args) -> int:
+    designs = read_designs([args.design])
+    if not 0 <= args.index < len(designs):
+        raise ValueError(f"no design {args.index} in {args.design}")
+    design = designs[args.index]
+    count = export_response(args.output, design["components"], design["za"], design["z0"],
+                            args.start, args.stop, args.points, args.scale,
+                            ref_freq=design["freq"])
+    print(f"{count} points written to {args.output}", file=sys.stderr)
+    return 0
+
+
+def run_render(args) -> int:
+    if (args.start is None) != (args.stop is None):
+        raise ValueError("--start and --stop go together")
+    if args.width < 50 or args.height < 50:
+        raise ValueError("charts need at least 50x50 pixels")
+    designs = read_designs(args.designs)
+    charts = CHARTS if args.charts == "both" else (args.charts,)
+    freqs = None
+    if args.start is not None:
+        freqs = sweep_frequencies(args.start, args.stop, args.points, args.scale)
+    paths = render_designs(designs, args.output_dir, args.format, args.jobs,
+                           charts=charts, width=args.width, height=args.height,
+                           analytic=not args.sampled, steps=args.steps,
+                           freqs=freqs)
+    print(f"{len(paths)} charts written to {args.output_dir}", file=sys.stderr)
+    return 0
+
+
+def main(argv=None) -> int:
+    """Run the ``smithpy`` command and return its exit status."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in (*COMMANDS, "-h", "--help", "--version"):
+        argv = ["gui", *argv]
+    args = build_parser().parse_args(argv)
+    handler = {"gui": run_gui, "eval": run_eval, "export": run_export,
+               "render": run_render}[args.command]
+    try:
+        return handler(args)
+    except BrokenPipeError:
+        # the reader went away (e.g. piped into ``head``); stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (ImportError, OSError, ValueError) as exc:
+        print(f"smithpy {args.command}: error: {exc}", file=sys.stderr)
+        return 1
+
+
+__all__ = [
+    "COMMANDS",
+    "OUTPUT_FORMATS",
+    "read_designs",
+    "evaluate_design",
+    "evaluate_designs",
+    "write_results",
+    "build_parser",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
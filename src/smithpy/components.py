@@ -0,0 +1,253 @@
+"""Compact typed components and packed chains for batch evaluation.
+
+The GUI and the design files describe components as dicts.  For work on
+many designs this module offers two denser forms:
+
+* :class:`Component` keeps one component in ``__slots__`` with an integer
+  kind code.  :meth:`Component.prepare` computes the frequency dependent
+  constants (the added immittance of lumped parts, the electrical length of
+  lines) once, after which :meth:`Component.evaluate` only does the
+  arithmetic of the step.
+* :class:`PackedChain` stores a whole batch of chains as contiguous
+  ``(designs, components)`` arrays and evaluates all designs over all
+  frequencies in one pass per component position.
+
+Both give the same impedances as :func:`smithpy.engine.apply_component`
+and :func:`smithpy.network.chain_response`.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from .engine import PI2, _inv
+except ImportError:  # pragma: no cover - direct execution fallback
+    from engine import PI2, _inv
+
+# kind codes; EMPTY pads shorter chains in a PackedChain
+EMPTY, L, C, R, TL, OPEN_STUB, SHORT_STUB = -1, 0, 1, 2, 3, 4, 5
+LUMPED = (L, C, R)
+LINES = (TL, OPEN_STUB, SHORT_STUB)
+KIND_NAMES = {L: "L", C: "C", R: "R", TL: "TL", OPEN_STUB: "STUB", SHORT_STUB: "STUB"}
+
+
+def kind_code(comp: dict) -> int:
+    """Return the kind code of a component dict."""
+    typ = comp.get("type")
+    if typ == "STUB":
+        return SHORT_STUB if comp.get("kind") == "short" else OPEN_STUB
+    for code, name in KIND_NAMES.items():
+        if name == typ:
+            return code
+    raise ValueError(f"unknown component type: {typ!r}")
+
+
+def _lumped_immittance(kind: int, value, w, series):
+    """Return the impedance (series) or admittance (shunt) a part adds."""
+    if kind == L:
+        return np.where(series, 1j * w * value, -1j / (w * value))
+    if kind == C:
+        return np.where(series, -1j / (w * value), 1j * w * value)
+    return np.where(series, value, 1 / value) + 0j * w
+
+
+def _apply_line(kind: int, z, theta, zl):
+    tan = np.tan(theta)
+    if kind == TL:
+        return zl * (z + 1j * zl * tan) / (zl + 1j * z * tan)
+    if kind == SHORT_STUB:
+        return _inv(_inv(z) + _inv(1j * zl * tan))
+    return _inv(_inv(z) + 1j * tan / zl)
+
+
+class Component:
+    """One component with an integer kind and precomputable constants.
+
+    ``value`` is the inductance, capacitance or resistance of lumped parts
+    and the electrical length in degrees of lines and stubs.  ``z0`` is the
+    line impedance; ``None`` uses the system impedance.
+    """
+
+    __slots__ = ("kind", "value", "series", "z0", "_key", "_const")
+
+    def __init__(self, kind: int, value: float, series: bool = True, z0: float | None = None):
+        self.kind = kind
+        self.value = float(value)
+        self.series = bool(series)
+        self.z0 = None if z0 is None else float(z0)
+        self._key = None
+        self._const = None
+
+    @classmethod
+    def from_dict(cls, comp: dict) -> "Component":
+        """Build a component from the dict form used by the GUI."""
+        kind = kind_code(comp)
+        if kind in LUMPED:
+            return cls(kind, comp["value"], comp.get("orient") == "series")
+        return cls(kind, comp["length"], z0=comp.get("z0"))
+
+    def to_dict(self) -> dict:
+        """Return the dict form (without display strings)."""
+        comp = {"type": KIND_NAMES[self.kind]}
+        if self.kind in LUMPED:
+            comp.update(value=self.value, orient="series" if self.series else "shunt")
+            return comp
+        comp["length"] = self.value
+        if self.z0 is not None:
+            comp["z0"] = self.z0
+        if self.kind != TL:
+            comp["kind"] = "short" if self.kind == SHORT_STUB else "open"
+        return comp
+
+    def prepare(self, freq: float, z0: float = 50.0,
+                ref_freq: float | None = None) -> "Component":
+        """Compute the constants for ``freq``; cheap if they are current."""
+        key = (freq, z0, ref_freq)
+        if key != self._key:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if self.kind in LUMPED:
+                    self._const = complex(_lumped_immittance(self.kind, self.value,
+                                                             PI2 * freq, self.series))
+                else:
+                    theta = np.radians(self.value)
+                    if ref_freq is not None:
+                        theta *= freq / ref_freq
+                    self._const = (theta, z0 if self.z0 is None else self.z0)
+            self._key = key
+        return self
+
+    def evaluate(self, z, t=1.0) -> np.ndarray:
+        """Return the impedance after adding the fraction ``t`` of the component.
+
+        :meth:`prepare` must have been called for the frequency of interest.
+        """
+        if self._const is None:
+            raise RuntimeError("Component.prepare() has not been called")
+        z = np.asarray(z, dtype=complex)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.kind in LUMPED:
+                if self.series:
+                    return z + self._const * t
+                return _inv(_inv(z) + self._const * t)
+            theta, zl = self._const
+            return _apply_line(self.kind, z, theta * np.asarray(t), zl)
+
+    def trace(self, z_start: complex, steps: int) -> np.ndarray:
+        """Return ``steps`` evenly spaced impedances along the component."""
+        return self.evaluate(z_start, np.arange(1, steps + 1) / steps)
+
+    def __repr__(self) -> str:
+        return f"Component({self.to_dict()!r})"
+
+
+class PackedChain:
+    """A batch of chains packed into contiguous arrays.
+
+    Row ``i`` of ``kinds``, ``values``, ``series`` and ``line_z0`` holds the
+    chain of design ``i`` (from the load towards the source), padded with
+    :data:`EMPTY`.  ``za``, ``z0`` and ``ref_freq`` hold one entry per design;
+    a NaN ``ref_freq`` keeps line lengths fixed over frequency.
+    """
+
+    __slots__ = ("kinds", "values", "series", "line_z0", "za", "z0", "ref_freq")
+
+    def __init__(self, kinds, values, series, line_z0, za, z0, ref_freq):
+        self.kinds = np.ascontiguousarray(kinds, dtype=np.int8)
+        self.values = np.ascontiguousarray(values, dtype=float)
+        self.series = np.ascontiguousarray(series, dtype=bool)
+        self.line_z0 = np.ascontiguousarray(line_z0, dtype=float)
+        self.za = np.ascontiguousarray(za, dtype=complex)
+        self.z0 = np.ascontiguousarray(z0, dtype=float)
+        self.ref_freq = np.ascontiguousarray(ref_freq, dtype=float)
+
+    @classmethod
+    def from_chains(cls, chains, za, z0=50.0, ref_freq=None) -> "PackedChain":
+        """Pack lists of component dicts or :class:`Component` objects.
+
+        ``za``, ``z0`` and ``ref_freq`` are scalars or one value per chain.
+        """
+        count = len(chains)
+        width = max((len(chain) for chain in chains), default=0)
+        kinds = np.full((count, width), EMPTY, dtype=np.int8)
+        values = np.zeros((count, width))
+        series = np.zeros((count, width), dtype=bool)
+        z0 = np.broadcast_to(np.asarray(z0, dtype=float), (count,))
+        line_z0 = np.repeat(z0[:, None], width, axis=1)
+        for i, chain in enumerate(chains):
+            for j, comp in enumerate(chain):
+                if isinstance(comp, dict):
+                    comp = Component.from_dict(comp)
+                kinds[i, j] = comp.kind
+                values[i, j] = comp.value
+                series[i, j] = comp.series
+                if comp.z0 is not None:
+                    line_z0[i, j] = comp.z0
+        ref = np.nan if ref_freq is None else ref_freq
+        return cls(kinds, values, series, line_z0,
+                   np.broadcast_to(np.asarray(za, dtype=complex), (count,)), z0,
+                   np.broadcast_to(np.asarray(ref, dtype=float), (count,)))
+
+    @classmethod
+    def from_designs(cls, designs) -> "PackedChain":
+        """Pack designs as returned by :func:`smithpy.design.parse_design`."""
+        return cls.from_chains([d["components"] for d in designs],
+                               [d["za"] for d in designs], [d["z0"] for d in designs],
+                               [d["freq"] for d in designs])
+
+    def __len__(self) -> int:
+        return self.kinds.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the packed arrays in bytes."""
+        return sum(getattr(self, name).nbytes for name in self.__slots__)
+
+    def response(self, freqs=None) -> np.ndarray:
+        """Return the input impedances with shape ``(designs, frequencies)``.
+
+        Without ``freqs`` every design is evaluated at its own ``ref_freq``,
+        which must then be set.
+        """
+        if freqs is None:
+            if np.isnan(self.ref_freq).any():
+                raise ValueError("freqs are needed for chains packed without ref_freq")
+            f = self.ref_freq[:, None]
+        else:
+            f = np.asarray(freqs, dtype=float).reshape(1, -1)
+        f = np.broadcast_to(f, (len(self), f.shape[1]))
+        w = PI2 * f
+        scale = np.where(np.isnan(self.ref_freq)[:, None], 1.0, f / self.ref_freq[:, None])
+        z = np.repeat(self.za[:, None], f.shape[1], axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for j in range(self.kinds.shape[1]):
+                column = self.kinds[:, j]
+                for kind in np.unique(column).tolist():
+                    if kind == EMPTY:
+                        continue
+                    mask = column == kind
+                    rows = slice(None) if mask.all() else np.flatnonzero(mask)
+                    value = self.values[rows, j][:, None]
+                    if kind in LUMPED:
+                        series = self.series[rows, j][:, None]
+                        imm = _lumped_immittance(kind, value, w[rows], series)
+                        zr = z[rows]
+                        z[rows] = np.where(series, zr + imm, _inv(_inv(zr) + imm))
+                    else:
+                        theta = np.radians(value) * scale[rows]
+                        z[rows] = _apply_line(kind, z[rows], theta,
+                                              self.line_z0[rows, j][:, None])
+        return z
+
+
+__all__ = [
+    "EMPTY",
+    "L",
+    "C",
+    "R",
+    "TL",
+    "OPEN_STUB",
+    "SHORT_STUB",
+    "kind_code",
+    "Component",
+    "PackedChain",
+]
@@ -0,0 +1,107 @@
+"""Reduce plotted polylines to the vertices the canvas can resolve.
+
+Traces and sweeps are computed with as many points as requested, which can
+be far more than there are pixels along the curve.  :func:`decimate` picks
+the vertices worth drawing in two vectorized stages:
+
+1. consecutive points that fall into the same cell of a ``tol``-sized grid
+   are dropped, which caps the vertex count by the length of the curve in
+   pixels;
+2. pixel-space Douglas–Peucker removes vertices that deviate less than the
+   tolerance from the line through their neighbours.  All segments are
+   refined together, one NumPy pass per level, instead of recursing per
+   segment.
+
+The computed points themselves are left untouched, so the charts are
+re-decimated from full resolution whenever their size changes.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+# maximum deviation in pixels of the drawn polyline from the computed points
+DECIMATE_TOL = 0.5
+# Douglas-Peucker starts from segments of at most this many points
+DP_CHUNK = 64
+
+
+def _segment_distance(xy, start, stop):
+    """Return the distance of every point from the line ``start``-``stop``."""
+    d = stop - start
+    length = np.hypot(d[:, 0], d[:, 1])
+    rel = xy - start
+    cross = np.abs(d[:, 0] * rel[:, 1] - d[:, 1] * rel[:, 0])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dist = cross / length
+    # degenerate segments, e.g. a closed loop: distance from the end point
+    return np.where(length > 0, dist, np.hypot(rel[:, 0], rel[:, 1]))
+
+
+def decimate(xy: np.ndarray, tol: float = DECIMATE_TOL, breaks=()) -> np.ndarray:
+    """Return the sorted indices of the points of ``xy`` worth drawing.
+
+    Parameters
+    ----------
+    xy:
+        ``(n, 2)`` array of canvas coordinates.
+    tol:
+        Allowed deviation in pixels.
+    breaks:
+        Indices that are always kept, e.g. the ends of the polylines when
+        ``xy`` holds several of them back to back.
+    """
+    xy = np.asarray(xy, dtype=float)
+    n = len(xy)
+    if n <= 2:
+        return np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1]] = True
+    keep[np.asarray(breaks, dtype=np.int64)] = True
+    x, y = xy[:, 0], xy[:, 1]
+    keep |= ~(np.isfinite(x) & np.isfinite(y))
+    # stage 1: one point per run within the same tol-sized cell
+    px, py = np.floor(x / tol), np.floor(y / tol)
+    moved = (px[1:] != px[:-1]) | (py[1:] != py[:-1])
+    candidate = np.concatenate([[True], moved]) | keep
+    # stage 2: Douglas-Peucker over the remaining points; every pass splits
+    # all open segments at once and settles the segments within tolerance
+    points = np.flatnonzero(candidate)
+    pts = xy[points]
+    kept = keep[points]
+    # bounded segment lengths keep the number of passes low on winding curves
+    kept[::DP_CHUNK] = True
+    pending = ~kept
+    while pending.any():
+        ends = np.flatnonzero(kept)
+        idx = np.flatnonzero(pending)
+        seg = np.searchsorted(ends, idx, "right") - 1
+        dist = _segment_distance(pts[idx], pts[ends[seg]], pts[ends[seg + 1]])
+        dist = np.nan_to_num(dist, nan=-1.0)
+        first_of_group = np.concatenate([[True], seg[1:] != seg[:-1]])
+        starts = np.flatnonzero(first_of_group)
+        group = np.cumsum(first_of_group) - 1
+        peak = np.maximum.reduceat(dist, starts)
+        split = np.flatnonzero((dist > tol) & (dist == peak[group]))
+        if split.size:
+            # only the first farthest point of each segment
+            g = group[split]
+            new = idx[split[np.concatenate([[True], g[1:] != g[:-1]])]]
+            kept[new] = True
+            pending[new] = False
+        pending[idx[peak[group] <= tol]] = False
+    return points[kept]
+
+
+def decimate_bounds(kept: np.ndarray, bounds) -> list[tuple[int, int]]:
+    """Map ``(start, stop)`` slices of the input onto the decimated indices.
+
+    The ends of each slice must have been passed to :func:`decimate` as
+    ``breaks``.
+    """
+    out = []
+    for a, b in bounds:
+        out.append((int(np.searchsorted(kept, a)), int(np.searchsorted(kept, b - 1)) + 1))
+    return out
+
+
+__all__ = ["DECIMATE_TOL", "decimate", "decimate_bounds"]
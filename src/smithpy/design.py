@@ -0,0 +1,198 @@
+"""Design files: component chains with their load and reference settings.
+
+A design is a JSON object::
+
+    {
+        "name": "match 1",
+        "z0": 50,
+        "freq": 1e9,
+        "za": "25+10j",
+        "components": [
+            {"type": "L", "value": "10 nH", "orient": "series"},
+            {"type": "C", "value": 2e-12, "orient": "shunt"},
+            {"type": "TL", "length": 45, "z0": 75},
+            {"type": "STUB", "length": "0.125 λ", "kind": "open"}
+        ]
+    }
+
+``freq`` (a number in Hz or a string like ``"2.4 GHz"``) is the frequency
+the line lengths (degrees or wavelengths) refer to.  Values may be numbers
+in SI units or strings with units.  A file may hold one design, a list of
+designs, an object with a ``"designs"`` list or one design per line (JSON
+Lines).
+"""
+from __future__ import annotations
+
+import json
+import math
+import numbers
+
+try:  # allow running as a module or a script
+    from .parsing import (
+        parse_complex_impedance, parse_frequency, parse_lc_value, parse_length, parse_ohm_value,
+    )
+except ImportError:  # pragma: no cover - direct execution fallback
+    from parsing import (
+        parse_complex_impedance, parse_frequency, parse_lc_value, parse_length, parse_ohm_value,
+    )
+
+COMPONENT_TYPES = ("L", "C", "R", "TL", "STUB")
+DEFAULT_Z0 = 50.0
+DEFAULT_FREQ = 1e9
+DEFAULT_ZA = 50 + 0j
+
+
+def _parse_za(value) -> complex:
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        return complex(float(value[0]), float(value[1]))
+    if isinstance(value, str):
+        return parse_complex_impedance(value)
+    if isinstance(value, numbers.Number):
+        return complex(value)
+    raise ValueError(f"invalid za: {value!r}")
+
+
+def _parse_length(value) -> tuple[float, str, str]:
+    if isinstance(value, (int, float)):
+        return float(value), f"{float(value)}°", "deg"
+    text = str(value).strip()
+    if text.endswith(("λ", "lambda")):
+        length, disp = parse_length(text.replace("lambda", ""), "lambda")
+        return length, disp, "lambda"
+    length, disp = parse_length(text, "deg")
+    return length, disp, "deg"
+
+
+def parse_component(obj: dict, z0: float = DEFAULT_Z0) -> dict:
+    """Return the component dict used by the engine and GUI for ``obj``."""
+    typ = str(obj.get("type", "")).upper()
+    if typ not in COMPONENT_TYPES:
+        raise ValueError(f"unknown component type: {obj.get('type')!r}")
+    comp = {"type": typ}
+    if typ in ("L", "C", "R"):
+        orient = obj.get("orient", "series")
+        if orient not in ("series", "shunt"):
+            raise ValueError(f"invalid orientation: {orient!r}")
+        value = obj["value"]
+        if isinstance(value, str):
+            disp = value
+            value = parse_ohm_value(value) if typ == "R" else parse_lc_value(value)
+        else:
+            value = float(value)
+            disp = f"{value:g}"
+        comp.update(value=value, disp=disp, orient=orient)
+    else:
+        length, disp, mode = _parse_length(obj["length"])
+        comp.update(length=length, len_disp=disp, len_mode=mode,
+                    z0=float(obj.get("z0", z0)), disp=disp)
+        if typ == "STUB":
+            kind = obj.get("kind", "open")
+            if kind not in ("open", "short"):
+                raise ValueError(f"invalid stub kind: {kind!r}")
+            comp["kind"] = kind
+    for key in ("tol", "dist", "min", "max"):
+        if key in obj:
+            comp[key] = obj[key]
+    return comp
+
+
+def lumped(kind: str, value: float, orient: str) -> dict:
+    """Return a GUI component dict for an L, C or R value."""
+    if kind == "L":
+        scaled, unit = value * 1e9, " nH"
+    elif kind == "C":
+        scaled, unit = value * 1e12, " pF"
+    else:
+        scaled, unit = value, ""
+    return {
+        "type": kind,
+        "value": value,
+        "disp": f"{scaled:.4g}{unit}",
+        "orient": orient,
+        "min": 0.0,
+        "max": float(max(100, math.ceil(scaled * 1.5))),
+    }
+
+
+def line(kind: str, length: float, z0: float, stub: str | None = None) -> dict:
+    """Return a GUI component dict for a line (``"TL"``) or ``"STUB"``."""
+    disp = f"{length:.2f}°"
+    comp = {
+        "type": kind,
+        "length": length,
+        "len_disp": disp,
+        "len_mode": "deg",
+        "z0": z0,
+        "disp": disp,
+        "min": 0.0,
+        "max": 180.0 if length <= 180 else 360.0,
+    }
+    if kind == "STUB":
+        comp["kind"] = stub
+    return comp
+
+
+def parse_design(obj: dict, index: int = 0) -> dict:
+    """Validate a design object and return it with parsed values.
+
+    The result has the keys ``name``, ``z0``, ``freq``, ``za`` and
+    ``components``.
+    """
+    if not isinstance(obj, dict):
+        raise ValueError(f"design {index}: expected an object")
+    name = str(obj.get("name", f"design {index}"))
+    try:
+        z0 = float(obj.get("z0", DEFAULT_Z0))
+        freq = obj.get("freq", DEFAULT_FREQ)
+        freq = parse_frequency(freq) if isinstance(freq, str) else float(freq)
+        za = _parse_za(obj.get("za", DEFAULT_ZA))
+        components = [parse_component(c, z0) for c in obj.get("components", [])]
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"{name}: {exc}") from exc
+    return {"name": name, "z0": z0, "freq": freq, "za": za, "components": components}
+
+
+def load_designs(text: str) -> list[dict]:
+    """Parse all designs in ``text`` (JSON or JSON Lines)."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = [json.loads(line) for line in text.splitlines() if line.strip()]
+    if isinstance(data, dict) and "designs" in data:
+        data = data["designs"]
+    if isinstance(data, dict):
+        data = [data]
+    return [parse_design(obj, i) for i, obj in enumerate(data)]
+
+
+def design_to_dict(components, za: complex, z0: float = DEFAULT_Z0,
+                   freq: float = DEFAULT_FREQ, name: str | None = None) -> dict:
+    """Return a JSON-serializable design for a component chain."""
+    comps = []
+    for comp in components:
+        out = {"type": comp["type"]}
+        if comp["type"] in ("L", "C", "R"):
+            out.update(value=float(comp["value"]), orient=comp.get("orient", "series"))
+        else:
+            out.update(length=float(comp["length"]), z0=float(comp.get("z0", z0)))
+            if comp["type"] == "STUB":
+                out["kind"] = comp.get("kind", "open")
+        for key in ("tol", "dist"):
+            if key in comp:
+                out[key] = comp[key]
+        comps.append(out)
+    design = {"z0": z0, "freq": freq, "za": [za.real, za.imag], "components": comps}
+    if name is not None:
+        design = {"name": name, **design}
+    return design
+
+
+__all__ = [
+    "COMPONENT_TYPES",
+    "parse_component",
+    "lumped",
+    "line",
+    "parse_design",
+    "load_designs",
+    "design_to_dict",
+]
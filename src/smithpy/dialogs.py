@@ -1,13 +1,20 @@
 """Dialog components for smithpy GUI."""
 
 import math
+import multiprocessing
 import tkinter as tk
 from tkinter import ttk, messagebox
 
 try:  # allow direct script execution
+    from .loadpull import parse_loads
     from .parsing import parse_lc_value, parse_length, parse_ohm_value
+    from .synthesis import E_SERIES, TOPOLOGIES, sample_load, synthesize
+    from .tolerance import DISTRIBUTIONS
 except ImportError:  # pragma: no cover - direct execution fallback
+    from loadpull import parse_loads
     from parsing import parse_lc_value, parse_length, parse_ohm_value
+    from synthesis import E_SERIES, TOPOLOGIES, sample_load, synthesize
+    from tolerance import DISTRIBUTIONS
 
 
 class ComponentDialog(tk.Toplevel):
@@ -161,6 +168,16 @@ class ComponentDialog(tk.Toplevel):
             ttk.Label(self, text="Type").grid(row=row, column=0)
             self.kind = tk.StringVar(value=data.get("kind", "open"))
             ttk.OptionMenu(self, self.kind, self.kind.get(), "open", "short").grid(row=row, column=1)
+        # tolerance of the value (lumped) or length (lines) for Monte Carlo runs
+        row += 1
+        ttk.Label(self, text="Tolerance [\u00b1%]").grid(row=row, column=0)
+        self.tol_entry = ttk.Entry(self, width=6)
+        self.tol_entry.grid(row=row, column=1)
+        self.tol_entry.insert(0, str(data.get("tol", 0)))
+        row += 1
+        ttk.Label(self, text="Distribution").grid(row=row, column=0)
+        self.dist = tk.StringVar(value=data.get("dist", "uniform"))
+        ttk.OptionMenu(self, self.dist, self.dist.get(), *DISTRIBUTIONS).grid(row=row, column=1)
         ttk.Button(self, text="OK", command=self.ok).grid(row=row+1, column=0)
         ttk.Button(self, text="Cancel", command=self.cancel).grid(row=row+1, column=1)
 
@@ -206,6 +223,11 @@ class ComponentDialog(tk.Toplevel):
                     "min": float(self.min_entry.get()),
                     "max": float(self.max_entry.get()),
                 }
+            tol = float(self.tol_entry.get())
+            if tol < 0:
+                raise ValueError("Tolerance must not be negative")
+            self.res["tol"] = tol
+            self.res["dist"] = self.dist.get()
         except Exception as e:
             messagebox.showerror("Error", str(e))
             return
@@ -214,7 +236,7 @@ class ComponentDialog(tk.Toplevel):
     def cancel(self):
         self.res = None
         self.destroy()
-        self.master_app.update_point()
+        self.master_app.end_preview()
 
     def update_scale_range(self):
         """Apply min/max from entries to the slider."""
@@ -273,8 +295,166 @@ class ComponentDialog(tk.Toplevel):
                     comp["kind"] = self.kind.get()
             else:
                 return
+            try:  # keep the tolerance so Monte Carlo previews stay meaningful
+                comp["tol"] = float(self.tol_entry.get())
+                comp["dist"] = self.dist.get()
+            except (AttributeError, ValueError):
+                pass
             self.master_app.preview_update(comp, self.index)
         except Exception:
             pass
 
-__all__ = ["ComponentDialog"]
+TOPOLOGY_NAMES = {
+    "L": "L",
+    "PI": "Pi",
+    "T": "T",
+    "STUB": "Single stub",
+    "DOUBLE_STUB": "Double stub",
+}
+
+
+class SynthesisDialog(tk.Toplevel):
+    """Dialog to synthesize matching networks and load one into the chain."""
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.master_app = master
+        self.candidates = []
+        self.transient(master)
+        self.title("Synthesize matching network")
+        self.build_widgets()
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+    def build_widgets(self):
+        topo = ttk.LabelFrame(self, text="Topologies")
+        topo.grid(row=0, column=0, columnspan=4, sticky="we", padx=5, pady=5)
+        self.topo_vars = {}
+        for col, name in enumerate(TOPOLOGIES):
+            var = tk.BooleanVar(value=True)
+            ttk.Checkbutton(topo, text=TOPOLOGY_NAMES[name], variable=var).grid(row=0, column=col)
+            self.topo_vars[name] = var
+        ttk.Label(self, text="Rank by").grid(row=1, column=0, sticky="w")
+        self.rank = tk.StringVar(value="bandwidth")
+        ttk.OptionMenu(self, self.rank, self.rank.get(), "bandwidth", "count").grid(row=1, column=1, sticky="we")
+        ttk.Label(self, text="Values").grid(row=1, column=2, sticky="w")
+        self.series = tk.StringVar(value="exact")
+        ttk.OptionMenu(self, self.series, self.series.get(), "exact", *E_SERIES).grid(row=1, column=3, sticky="we")
+        ttk.Label(self, text="RL spec [dB]").grid(row=2, column=0, sticky="w")
+        self.rl_entry = ttk.Entry(self, width=6)
+        self.rl_entry.grid(row=2, column=1, sticky="w")
+        self.rl_entry.insert(0, "10")
+        self.use_band = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self, text="Use sweep band", variable=self.use_band).grid(row=2, column=2, columnspan=2, sticky="w")
+        ttk.Button(self, text="Run", command=self.run).grid(row=3, column=0, columnspan=2, sticky="we", padx=5)
+        ttk.Button(self, text="Stop", command=self.stop).grid(row=3, column=2, columnspan=2, sticky="we", padx=5)
+        self.result_list = tk.Listbox(self, width=90, height=12)
+        self.result_list.grid(row=4, column=0, columnspan=4, padx=5, pady=5)
+        self.result_list.bind("<Double-Button-1>", lambda _: self.load())
+        ttk.Button(self, text="Load", command=self.load).grid(row=5, column=0, columnspan=2, sticky="we")
+        ttk.Button(self, text="Close", command=self.destroy).grid(row=5, column=2, columnspan=2, sticky="we")
+        self.status_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.status_var).grid(row=6, column=0, columnspan=4, sticky="w", padx=5)
+
+    def run(self):
+        app = self.master_app
+        topologies = [name for name, var in self.topo_vars.items() if var.get()]
+        if not topologies:
+            messagebox.showerror("Error", "Select at least one topology")
+            return
+        try:
+            rl_spec = float(self.rl_entry.get())
+            band = None
+            if self.use_band.get():
+                band = (float(app.sweep_start_entry.get()) * 1e6,
+                        float(app.sweep_stop_entry.get()) * 1e6)
+        except ValueError:
+            messagebox.showerror("Error", "Invalid RL spec or sweep band")
+            return
+        if band is not None and not band[0] <= app.freq <= band[1]:
+            messagebox.showerror("Error", "The sweep band must contain the design frequency")
+            return
+        # sample a Touchstone load here, so the job only gets plain arrays
+        za = sample_load(app.za_data.impedance_at, app.freq, band) if app.za_data is not None else app.za
+        series = None if self.series.get() == "exact" else self.series.get()
+        args = (za, app.z0, app.freq, topologies, band, self.rank.get(), series, rl_spec)
+        self.status_var.set("Searching...")
+        app.jobs.submit("synthesis", self.search, *args, callback=self.show_results,
+                        error=self.failed, progress=self.show_progress)
+
+    @staticmethod
+    def search(token, za, z0, freq, topologies, band, rank, series, rl_spec):
+        """Run the synthesis; called in a background job, so no Tk access."""
+        # spawned workers do not inherit the Tk process state
+        return synthesize(za, z0, freq, topologies, band, rank, series, rl_spec,
+                          progress=token.progress,
+                          mp_context=multiprocessing.get_context("spawn"))
+
+    def show_progress(self, fraction):
+        self.status_var.set(f"Searching... {fraction:.0%}")
+
+    def show_results(self, candidates):
+        self.candidates = candidates
+        self.status_var.set(f"{len(candidates)} networks found")
+        self.result_list.delete(0, tk.END)
+        for cand in self.candidates:
+            self.result_list.insert(tk.END, cand.describe())
+        if not self.candidates:
+            self.result_list.insert(tk.END, "No network found")
+
+    def failed(self, exc):
+        self.status_var.set("")
+        messagebox.showerror("Error", str(exc), parent=self)
+
+    def stop(self):
+        if "synthesis" in self.master_app.jobs.pending:
+            self.master_app.jobs.cancel("synthesis")
+            self.status_var.set("Stopped")
+
+    def destroy(self):
+        # drop the result of a running search along with the dialog
+        self.master_app.jobs.cancel("synthesis")
+        super().destroy()
+
+    def load(self):
+        sel = self.result_list.curselection()
+        if not sel or sel[0] >= len(self.candidates):
+            return
+        self.master_app.load_components(self.candidates[sel[0]].components)
+
+
+class LoadsDialog(tk.Toplevel):
+    """Dialog to paste a list of load impedances or admittances."""
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.master_app = master
+        self.transient(master)
+        self.title("Loads")
+        self.build_widgets()
+
+    def build_widgets(self):
+        ttk.Label(self, text="One load per line: 25+10j or 25, 10 (CSV)").grid(
+            row=0, column=0, columnspan=3, sticky="w", padx=5)
+        self.text = tk.Text(self, width=40, height=16)
+        self.text.grid(row=1, column=0, columnspan=3, padx=5, pady=5)
+        self.admittance = tk.BooleanVar(value=self.master_app.za_mode.get() == "Y")
+        ttk.Checkbutton(self, text="Admittances [S]", variable=self.admittance).grid(
+            row=2, column=0, columnspan=3, sticky="w", padx=5)
+        ttk.Button(self, text="Apply", command=self.apply).grid(row=3, column=0, sticky="we")
+        ttk.Button(self, text="Clear", command=self.clear).grid(row=3, column=1, sticky="we")
+        ttk.Button(self, text="Close", command=self.destroy).grid(row=3, column=2, sticky="we")
+
+    def apply(self):
+        try:
+            loads = parse_loads(self.text.get("1.0", tk.END), self.admittance.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e), parent=self)
+            return
+        self.master_app.set_loads(loads, "pasted")
+
+    def clear(self):
+        self.text.delete("1.0", tk.END)
+        self.master_app.set_loads(None)
+
+
+__all__ = ["ComponentDialog", "SynthesisDialog", "LoadsDialog"]
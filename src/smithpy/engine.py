@@ -0,0 +1,265 @@
+"""GUI-free evaluation of Smith chart component chains.
+
+The functions in this module take the same component dicts the GUI builds
+(``{"type": "L", "value": 10e-9, "orient": "series"}`` and friends) and
+return impedances as NumPy complex arrays, so they can be used from scripts
+and tests without a Tk window.
+"""
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from .adaptive import adaptive_sample
+    from .profiling import PROFILER
+except ImportError:  # pragma: no cover - direct execution fallback
+    from adaptive import adaptive_sample
+    from profiling import PROFILER
+
+PI2 = 2 * np.pi
+# default number of intermediate points for each component
+TRACE_STEPS = 200
+
+
+def _inv(z):
+    """Return ``1 / z`` mapping zero to infinity and infinity to zero."""
+    z = np.asarray(z, dtype=complex)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 1 / z
+    out = np.where(z == 0, complex(np.inf, 0), out)
+    return np.where(np.isinf(z), 0j, out)
+
+
+def to_gamma(z, z0: float = 50.0):
+    """Return the reflection coefficient of impedance(s) ``z``.
+
+    Infinite impedances map to ``1``.  The admittance chart uses ``-gamma``
+    since ``(y - 1) / (y + 1) == -(z - 1) / (z + 1)`` for normalised values.
+    """
+    z = np.asarray(z, dtype=complex)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        g = (z - z0) / (z + z0)
+    return np.where(np.isinf(z), 1 + 0j, g)
+
+
+def apply_component(z, comp: dict, freq, z0: float = 50.0, t=1.0,
+                    ref_freq: float | None = None) -> np.ndarray:
+    """Return the impedance after adding the fraction ``t`` of ``comp``.
+
+    ``z``, ``freq`` and ``t`` broadcast against each other, so the same call
+    evaluates a trace (array ``t``) or a frequency sweep (array ``freq``).
+    Line and stub lengths are electrical lengths in degrees at ``ref_freq``
+    and scale with frequency; without ``ref_freq`` they are taken as given.
+    """
+    freq = np.asarray(freq, dtype=float)
+    w = PI2 * freq
+    typ = comp.get("type")
+    series = comp.get("orient") == "series"
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if typ in ("L", "C", "R"):
+            val = comp["value"]
+            if typ == "L":
+                delta = 1j * w * val if series else -1j / (w * val)
+            elif typ == "C":
+                delta = -1j / (w * val) if series else 1j * w * val
+            else:
+                delta = val if series else 1 / val
+            if series:
+                return z + delta * t
+            return _inv(_inv(z) + delta * t)
+        if typ in ("TL", "STUB"):
+            theta = np.radians(comp["length"]) * t
+            if ref_freq is not None:
+                theta = theta * freq / ref_freq
+            tan = np.tan(theta)
+            zl = comp.get("z0", z0)
+            if typ == "TL":
+                return zl * (z + 1j * zl * tan) / (zl + 1j * z * tan)
+            if comp["kind"] == "short":
+                y_stub = _inv(1j * zl * tan)
+            else:
+                y_stub = 1j * tan / zl
+            return _inv(_inv(z) + y_stub)
+    return np.broadcast_arrays(np.asarray(z, dtype=complex), freq, t)[0].copy()
+
+
+def component_trace(z_start: complex, comp: dict, freq: float,
+                    z0: float = 50.0, steps: int = TRACE_STEPS,
+                    tol: float = 0.0) -> np.ndarray:
+    """Return impedances along the path of a single component.
+
+    Parameters
+    ----------
+    z_start:
+        Impedance seen before the component is added.
+    comp:
+        Component dict as produced by :class:`~smithpy.dialogs.ComponentDialog`.
+    freq:
+        Frequency in Hz.
+    z0:
+        System reference impedance, used for lines without their own ``z0``.
+    steps:
+        Number of evenly spaced points; the last point is the impedance
+        after the full component value.
+    tol:
+        If positive, sample adaptively instead so that the polyline through
+        the reflection coefficients deviates less than ``tol`` from the
+        path (see :func:`smithpy.adaptive.adaptive_sample`).
+    """
+    with PROFILER.span("compute_trace"):
+        if tol > 0:
+            t, _ = adaptive_sample(
+                lambda t: to_gamma(apply_component(z_start, comp, freq, z0, t), z0),
+                0.0, 1.0, tol)
+            t = t[1:]
+        else:
+            t = np.arange(1, steps + 1) / steps
+        PROFILER.count("points computed", t.size)
+        return apply_component(z_start, comp, freq, z0, t)
+
+
+def evaluate_chain(components, za: complex, z0: float = 50.0,
+                   freq: float = 1e9, steps: int = TRACE_STEPS,
+                   tol: float = 0.0) -> list[np.ndarray]:
+    """Return the trace of every component in ``components``.
+
+    The chain starts at the load ``za`` and each component starts where the
+    previous one ended.  The result holds one complex array per component,
+    of length ``steps`` unless ``tol`` selects adaptive sampling.
+    """
+    traces = []
+    z = complex(za)
+    for comp in components:
+        trace = component_trace(z, comp, freq, z0, steps, tol)
+        traces.append(trace)
+        z = complex(trace[-1])
+    return traces
+
+
+def component_key(comp: dict) -> tuple:
+    """Return a hashable key of the fields that affect a component's trace."""
+    return (
+        comp.get("type"),
+        comp.get("orient"),
+        comp.get("value"),
+        comp.get("length"),
+        comp.get("z0"),
+        comp.get("kind"),
+    )
+
+
+class ChainCache:
+    """Prefix cache of component traces for repeated chain evaluation.
+
+    Each entry stores the key, start impedance and trace of one component.
+    An entry is only valid while every component before it is unchanged, so
+    editing component ``k`` recomputes components ``k..N`` and reuses the
+    rest.  Changing ``za``, ``z0``, ``freq``, ``steps`` or ``tol`` drops all
+    entries.  The cache may be shared with background jobs; evaluations are
+    serialized by a lock.
+    """
+
+    def __init__(self):
+        self._settings = None
+        self._entries: list[tuple[tuple, complex, np.ndarray]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, index: int = 0) -> None:
+        """Drop the cached traces of component ``index`` and all after it."""
+        with self._lock:
+            del self._entries[index:]
+
+    def evaluate(self, components, za: complex, z0: float = 50.0,
+                 freq: float = 1e9, steps: int = TRACE_STEPS,
+                 tol: float = 0.0, progress=None) -> list[np.ndarray]:
+        """Return the same traces as :func:`evaluate_chain`, using the cache.
+
+        The returned arrays are shared with the cache and read-only.
+        ``progress(fraction)`` is called after each component.
+        """
+        with self._lock:
+            return self._evaluate(components, za, z0, freq, steps, tol, progress)
+
+    def _evaluate(self, components, za, z0, freq, steps, tol, progress):
+        settings = (complex(za), z0, freq, steps, tol)
+        if settings != self._settings:
+            self._settings = settings
+            self._entries.clear()
+        traces = []
+        z = complex(za)
+        for i, comp in enumerate(components):
+            key = component_key(comp)
+            if i < len(self._entries) and self._entries[i][0] == key:
+                trace = self._entries[i][2]
+            else:
+                del self._entries[i:]
+                trace = component_trace(z, comp, freq, z0, steps, tol)
+                trace.flags.writeable = False
+                self._entries.append((key, z, trace))
+            traces.append(trace)
+            z = complex(trace[-1])
+            if progress is not None:
+                progress((i + 1) / len(components))
+        return traces
+
+
+def sweep_frequencies(start: float, stop: float, points: int,
+                      scale: str = "linear") -> np.ndarray:
+    """Return ``points`` frequencies from ``start`` to ``stop`` in Hz.
+
+    ``scale`` is ``"linear"`` or ``"log"``.
+    """
+    if points < 1 or start <= 0 or stop < start:
+        raise ValueError("invalid sweep range")
+    if scale == "log":
+        return np.geomspace(start, stop, points)
+    if scale != "linear":
+        raise ValueError(f"unknown sweep scale: {scale}")
+    return np.linspace(start, stop, points)
+
+
+def match_metrics(z, z0: float = 50.0) -> dict:
+    """Return reflection and matching figures for impedance(s) ``z``.
+
+    The dict holds arrays ``gamma``, ``return_loss`` and ``mismatch_loss``
+    (both in dB, positive) and ``vswr``.
+    """
+    gamma = to_gamma(z, z0)
+    mag = np.minimum(np.abs(gamma), 1.0)
+    with np.errstate(divide="ignore"):
+        return_loss = -20 * np.log10(mag)
+        mismatch_loss = -10 * np.log10(1 - mag ** 2)
+        vswr = (1 + mag) / (1 - mag)
+    return {
+        "gamma": gamma,
+        "return_loss": return_loss,
+        "vswr": vswr,
+        "mismatch_loss": mismatch_loss,
+    }
+
+
+def chain_points(components, za: complex, z0: float = 50.0,
+                 freq: float = 1e9, steps: int = TRACE_STEPS,
+                 tol: float = 0.0) -> np.ndarray:
+    """Return ``za`` followed by all trace points as one complex array."""
+    traces = evaluate_chain(components, za, z0, freq, steps, tol)
+    return np.concatenate([np.array([za], dtype=complex), *traces])
+
+
+__all__ = [
+    "TRACE_STEPS",
+    "to_gamma",
+    "apply_component",
+    "component_trace",
+    "evaluate_chain",
+    "component_key",
+    "ChainCache",
+    "sweep_frequencies",
+    "match_metrics",
+    "chain_points",
+]
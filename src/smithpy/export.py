@@ -0,0 +1,143 @@
+"""Streaming export of network responses to Touchstone and NumPy files.
+
+The response is computed and written one chunk of frequencies at a time,
+so exporting millions of points never holds more than one chunk of data
+or text in memory.
+"""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from .engine import to_gamma
+    from .network import chain_response
+except ImportError:  # pragma: no cover - direct execution fallback
+    from engine import to_gamma
+    from network import chain_response
+
+# number of frequencies evaluated and written at once
+CHUNK_POINTS = 65536
+# record layout of .npy/.npz exports
+RESPONSE_DTYPE = np.dtype([("freq", "<f8"), ("z", "<c16"), ("s11", "<c16")])
+EXPORT_FORMATS = (".s1p", ".npy", ".npz")
+
+
+def frequency_chunks(start: float, stop: float, points: int, scale: str = "linear",
+                     chunk: int = CHUNK_POINTS):
+    """Yield the frequencies of a sweep in chunks without building the full array.
+
+    The values match :func:`smithpy.engine.sweep_frequencies`.
+    """
+    if points < 1 or start <= 0 or stop < start:
+        raise ValueError("invalid sweep range")
+    if scale not in ("linear", "log"):
+        raise ValueError(f"unknown sweep scale: {scale}")
+    last = max(points - 1, 1)
+    for first in range(0, points, chunk):
+        frac = np.arange(first, min(first + chunk, points)) / last
+        if scale == "log":
+            yield start * (stop / start) ** frac
+        else:
+            yield start + (stop - start) * frac
+
+
+def response_chunks(components, za, z0: float, freq_chunks, ref_freq: float | None = None):
+    """Yield ``(freqs, z_in)`` for each chunk of frequencies.
+
+    ``za`` is a scalar impedance or a callable returning the load impedance
+    for an array of frequencies (e.g. ``Touchstone.impedance_at``).
+    """
+    for freqs in freq_chunks:
+        load = za(freqs) if callable(za) else za
+        yield freqs, chain_response(components, load, z0, freqs, ref_freq)
+
+
+def _records(freqs, z, z0) -> np.ndarray:
+    rec = np.empty(freqs.size, dtype=RESPONSE_DTYPE)
+    rec["freq"] = freqs
+    rec["z"] = z
+    rec["s11"] = to_gamma(z, z0)
+    return rec
+
+
+def write_s1p(fh, chunks, z0: float = 50.0) -> int:
+    """Write ``(freqs, z_in)`` chunks as a one-port Touchstone file.
+
+    Returns the number of frequencies written.
+    """
+    fh.write("! Input reflection exported by smithpy\n")
+    fh.write(f"# HZ S RI R {z0:g}\n")
+    count = 0
+    for freqs, z in chunks:
+        s11 = to_gamma(z, z0)
+        rows = np.column_stack([freqs, s11.real, s11.imag])
+        fh.write(("%.10g %.10g %.10g\n" * len(rows)) % tuple(rows.ravel()))
+        count += len(rows)
+    return count
+
+
+def _write_npy_stream(fh, chunks, z0: float, points: int) -> int:
+    header = {
+        "descr": np.lib.format.dtype_to_descr(RESPONSE_DTYPE),
+        "fortran_order": False,
+        "shape": (points,),
+    }
+    np.lib.format.write_array_header_2_0(fh, header)
+    count = 0
+    for freqs, z in chunks:
+        fh.write(_records(freqs, z, z0).tobytes())
+        count += freqs.size
+    if count != points:
+        raise ValueError(f"expected {points} points, got {count}")
+    return count
+
+
+def write_npy(path, chunks, z0: float, points: int) -> int:
+    """Write chunks as a ``.npy`` record array with fields freq, z, s11."""
+    with open(path, "wb") as fh:
+        return _write_npy_stream(fh, chunks, z0, points)
+
+
+def write_npz(path, chunks, z0: float, points: int) -> int:
+    """Write chunks as a compressed ``.npz`` holding the ``response`` array."""
+    import zipfile  # only needed here; keeps batch start-up light
+    # fast compression level; the float data compresses poorly anyway
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        with zf.open("response.npy", "w", force_zip64=True) as fh:
+            return _write_npy_stream(fh, chunks, z0, points)
+
+
+def export_response(path, components, za, z0: float, start: float, stop: float,
+                    points: int, scale: str = "linear", ref_freq: float | None = None,
+                    chunk: int = CHUNK_POINTS) -> int:
+    """Evaluate a chain over a sweep and stream the result to ``path``.
+
+    The format follows the extension: ``.s1p`` (Touchstone, RI), ``.npy``
+    or ``.npz``.  Returns the number of frequencies written.
+    """
+    ext = os.path.splitext(os.fspath(path))[1].lower()
+    if ext not in EXPORT_FORMATS:
+        raise ValueError(f"unsupported export format: {ext or path}")
+    chunks = response_chunks(components, za, z0,
+                             frequency_chunks(start, stop, points, scale, chunk), ref_freq)
+    if ext == ".s1p":
+        with open(path, "w", encoding="utf-8") as fh:
+            return write_s1p(fh, chunks, z0)
+    if ext == ".npy":
+        return write_npy(path, chunks, z0, points)
+    return write_npz(path, chunks, z0, points)
+
+
+__all__ = [
+    "CHUNK_POINTS",
+    "RESPONSE_DTYPE",
+    "EXPORT_FORMATS",
+    "frequency_chunks",
+    "response_chunks",
+    "write_s1p",
+    "write_npy",
+    "write_npz",
+    "export_response",
+]
@@ -0,0 +1,151 @@
+"""Background jobs for computations that would block the Tk main loop.
+
+Jobs run on a thread pool; NumPy releases the GIL in its array kernels, so
+the window keeps handling events while the engine is busy.  Workers never
+touch Tk: they post their results, progress and errors to a queue which
+the main thread drains with ``after``.  Jobs are identified by name and
+submitting a job cancels the previous one of the same name, whose result
+is then dropped as stale even if it still arrives.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# interval in which the result queue is polled while jobs are running
+POLL_MS = 20
+# worker threads; jobs of the same name supersede each other, so few suffice
+WORKERS = 2
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when it has been cancelled."""
+
+
+class CancelToken:
+    """Cancellation flag and progress channel handed to every job."""
+
+    def __init__(self, report=None):
+        self._event = threading.Event()
+        self._report = report
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def check(self) -> None:
+        """Raise :class:`JobCancelled` if the job has been cancelled."""
+        if self._event.is_set():
+            raise JobCancelled()
+
+    def progress(self, fraction: float) -> None:
+        """Report progress between 0 and 1; also a cancellation point."""
+        self.check()
+        if self._report is not None:
+            self._report(fraction)
+
+
+class JobManager:
+    """Run named jobs in the background and deliver results on the Tk thread.
+
+    Parameters
+    ----------
+    widget:
+        Tk widget used for ``after`` polling.
+    workers:
+        Number of worker threads.
+    poll_ms:
+        Polling interval of the result queue while jobs are pending.
+    """
+
+    def __init__(self, widget, workers: int = WORKERS, poll_ms: int = POLL_MS):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="smithpy-job")
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        # name -> (generation, token, callback, error, progress) of the latest job
+        self._jobs: dict[str, tuple] = {}
+        self._generation = 0
+        self._poll_job = None
+
+    @property
+    def pending(self) -> set[str]:
+        """Names of the jobs whose results have not been delivered yet."""
+        return set(self._jobs)
+
+    def submit(self, name: str, func, *args, callback=None, error=None, progress=None):
+        """Run ``func(token, *args)`` on a worker thread.
+
+        ``callback(result)``, ``error(exc)`` and ``progress(fraction)`` are
+        called on the Tk thread.  A running job of the same ``name`` is
+        cancelled and its result discarded.  Returns the job's token.
+        """
+        self.cancel(name)
+        self._generation += 1
+        gen = self._generation
+        token = CancelToken(lambda frac: self._queue.put(("progress", name, gen, frac)))
+        self._jobs[name] = (gen, token, callback, error, progress)
+        self._executor.submit(self._run, name, gen, token, func, args)
+        self._schedule()
+        return token
+
+    def _run(self, name, gen, token, func, args) -> None:
+        try:
+            result = func(token, *args)
+        except JobCancelled:
+            self._queue.put(("cancelled", name, gen, None))
+        except Exception as exc:  # delivered to the error callback
+            self._queue.put(("error", name, gen, exc))
+        else:
+            self._queue.put(("done", name, gen, result))
+
+    def _schedule(self) -> None:
+        if self._poll_job is None:
+            self._poll_job = self.widget.after(self.poll_ms, self.poll)
+
+    def poll(self) -> None:
+        """Deliver all queued messages of current jobs, dropping stale ones."""
+        self._poll_job = None
+        while True:
+            try:
+                kind, name, gen, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            job = self._jobs.get(name)
+            if job is None or job[0] != gen:
+                continue
+            _, _, callback, error, progress = job
+            if kind == "progress":
+                if progress is not None:
+                    progress(value)
+                continue
+            del self._jobs[name]
+            if kind == "done" and callback is not None:
+                callback(value)
+            elif kind == "error" and error is not None:
+                error(value)
+        if self._jobs:
+            self._schedule()
+
+    def cancel(self, name: str | None = None) -> None:
+        """Cancel job ``name`` (or all jobs) and drop their pending results."""
+        names = [name] if name is not None else list(self._jobs)
+        for n in names:
+            job = self._jobs.pop(n, None)
+            if job is not None:
+                job[1].cancel()
+
+    def shutdown(self) -> None:
+        """Cancel all jobs and stop the workers without waiting for them."""
+        self.cancel()
+        if self._poll_job is not None:
+            self.widget.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._executor.shutdown(wait=False)
+
+
+__all__ = ["POLL_MS", "JobCancelled", "CancelToken", "JobManager"]
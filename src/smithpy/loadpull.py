@@ -0,0 +1,126 @@
+"""Evaluate one matching network against many load impedances.
+
+Load-pull contours, antenna impedances over temperature or any other set of
+loads are read as one complex array and terminated on the chain in a single
+vectorized pass: the ABCD matrix of the chain is built once and
+:func:`smithpy.network.input_impedance` broadcasts it over all loads.
+
+Load lists are plain text with one load per line, either as a complex
+number (``25+10j``) or as real and imaginary part in two columns separated
+by whitespace, commas, semicolons or tabs (CSV).  ``#`` starts a comment and
+a header line before the first load is skipped.
+"""
+from __future__ import annotations
+
+import re
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from .engine import _inv, match_metrics
+    from .network import chain_abcd, input_impedance
+    from .tolerance import tolerance_yield
+except ImportError:  # pragma: no cover - direct execution fallback
+    from engine import _inv, match_metrics
+    from network import chain_abcd, input_impedance
+    from tolerance import tolerance_yield
+
+_SEPARATOR_RE = re.compile(r"[,;\t]")
+# letters other than the exponent and imaginary unit mark a header line
+_HEADER_RE = re.compile(r"[a-df-ik-z]", re.IGNORECASE)
+
+
+def _parse_load(text: str) -> complex:
+    if _SEPARATOR_RE.search(text):
+        fields = [f.strip() for f in _SEPARATOR_RE.split(text)]
+    else:
+        fields = text.split()
+        if len(fields) == 2:
+            try:
+                return complex(float(fields[0]), float(fields[1]))
+            except ValueError:
+                pass
+        # spaces around a sign are part of one value ("25 + 10j", "25 +10j")
+        if all(a.endswith(("+", "-")) or b.startswith(("+", "-"))
+               for a, b in zip(fields, fields[1:])):
+            fields = ["".join(fields)]
+    fields = [f.replace(" ", "") for f in fields if f.strip()]
+    if len(fields) == 1:
+        return complex(fields[0])
+    if len(fields) == 2:
+        return complex(float(fields[0]), float(fields[1]))
+    raise ValueError(f"expected one complex value or two columns, got {len(fields)}")
+
+
+def parse_loads(lines, admittance: bool = False) -> np.ndarray:
+    """Return the loads of a list given as a string or an iterable of lines.
+
+    With ``admittance`` the values are admittances in siemens and are
+    converted to impedances.
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    loads = []
+    for number, text in enumerate(lines, 1):
+        text = text.split("#", 1)[0].strip()
+        if not text:
+            continue
+        try:
+            loads.append(_parse_load(text))
+        except ValueError as exc:
+            if not loads and _HEADER_RE.search(text):
+                continue
+            raise ValueError(f"line {number}: {exc}") from None
+    loads = np.array(loads, dtype=complex)
+    return _inv(loads) if admittance else loads
+
+
+def read_loads(path, admittance: bool = False) -> np.ndarray:
+    """Read a load list file (see :func:`parse_loads`)."""
+    with open(path, encoding="utf-8") as fh:
+        return parse_loads(fh, admittance)
+
+
+def load_response(components, loads, z0: float = 50.0, freq=1e9,
+                  ref_freq: float | None = None) -> np.ndarray:
+    """Return the impedance at the end of the chain for every load.
+
+    ``freq`` may be an array broadcasting against ``loads``, e.g.
+    ``loads[:, None]`` and a row of frequencies give one row per load.
+    """
+    return input_impedance(chain_abcd(components, freq, z0, ref_freq), loads)
+
+
+def load_statistics(z, z0: float = 50.0, vswr: float | None = None) -> dict:
+    """Return summary figures of the matched impedances ``z``.
+
+    The dict holds ``count``, the minimum, median and maximum return loss
+    (``rl_min``, ``rl_median``, ``rl_max``) and mismatch loss maximum
+    ``ml_max`` in dB, ``vswr_median`` and ``vswr_max`` and, if ``vswr`` is
+    given, the fraction ``yield`` of loads meeting it.
+    """
+    z = np.asarray(z, dtype=complex).ravel()
+    stats = {"count": z.size}
+    if not z.size:
+        return stats
+    m = match_metrics(z, z0)
+    rl = m["return_loss"]
+    stats.update(
+        rl_min=float(rl.min()),
+        rl_median=float(np.median(rl)),
+        rl_max=float(rl.max()),
+        ml_max=float(m["mismatch_loss"].max()),
+        vswr_median=float(np.median(m["vswr"])),
+        vswr_max=float(m["vswr"].max()),
+    )
+    if vswr is not None:
+        stats["yield"] = tolerance_yield(z, z0, vswr=vswr)
+    return stats
+
+
+__all__ = [
+    "parse_loads",
+    "read_loads",
+    "load_response",
+    "load_statistics",
+]
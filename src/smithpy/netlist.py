@@ -0,0 +1,258 @@
+"""Import component chains from ladder and SPICE netlists.
+
+Ladder netlists list one component per line, from the load towards the
+source like the component list of the GUI::
+
+    # kind  orientation  value  [line z0]
+    L    series  10nH
+    C    shunt   2.2p
+    R    shunt   4.7k
+    TL   45      75        # electrical length in degrees (or 0.125λ), z0
+    STUB open    30   50
+    STUB short   0.1λ
+
+SPICE netlists may use R, L and C elements and lossless lines (T with
+``Z0=`` and ``TD=`` or ``F=``/``NL=``).  Elements between two nodes are
+series elements, elements to ground (``0`` or ``gnd``) are shunt elements
+and a line with one port shorted or left open is a stub.  The elements must
+form a ladder.  The source end is the node of a V or I source if there is
+one, otherwise the end of the ladder named first in the file.  As in SPICE,
+the first line is always the title.
+
+Files are read line by line and the chain is assembled once at the end.
+"""
+from __future__ import annotations
+
+import os
+import re
+
+try:  # allow running as a module or a script
+    from .design import line, lumped
+    from .parsing import parse_spice_value, parse_value
+except ImportError:  # pragma: no cover - direct execution fallback
+    from design import line, lumped
+    from parsing import parse_spice_value, parse_value
+
+NETLIST_FORMATS = ("ladder", "spice")
+# file extensions read as SPICE; anything else is a ladder netlist
+SPICE_EXTENSIONS = (".cir", ".sp", ".spi", ".spice", ".net", ".ckt")
+GROUND_NODES = ("0", "gnd")
+LUMPED_UNITS = {"L": "H", "C": "F", "R": "ohm"}
+
+_PARAM_RE = re.compile(r"(\w+)\s*=\s*(\S+)")
+
+
+def _length(text: str) -> float:
+    text = text.strip()
+    for suffix in ("λ", "lambda"):
+        if text.endswith(suffix):
+            return float(text[: -len(suffix)]) * 360.0
+    return float(text.replace("°", ""))
+
+
+def _ladder_component(tokens: list, z0: float) -> dict:
+    kind = tokens[0].upper()
+    if kind in LUMPED_UNITS:
+        orient = tokens[1].lower()
+        if orient not in ("series", "shunt"):
+            raise ValueError(f"invalid orientation: {tokens[1]!r}")
+        return lumped(kind, parse_value(tokens[2], LUMPED_UNITS[kind]), orient)
+    if kind == "TL":
+        return line("TL", _length(tokens[1]), float(tokens[2]) if len(tokens) > 2 else z0)
+    if kind == "STUB":
+        stub = tokens[1].lower()
+        if stub not in ("open", "short"):
+            raise ValueError(f"invalid stub kind: {tokens[1]!r}")
+        return line("STUB", _length(tokens[2]), float(tokens[3]) if len(tokens) > 3 else z0,
+                    stub)
+    raise ValueError(f"unknown component: {tokens[0]!r}")
+
+
+def read_ladder(lines, z0: float = 50.0) -> list[dict]:
+    """Return the chain of a ladder netlist given as an iterable of lines."""
+    components = []
+    for number, text in enumerate(lines, 1):
+        tokens = text.split("#", 1)[0].split()
+        if not tokens:
+            continue
+        try:
+            components.append(_ladder_component(tokens, z0))
+        except IndexError:
+            raise ValueError(f"line {number}: too few fields") from None
+        except ValueError as exc:
+            raise ValueError(f"line {number}: {exc}") from None
+    return components
+
+
+def _logical_lines(lines, start: int = 1):
+    """Yield ``(line number, text)`` with SPICE continuation lines joined."""
+    pending = None
+    for number, text in enumerate(lines, start):
+        text = re.split(r"[;$]", text, 1)[0].strip()
+        if text.startswith("+"):
+            if pending is None:
+                raise ValueError(f"line {number}: continuation without a statement")
+            pending = (pending[0], f"{pending[1]} {text[1:]}")
+            continue
+        if pending is not None:
+            yield pending
+            pending = None
+        if text and not text.startswith("*"):
+            pending = (number, text)
+    if pending is not None:
+        yield pending
+
+
+def _line_length(params: dict, ref_freq: float) -> float:
+    if "td" in params:
+        return 360.0 * parse_spice_value(params["td"]) * ref_freq
+    if "f" in params:
+        nl = parse_spice_value(params.get("nl", "0.25"))
+        return 360.0 * nl * ref_freq / parse_spice_value(params["f"])
+    raise ValueError("line needs TD= or F=")
+
+
+class _Ladder:
+    """Elements of a SPICE netlist collected for assembling the chain."""
+
+    def __init__(self):
+        self.series = {}  # node -> [(other node, component)]
+        self.shunt = {}  # node -> [component]
+        self.lines = []  # (port 1 node, port 2 node, (length, z0))
+        self.uses = {}  # node -> number of element terminals
+        self.order = {}  # node -> first appearance
+        self.sources = []
+
+    def node(self, name: str) -> str | None:
+        name = name.lower()
+        if name in GROUND_NODES:
+            return None
+        self.uses[name] = self.uses.get(name, 0) + 1
+        self.order.setdefault(name, len(self.order))
+        return name
+
+    def add(self, a, b, comp: dict) -> None:
+        if a is None and b is None:
+            return
+        if a is None or b is None:
+            comp["orient"] = "shunt"
+            self.shunt.setdefault(a or b, []).append(comp)
+            return
+        self.series.setdefault(a, []).append((b, comp))
+        self.series.setdefault(b, []).append((a, comp))
+
+    def resolve_lines(self) -> None:
+        for a, b, (length, zl) in self.lines:
+            open_a = a is not None and self.uses[a] == 1
+            open_b = b is not None and self.uses[b] == 1
+            if a is not None and b is not None and not (open_a or open_b):
+                self.add(a, b, line("TL", length, zl))
+                continue
+            # a port that is shorted or connected to nothing else makes a stub
+            end, far = (b, a) if a is None or open_a else (a, b)
+            if end is None or self.uses[end] == 1:
+                raise ValueError("line is not connected to the ladder")
+            self.shunt.setdefault(end, []).append(
+                line("STUB", length, zl, "short" if far is None else "open"))
+
+    def chain(self) -> list[dict]:
+        """Return the components from the load end to the source end."""
+        self.resolve_lines()
+        nodes = set(self.series) | set(self.shunt)
+        if not nodes:
+            return []
+        ends = [n for n in nodes if len(self.series.get(n, ())) < 2]
+        if any(len(edges) > 2 for edges in self.series.values()) or not 1 <= len(ends) <= 2:
+            raise ValueError("the network is not a ladder")
+        sources = [n for n in self.sources if n in ends]
+        source = sources[0] if sources else min(ends, key=self.order.__getitem__)
+        load = next((n for n in ends if n != source), source)
+        chain = []
+        previous, node = None, load
+        while True:
+            chain.extend(self.shunt.get(node, ()))
+            edges = [(n, c) for n, c in self.series.get(node, ()) if n != previous]
+            if not edges:
+                break
+            previous, (node, comp) = node, edges[0]
+            chain.append(comp)
+        total = (sum(map(len, self.shunt.values()))
+                 + sum(map(len, self.series.values())) // 2)
+        if len(chain) != total:
+            raise ValueError("the network is not a single ladder")
+        return chain
+
+
+def read_spice(lines, z0: float = 50.0, ref_freq: float = 1e9) -> list[dict]:
+    """Return the chain of a SPICE netlist given as an iterable of lines.
+
+    ``ref_freq`` is the frequency the electrical lengths of the returned
+    lines refer to, as the ``freq`` of the GUI.
+    """
+    ladder = _Ladder()
+    lines = iter(lines)
+    next(lines, None)  # title line
+    for number, text in _logical_lines(lines, 2):
+        if text.startswith("."):
+            if text.lower().startswith(".end") and not text.lower().startswith(".ends"):
+                break
+            if text.lower().startswith((".subckt", ".include", ".lib")):
+                raise ValueError(f"line {number}: {text.split()[0]} is not supported")
+            continue
+        tokens = text.split()
+        kind = tokens[0][0].upper()
+        try:
+            if kind in LUMPED_UNITS:
+                a, b = ladder.node(tokens[1]), ladder.node(tokens[2])
+                ladder.add(a, b, lumped(kind, parse_spice_value(tokens[3]), "series"))
+            elif kind == "T":
+                ports = [ladder.node(t) for t in tokens[1:5]]
+                if ports[1] is not None or ports[3] is not None:
+                    raise ValueError("line return terminals must be grounded")
+                params = {k.lower(): v for k, v in _PARAM_RE.findall(" ".join(tokens[5:]))}
+                zl = parse_spice_value(params["z0"]) if "z0" in params else z0
+                ladder.lines.append((ports[0], ports[2], (_line_length(params, ref_freq), zl)))
+            elif kind in ("V", "I"):
+                ladder.sources.extend(n for n in map(ladder.node, tokens[1:3]) if n)
+            else:
+                raise ValueError(f"unsupported element {tokens[0]!r}")
+        except IndexError:
+            raise ValueError(f"line {number}: too few fields") from None
+        except (KeyError, ValueError) as exc:
+            raise ValueError(f"line {number}: {exc}") from None
+    # source terminals do not count as connections of the ladder
+    for n in ladder.sources:
+        ladder.uses[n] -= 1
+    return ladder.chain()
+
+
+def netlist_format(path) -> str:
+    """Return ``"spice"`` or ``"ladder"`` from the file extension of ``path``."""
+    ext = os.path.splitext(os.fspath(path))[1].lower()
+    return "spice" if ext in SPICE_EXTENSIONS else "ladder"
+
+
+def read_netlist(path, fmt: str | None = None, z0: float = 50.0,
+                 ref_freq: float = 1e9) -> list[dict]:
+    """Read the chain of the netlist file ``path``.
+
+    ``fmt`` is ``"ladder"`` or ``"spice"``; by default it follows the file
+    extension (see :data:`SPICE_EXTENSIONS`).
+    """
+    fmt = fmt or netlist_format(path)
+    if fmt not in NETLIST_FORMATS:
+        raise ValueError(f"unknown netlist format: {fmt}")
+    with open(path, encoding="utf-8") as fh:
+        if fmt == "spice":
+            return read_spice(fh, z0, ref_freq)
+        return read_ladder(fh, z0)
+
+
+__all__ = [
+    "NETLIST_FORMATS",
+    "SPICE_EXTENSIONS",
+    "read_ladder",
+    "read_spice",
+    "netlist_format",
+    "read_netlist",
+]
@@ -0,0 +1,218 @@
+"""Two-port ABCD and S-parameter description of component chains.
+
+Every component is a 2x2 ABCD matrix, stacked along any leading axes
+(frequency, parameter value, design), and a chain is the matrix product of
+its components.  The chain runs from the load (first component) towards
+the source, so the product is taken in reverse list order to get the
+network as seen from the source port.
+"""
+from __future__ import annotations
+
+from functools import reduce
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from .adaptive import adaptive_sample
+    from .engine import PI2, _inv, to_gamma
+except ImportError:  # pragma: no cover - direct execution fallback
+    from adaptive import adaptive_sample
+    from engine import PI2, _inv, to_gamma
+
+
+def _matrix(a, b, c, d) -> np.ndarray:
+    a, b, c, d = np.broadcast_arrays(*(np.asarray(x, dtype=complex) for x in (a, b, c, d)))
+    out = np.empty(a.shape + (2, 2), dtype=complex)
+    out[..., 0, 0] = a
+    out[..., 0, 1] = b
+    out[..., 1, 0] = c
+    out[..., 1, 1] = d
+    return out
+
+
+def series_abcd(z) -> np.ndarray:
+    """Return the ABCD matrix of a series impedance ``z``."""
+    return _matrix(1, z, 0, 1)
+
+
+def shunt_abcd(y) -> np.ndarray:
+    """Return the ABCD matrix of a shunt admittance ``y``."""
+    return _matrix(1, 0, y, 1)
+
+
+def line_abcd(theta, zl) -> np.ndarray:
+    """Return the ABCD matrix of a lossless line of electrical length ``theta``."""
+    cos = np.cos(theta)
+    sin = np.sin(theta)
+    return _matrix(cos, 1j * zl * sin, 1j * sin / zl, cos)
+
+
+def component_abcd(comp: dict, freq, z0: float = 50.0,
+                   ref_freq: float | None = None) -> np.ndarray:
+    """Return the ABCD matrix of ``comp`` with shape ``broadcast + (2, 2)``.
+
+    ``freq`` and the numeric fields of ``comp`` (``value``, ``length``,
+    ``z0``) may be arrays; they broadcast against each other, which stacks
+    the matrices over frequency and parameter values in one call.  Line
+    lengths are electrical degrees at ``ref_freq`` as in
+    :func:`smithpy.engine.apply_component`.
+    """
+    freq = np.asarray(freq, dtype=float)
+    w = PI2 * freq
+    typ = comp.get("type")
+    series = comp.get("orient") == "series"
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if typ in ("L", "C", "R"):
+            val = np.asarray(comp["value"], dtype=float)
+            if typ == "L":
+                imm = 1j * w * val
+            elif typ == "C":
+                imm = _inv(1j * w * val)
+            else:
+                imm = val * np.ones_like(w)
+            return series_abcd(imm) if series else shunt_abcd(_inv(imm))
+        if typ in ("TL", "STUB"):
+            theta = np.radians(np.asarray(comp["length"], dtype=float))
+            if ref_freq is not None:
+                theta = theta * freq / ref_freq
+            else:
+                theta = theta * np.ones_like(freq)
+            zl = np.asarray(comp.get("z0", z0), dtype=float)
+            if typ == "TL":
+                return line_abcd(theta, zl)
+            tan = np.tan(theta)
+            if comp["kind"] == "short":
+                return shunt_abcd(_inv(1j * zl * tan))
+            return shunt_abcd(1j * tan / zl)
+    return _matrix(1, 0, 0, np.ones_like(w))
+
+
+def _matmul2(m, n) -> np.ndarray:
+    # written out because np.matmul is several times slower on 2x2 stacks
+    a1, b1, c1, d1 = m[..., 0, 0], m[..., 0, 1], m[..., 1, 0], m[..., 1, 1]
+    a2, b2, c2, d2 = n[..., 0, 0], n[..., 0, 1], n[..., 1, 0], n[..., 1, 1]
+    return _matrix(a1 * a2 + b1 * c2, a1 * b2 + b1 * d2,
+                   c1 * a2 + d1 * c2, c1 * b2 + d1 * d2)
+
+
+def cascade(matrices) -> np.ndarray:
+    """Return the product of ABCD matrices given from source to load."""
+    return reduce(_matmul2, matrices)
+
+
+def chain_abcd(components, freq, z0: float = 50.0,
+               ref_freq: float | None = None) -> np.ndarray:
+    """Return the ABCD matrix of a whole chain as seen from the source."""
+    freq = np.asarray(freq, dtype=float)
+    if not components:
+        return _matrix(1, 0, 0, np.ones_like(freq))
+    return cascade([component_abcd(c, freq, z0, ref_freq) for c in reversed(components)])
+
+
+def input_impedance(abcd, zl) -> np.ndarray:
+    """Return the impedance seen at port 1 with ``zl`` terminating port 2."""
+    a, b, c, d = abcd[..., 0, 0], abcd[..., 0, 1], abcd[..., 1, 0], abcd[..., 1, 1]
+    zl = np.asarray(zl, dtype=complex)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        den = c * zl + d
+        z = (a * zl + b) / den
+        z_open = a / c
+    z = np.where(np.isinf(zl), z_open, z)
+    return np.where((den == 0) & ~np.isinf(zl), complex(np.inf, 0), z)
+
+
+def chain_response(components, za, z0: float, freqs,
+                   ref_freq: float | None = None) -> np.ndarray:
+    """Return the impedance at the end of the chain for every frequency.
+
+    The chain is cascaded as one stack of ABCD matrices over all
+    frequencies and terminated with ``za`` (scalar or array broadcasting
+    against ``freqs``).
+    """
+    return input_impedance(chain_abcd(components, freqs, z0, ref_freq), za)
+
+
+def adaptive_response(components, za, z0: float, start: float, stop: float,
+                      tol: float, scale: str = "linear",
+                      ref_freq: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(freqs, z_in)`` of a sweep sampled adaptively in the Γ-plane.
+
+    Frequencies are refined where the locus turns sharply, e.g. around
+    resonances, until the polyline deviates less than ``tol`` from it.
+    ``za`` is a scalar impedance or a callable of the frequencies, and
+    ``scale`` (``"linear"`` or ``"log"``) sets the spacing of the initial
+    grid.
+    """
+    if start <= 0 or stop < start:
+        raise ValueError("invalid sweep range")
+    if scale not in ("linear", "log"):
+        raise ValueError(f"unknown sweep scale: {scale}")
+
+    def to_freq(u):
+        if scale == "log":
+            return start * (stop / start) ** u
+        return start + (stop - start) * u
+
+    def response(u):
+        freqs = to_freq(u)
+        return chain_response(components, za(freqs) if callable(za) else za, z0, freqs, ref_freq)
+
+    u, _ = adaptive_sample(lambda u: to_gamma(response(u), z0), 0.0, 1.0, tol)
+    return to_freq(u), response(u)
+
+
+def abcd_to_s(abcd, z0: float = 50.0) -> np.ndarray:
+    """Convert ABCD matrices to S-parameters referenced to ``z0``."""
+    a, b, c, d = abcd[..., 0, 0], abcd[..., 0, 1], abcd[..., 1, 0], abcd[..., 1, 1]
+    bz = b / z0
+    cz = c * z0
+    den = a + bz + cz + d
+    return _matrix(
+        (a + bz - cz - d) / den,
+        2 * (a * d - b * c) / den,
+        2 / den,
+        (-a + bz - cz + d) / den,
+    )
+
+
+def s_to_abcd(s, z0: float = 50.0) -> np.ndarray:
+    """Convert S-parameters referenced to ``z0`` to ABCD matrices.
+
+    This allows measured two-ports to be cascaded with :func:`cascade`.
+    """
+    s11, s12, s21, s22 = s[..., 0, 0], s[..., 0, 1], s[..., 1, 0], s[..., 1, 1]
+    den = 2 * s21
+    return _matrix(
+        ((1 + s11) * (1 - s22) + s12 * s21) / den,
+        z0 * ((1 + s11) * (1 + s22) - s12 * s21) / den,
+        ((1 - s11) * (1 - s22) - s12 * s21) / (den * z0),
+        ((1 - s11) * (1 + s22) + s12 * s21) / den,
+    )
+
+
+def vary_component(components, index: int, key: str, values, freq_axes: int = 1) -> list:
+    """Return a copy of ``components`` with ``key`` of one entry set to ``values``.
+
+    ``values`` gets ``freq_axes`` trailing axes so that evaluating the chain
+    over a frequency array stacks the results as ``(len(values), n_freq)``.
+    """
+    comps = list(components)
+    values = np.asarray(values, dtype=float).reshape((-1,) + (1,) * freq_axes)
+    comps[index] = {**comps[index], key: values}
+    return comps
+
+
+__all__ = [
+    "series_abcd",
+    "shunt_abcd",
+    "line_abcd",
+    "component_abcd",
+    "cascade",
+    "chain_abcd",
+    "input_impedance",
+    "chain_response",
+    "adaptive_response",
+    "abcd_to_s",
+    "s_to_abcd",
+    "vary_component",
+]
@@ -0,0 +1,179 @@
+"""Chart overlays computed on a pixel grid of reflection coefficients.
+
+Each overlay is evaluated with array math over the Γ of every pixel inside
+the unit circle and returned as an RGB image, which the GUI shows as one
+``PhotoImage`` instead of thousands of canvas items:
+
+* ``"vswr"``: rings of constant VSWR (|Γ|),
+* ``"q"``: contours of constant nodal Q = |X| / R,
+* ``"mismatch"``: heatmap of the mismatch loss of each point,
+* ``"response"``: heatmap of the return loss at the chain input when each
+  point of the chart is used as the load (a load-pull map of the network).
+
+Images are encoded as binary PPM, which Tk reads without extra libraries,
+and kept in an :class:`OverlayCache` keyed by the canvas size and every
+input of the overlay, so they are only recomputed when something changed.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from .engine import component_key, to_gamma
+    from .network import chain_abcd, input_impedance
+except ImportError:  # pragma: no cover - direct execution fallback
+    from engine import component_key, to_gamma
+    from network import chain_abcd, input_impedance
+
+OVERLAYS = ("vswr", "q", "mismatch", "response")
+VSWR_LEVELS = (1.5, 2.0, 3.0, 5.0)
+Q_LEVELS = (0.5, 1.0, 2.0, 5.0)
+# heatmap ranges in dB; values outside are clipped
+MISMATCH_RANGE = (0.0, 10.0)
+RESPONSE_RANGE = (0.0, 30.0)
+CONTOUR_COLOR = (70, 130, 180)
+BACKGROUND = (255, 255, 255)
+# light heatmap colours from low to high values, interpolated linearly
+HEAT_COLORS = np.array([
+    (255, 255, 255),
+    (255, 236, 179),
+    (255, 196, 140),
+    (244, 150, 150),
+    (210, 140, 220),
+], dtype=float)
+# number of rendered overlays kept per cache
+CACHE_SIZE = 8
+
+
+def gamma_grid(width: int, height: int, center, radius: float):
+    """Return the Γ of every pixel and the mask of pixels inside |Γ| <= 1."""
+    cx, cy = center
+    x = (np.arange(width) + 0.5 - cx) / radius
+    y = (cy - np.arange(height) - 0.5) / radius
+    gamma = x[None, :] + 1j * y[:, None]
+    return gamma, np.abs(gamma) <= 1
+
+
+def contour_mask(field: np.ndarray, levels) -> np.ndarray:
+    """Return the pixels where ``field`` crosses one of ``levels``.
+
+    A pixel is on a contour when its level band differs from the band of
+    its right or lower neighbour, which gives lines about one pixel wide.
+    """
+    band = np.digitize(np.nan_to_num(field, nan=-np.inf), levels)
+    valid = ~np.isnan(field)
+    edge = np.zeros(field.shape, dtype=bool)
+    edge[:, :-1] |= (band[:, :-1] != band[:, 1:]) & valid[:, 1:]
+    edge[:-1, :] |= (band[:-1, :] != band[1:, :]) & valid[1:, :]
+    return edge & valid
+
+
+def heat_colors(values: np.ndarray, low: float, high: float) -> np.ndarray:
+    """Map ``values`` to RGB with :data:`HEAT_COLORS`; NaN maps to the background."""
+    frac = np.clip((np.nan_to_num(values, nan=low) - low) / (high - low), 0.0, 1.0)
+    pos = frac * (len(HEAT_COLORS) - 1)
+    index = np.minimum(pos.astype(int), len(HEAT_COLORS) - 2)
+    t = (pos - index)[..., None]
+    rgb = HEAT_COLORS[index] * (1 - t) + HEAT_COLORS[index + 1] * t
+    rgb[np.isnan(values)] = BACKGROUND
+    return rgb.astype(np.uint8)
+
+
+def overlay_field(kind: str, gamma: np.ndarray, admittance: bool = False,
+                  components=(), z0: float = 50.0, freq: float = 1e9):
+    """Return the scalar field drawn by overlay ``kind`` at points ``gamma``.
+
+    On the admittance chart the points are admittances (Γ_y = -Γ), which
+    only matters for ``"response"``.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if kind == "vswr":
+            mag = np.abs(gamma)
+            return (1 + mag) / (1 - mag)
+        if kind == "q":
+            w = (1 + gamma) / (1 - gamma)
+            return np.abs(w.imag) / w.real
+        if kind == "mismatch":
+            return -10 * np.log10(1 - np.abs(gamma) ** 2)
+        if kind == "response":
+            g = -gamma if admittance else gamma
+            zl = z0 * (1 + g) / (1 - g)
+            abcd = chain_abcd(list(components), freq, z0)
+            z_in = input_impedance(abcd, zl)
+            return -20 * np.log10(np.maximum(np.abs(to_gamma(z_in, z0)), 1e-12))
+    raise ValueError(f"unknown overlay: {kind}")
+
+
+def render_overlay(kind: str, width: int, height: int, center, radius: float,
+                   admittance: bool = False, components=(), z0: float = 50.0,
+                   freq: float = 1e9) -> np.ndarray:
+    """Return the overlay as a ``(height, width, 3)`` uint8 RGB image."""
+    gamma, inside = gamma_grid(width, height, center, radius)
+    field = overlay_field(kind, gamma, admittance, components, z0, freq)
+    field = np.where(inside, field, np.nan)
+    if kind in ("vswr", "q"):
+        levels = VSWR_LEVELS if kind == "vswr" else Q_LEVELS
+        rgb = np.empty((height, width, 3), dtype=np.uint8)
+        rgb[...] = BACKGROUND
+        rgb[contour_mask(field, levels)] = CONTOUR_COLOR
+        return rgb
+    # higher losses and better matches (higher return loss) get stronger colours
+    low, high = MISMATCH_RANGE if kind == "mismatch" else RESPONSE_RANGE
+    return heat_colors(field, low, high)
+
+
+def to_ppm(rgb: np.ndarray) -> bytes:
+    """Encode an RGB image as binary PPM for ``tk.PhotoImage(data=...)``."""
+    height, width = rgb.shape[:2]
+    return b"P6 %d %d 255\n" % (width, height) + np.ascontiguousarray(rgb).tobytes()
+
+
+def overlay_key(kind: str, width: int, height: int, center, radius: float,
+                admittance: bool = False, components=(), z0: float = 50.0,
+                freq: float = 1e9) -> tuple:
+    """Return a hashable key of everything the overlay image depends on."""
+    key = (kind, width, height, tuple(center), radius, admittance)
+    if kind == "response":
+        key += (tuple(component_key(c) for c in components), z0, freq)
+    return key
+
+
+class OverlayCache:
+    """Least recently used cache of rendered overlays."""
+
+    def __init__(self, size: int = CACHE_SIZE):
+        self.size = size
+        self._items: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key, create):
+        """Return the entry for ``key``, calling ``create()`` on a miss."""
+        if key in self._items:
+            self._items.move_to_end(key)
+            return self._items[key]
+        value = self._items[key] = create()
+        while len(self._items) > self.size:
+            self._items.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+__all__ = [
+    "OVERLAYS",
+    "VSWR_LEVELS",
+    "Q_LEVELS",
+    "gamma_grid",
+    "contour_mask",
+    "heat_colors",
+    "overlay_field",
+    "render_overlay",
+    "to_ppm",
+    "overlay_key",
+    "OverlayCache",
+]
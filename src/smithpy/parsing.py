@@ -1,41 +1,200 @@
-"""Utility parsing helpers for Smith chart components."""
+"""Utility parsing helpers for Smith chart components.
+
+Values are numbers with an optional SI prefix and unit, e.g. ``"10 nH"``,
+``"2.2pF"``, ``"4.7k"``, ``"2.2 GΩ"``, ``"10 µH"``, ``"1e-9"`` or
+``"2.4 GHz"``.  Resistor-code notation with the prefix as decimal point
+(``"4k7"``, ``"2n2"``, ``"4R7"``) and the SPICE ``meg`` prefix are accepted
+too.  The patterns are compiled once and the results of recent strings are
+cached, so parsing long columns of repeated values is cheap;
+:func:`parse_values` parses a whole column into an array.
+"""
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
+import numpy as np
 
 PREFIXES = {
+    "y": 1e-24,
+    "z": 1e-21,
+    "a": 1e-18,
+    "f": 1e-15,
     "p": 1e-12,
     "n": 1e-9,
     "u": 1e-6,
-    "f": 1e-15,
+    "µ": 1e-6,  # micro sign
+    "μ": 1e-6,  # Greek mu
     "m": 1e-3,
     "": 1.0,
+    "k": 1e3,
+    "K": 1e3,
+    "meg": 1e6,
+    "Meg": 1e6,
+    "MEG": 1e6,
+    "M": 1e6,
+    "G": 1e9,
+    "T": 1e12,
+    "P": 1e15,
+    "E": 1e18,
 }
 
+# accepted spellings of each unit, matched case-insensitively
+UNITS = {
+    "H": ("h",),
+    "F": ("f",),
+    "ohm": ("ohms", "ohm", "ω", "r"),  # both omega and the ohm sign lower to "ω"
+    "Hz": ("hz",),
+}
+
+_NUMBER_RE = re.compile(r"\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*(.*?)\s*$")
+# resistor code: digits, prefix letter as decimal point, digits, optional unit
+_CODE_RE = re.compile(r"\s*(\d+)([a-zA-Zµμ])(\d+)\s*(.*?)\s*$")
+
+# all-lowercase "mhz" is a common spelling of MHz, never meant as millihertz
+_MHZ_RE = re.compile(r"m\s*hz")
+
+# SPICE scale factors: case-insensitive, "m" is milli, trailing letters ignored
+SPICE_SCALES = {
+    "f": 1e-15, "p": 1e-12, "n": 1e-9, "u": 1e-6, "m": 1e-3,
+    "k": 1e3, "g": 1e9, "t": 1e12,
+}
+_SPICE_RE = re.compile(r"\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)([a-zA-Zµ]*)\s*$")
+
+# number of distinct strings whose parsed value is kept
+CACHE_SIZE = 4096
+
+
+def _multiplier(suffix: str, units: tuple) -> float | None:
+    """Return the prefix factor of ``suffix`` (prefix plus optional unit)."""
+    if "Hz" in units and _MHZ_RE.fullmatch(suffix):
+        return 1e6
+    candidates = [suffix]
+    low = suffix.lower()
+    for unit in units:
+        for name in UNITS[unit]:
+            if low.endswith(name):
+                candidates.append(suffix[: len(suffix) - len(name)].rstrip())
+    # prefer reading a trailing unit letter as the unit ("1F" is one farad)
+    for prefix in reversed(candidates):
+        if prefix in PREFIXES:
+            return PREFIXES[prefix]
+    return None
 
-def parse_lc_value(text: str) -> float:
-    """Parse a value like ``"10 nH"`` or ``"50 uF"``.
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse(text: str, units: tuple) -> float:
+    m = _NUMBER_RE.match(text)
+    if m:
+        factor = _multiplier(m.group(2), units)
+        if factor is not None:
+            return float(m.group(1)) * factor
+    m = _CODE_RE.match(text)
+    if m and (m.group(2) != "R" or "ohm" in units):
+        factor = 1.0 if m.group(2) == "R" else PREFIXES.get(m.group(2))
+        if factor is not None and _multiplier(m.group(4), units) == 1.0:
+            return float(f"{m.group(1)}.{m.group(3)}") * factor
+    raise ValueError(f"invalid format: {text!r}")
+
+
+def parse_value(text: str, units=()) -> float:
+    """Parse a number with optional SI prefix and unit.
 
     Parameters
     ----------
     text:
-        Value string with optional SI prefix and unit (H or F).
+        Value string such as ``"4.7k"``, ``"10 nH"`` or ``"1e-9"``.
+    units:
+        Unit name or tuple of names from :data:`UNITS` that may follow the
+        prefix.  Without units only a bare prefix is accepted.
 
     Returns
     -------
     float
         Numeric value in base SI units.
     """
-    if not text:
+    if isinstance(units, str):
+        units = (units,)
+    if not text or not text.strip():
         raise ValueError("empty value")
-    text = text.strip()
-    m = re.match(r"([0-9.]+)\s*([pnufm]?)[HhFf]", text)
+    return _parse(text, tuple(units))
+
+
+def parse_values(texts, units=(), errors: str = "raise") -> np.ndarray:
+    """Parse a sequence of value strings into a float array.
+
+    ``errors="nan"`` stores NaN for strings that cannot be parsed instead
+    of raising :class:`ValueError`.  Plain numeric columns are converted by
+    NumPy in one call.  Entries are accepted exactly when
+    :func:`parse_value` accepts them, so ``"nan"`` and ``"inf"`` are
+    errors.
+    """
+    if errors not in ("raise", "nan"):
+        raise ValueError(f"invalid errors mode: {errors}")
+    texts = list(texts)
+    if isinstance(units, str):
+        units = (units,)
+    units = tuple(units)
+    try:
+        # NumPy, like float(), also reads digit groups such as "1_000"
+        if any(isinstance(t, str) and "_" in t for t in texts):
+            raise ValueError("digit separators")
+        out = np.array(texts, dtype=float)
+    except (TypeError, ValueError):
+        out = np.empty(len(texts))
+        todo = range(len(texts))
+    else:
+        # NumPy also reads "nan" and "inf"; check those like single values
+        todo = np.flatnonzero(~np.isfinite(out)).tolist()
+    for i in todo:
+        try:
+            out[i] = _parse(str(texts[i]), units)
+        except ValueError:
+            if errors == "raise":
+                raise
+            out[i] = np.nan
+    return out
+
+
+def parse_spice_value(text: str) -> float:
+    """Parse a SPICE number like ``"10n"``, ``"2.2pF"``, ``"1meg"`` or ``"25mil"``.
+
+    Unlike :func:`parse_value` the scale factor is case-insensitive, so
+    ``"1M"`` is one milli, and letters after it (units) are ignored.
+    """
+    m = _SPICE_RE.match(text)
     if not m:
-        raise ValueError("invalid format")
-    num = float(m.group(1))
-    prefix = m.group(2).lower()
-    return num * PREFIXES[prefix]
+        raise ValueError(f"invalid SPICE value: {text!r}")
+    suffix = m.group(2).lower()
+    if suffix.startswith("meg"):
+        scale = 1e6
+    elif suffix.startswith("mil"):
+        scale = 25.4e-6
+    else:
+        scale = SPICE_SCALES.get(suffix[:1], 1.0)
+    return float(m.group(1)) * scale
+
+
+def _positive(value: float, text: str) -> float:
+    if not value > 0:
+        raise ValueError(f"value must be positive: {text!r}")
+    return value
+
+
+def parse_lc_value(text: str) -> float:
+    """Parse a value like ``"10 nH"`` or ``"50 uF"``.
+
+    Parameters
+    ----------
+    text:
+        Value string with optional SI prefix and unit (H or F).
+
+    Returns
+    -------
+    float
+        Value in base SI units; it must be positive.
+    """
+    return _positive(parse_value(text, ("H", "F")), text)
 
 
 def parse_length(value: str, mode: str) -> tuple[float, str]:
@@ -50,24 +209,29 @@ def parse_length(value: str, mode: str) -> tuple[float, str]:
         Either ``"deg"`` for degrees or ``"lambda"`` for a fraction of
         a wavelength.
     """
-    value = value.strip().replace("°", "").replace("\u03bb", "")
+    value = value.strip().replace("°", "").replace("λ", "")
     if mode == "deg":
         deg = float(value)
-        return deg, f"{deg}\u00b0"
+        return deg, f"{deg}°"
     frac = float(value)
     deg = frac * 360.0
-    return deg, f"{frac} \u03bb"
+    return deg, f"{frac} λ"
 
 
 def parse_ohm_value(text: str) -> float:
-    """Parse a resistor value in ohms."""
-    if not text:
-        raise ValueError("empty value")
-    text = text.strip().lower()
-    m = re.match(r"([0-9.]+)", text)
-    if not m:
-        raise ValueError("invalid format")
-    return float(m.group(1))
+    """Parse a positive resistor value like ``"75"``, ``"4.7k"`` or ``"2.2 MΩ"`` in ohms."""
+    return _positive(parse_value(text, "ohm"), text)
+
+
+def parse_frequency(text: str) -> float:
+    """Parse a positive frequency like ``"1e9"``, ``"900M"`` or ``"2.4 GHz"`` in Hz.
+
+    ``"1.5 mhz"`` in lower case is read as 1.5 MHz; ``"mHz"`` stays milli.
+    """
+    freq = parse_value(text, "Hz")
+    if not freq > 0:
+        raise ValueError(f"frequency must be positive: {text!r}")
+    return freq
 
 
 def parse_complex_impedance(text: str) -> complex:
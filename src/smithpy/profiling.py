@@ -0,0 +1,161 @@
+"""Timing spans and per-frame counters for finding slow spots.
+
+Hot paths are wrapped in ``with PROFILER.span("name"):`` and count work with
+``PROFILER.count("name", n)``.  While the profiler is disabled ``span``
+returns a shared no-op context manager and ``count`` returns right away, so
+the instrumentation stays in place at practically no cost.  The render
+scheduler closes a frame after each flush, which makes the spans and
+counters of the last frame available for the on-screen overlay.
+
+Only spans and counters recorded on the thread that renders the frames
+belong to a frame.  Those of background jobs run on other threads, so they
+are kept apart under names starting with :data:`JOB_PREFIX` instead of
+being charged to whichever frame happens to be flushed next.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import defaultdict, deque
+
+# number of recent frame durations kept for the average frame rate
+FRAME_HISTORY = 120
+# prefix of the spans and counters recorded by background jobs
+JOB_PREFIX = "job "
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """Collect span timings and counters, in total and for the current frame.
+
+    Span times are inclusive, so nested spans are also part of their
+    parent.  Spans and counters may be recorded from background jobs; they
+    are totalled as job statistics and never added to a frame.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        # frames are rendered on the Tk main loop
+        self.frame_thread = threading.main_thread()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all recorded data."""
+        self.totals = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.counters = defaultdict(int)
+        self.frame_spans = defaultdict(float)
+        self.frame_counters = defaultdict(int)
+        # duration of the last run of each span recorded by a background job
+        self.job_spans: dict[str, float] = {}
+        self.last_frame: tuple[dict, dict, float] = ({}, {}, 0.0)
+        self.frames = 0
+        self.frame_times: deque = deque(maxlen=FRAME_HISTORY)
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def span(self, name: str):
+        """Return a context manager timing the enclosed block as ``name``."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def _in_frame(self) -> bool:
+        return threading.current_thread() is self.frame_thread
+
+    def add_time(self, name: str, seconds: float) -> None:
+        in_frame = self._in_frame()
+        if not in_frame:
+            name = JOB_PREFIX + name
+        with self._lock:
+            self.totals[name] += seconds
+            self.calls[name] += 1
+            if in_frame:
+                self.frame_spans[name] += seconds
+            else:
+                self.job_spans[name] = seconds
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add ``n`` to counter ``name``."""
+        if not self.enabled:
+            return
+        if not self._in_frame():
+            with self._lock:
+                self.counters[JOB_PREFIX + name] += n
+            return
+        with self._lock:
+            self.counters[name] += n
+            self.frame_counters[name] += n
+
+    def end_frame(self, seconds: float) -> None:
+        """Close the current frame, which took ``seconds`` to render."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.frames += 1
+            self.frame_times.append(seconds)
+            self.last_frame = (dict(self.frame_spans), dict(self.frame_counters), seconds)
+            self.frame_spans.clear()
+            self.frame_counters.clear()
+
+    def fps(self) -> float:
+        """Return the frame rate the recent frames' render time would allow."""
+        if not self.frame_times:
+            return 0.0
+        return len(self.frame_times) / max(sum(self.frame_times), 1e-9)
+
+    def summary(self) -> str:
+        """Return a table of all spans and counters."""
+        lines = [f"{'span':32s} {'calls':>8s} {'total ms':>10s} {'mean ms':>9s}"]
+        for name, total in sorted(self.totals.items(), key=lambda kv: -kv[1]):
+            calls = self.calls[name]
+            lines.append(f"{name:32s} {calls:8d} {total * 1e3:10.2f} {total * 1e3 / calls:9.3f}")
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'counter':32s} {'total':>8s} {'per frame':>10s}")
+            for name, value in sorted(self.counters.items()):
+                per_frame = value / self.frames if self.frames else 0.0
+                lines.append(f"{name:32s} {value:8d} {per_frame:10.1f}")
+        lines.append("")
+        lines.append(f"{self.frames} frames")
+        return "\n".join(lines)
+
+
+# shared instance used by the instrumented modules
+PROFILER = Profiler()
+
+
+__all__ = ["FRAME_HISTORY", "JOB_PREFIX", "Profiler", "PROFILER"]
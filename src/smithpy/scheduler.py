@@ -0,0 +1,90 @@
+"""Frame scheduler that only redraws the invalidated parts of the GUI."""
+from __future__ import annotations
+
+import time
+
+try:  # allow running as a module or a script
+    from .profiling import PROFILER
+except ImportError:  # pragma: no cover - direct execution fallback
+    from profiling import PROFILER
+
+# minimum time between two rendered frames (about 60 frames per second)
+FRAME_MS = 16
+
+
+class RenderScheduler:
+    """Collect dirty layers and redraw them together on one tick.
+
+    Parameters
+    ----------
+    widget:
+        Tk widget used for ``after``/``after_idle`` scheduling.
+    layers:
+        Sequence of ``(name, callback)`` pairs in drawing order.
+    frame_ms:
+        Minimum spacing between frames.  Invalidations arriving faster than
+        this are merged into the next frame, so only the latest state of a
+        fast slider drag is rendered.
+    on_frame:
+        Optional callable run after every flush, e.g. to draw statistics.
+    """
+
+    def __init__(self, widget, layers, frame_ms: int = FRAME_MS, on_frame=None):
+        self.widget = widget
+        self.layers = list(layers)
+        self.frame_ms = frame_ms
+        self.on_frame = on_frame
+        self.dirty: set[str] = set()
+        self._job = None
+        self._flushing = False
+        self._last = 0.0
+
+    def invalidate(self, *names: str) -> None:
+        """Mark ``names`` (or every layer if none given) for redrawing."""
+        known = {name for name, _ in self.layers}
+        unknown = set(names) - known
+        if unknown:
+            raise ValueError(f"unknown layer(s): {', '.join(sorted(unknown))}")
+        self.dirty.update(names or known)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if self._job is not None or self._flushing:
+            return
+        wait = self.frame_ms - (time.perf_counter() - self._last) * 1000
+        if wait > 0:
+            self._job = self.widget.after(int(wait) + 1, self.flush)
+        else:
+            self._job = self.widget.after_idle(self.flush)
+
+    def flush(self) -> None:
+        """Redraw all dirty layers now, in drawing order."""
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        self._last = time.perf_counter()
+        self._flushing = True
+        try:
+            for name, draw in self.layers:
+                if name in self.dirty:
+                    self.dirty.discard(name)
+                    with PROFILER.span(f"layer {name}"):
+                        draw()
+            PROFILER.end_frame(time.perf_counter() - self._last)
+            if self.on_frame is not None:
+                self.on_frame()
+        finally:
+            self._flushing = False
+        # layers invalidated again while drawing are picked up by the next frame
+        if self.dirty:
+            self._schedule()
+
+    def cancel(self) -> None:
+        """Drop pending work without drawing."""
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        self.dirty.clear()
+
+
+__all__ = ["FRAME_MS", "RenderScheduler"]
@@ -0,0 +1,101 @@
+"""Nearest-point lookup over the points plotted on the charts.
+
+:class:`PointIndex` sorts points into the cells of a uniform grid over the
+Γ-plane, so finding the point nearest to the mouse only looks at the few
+cells within the snap distance instead of every trace, sweep or Monte
+Carlo point.  Points are kept in named layers that are rebuilt
+independently, so a new Monte Carlo cloud does not re-sort the traces.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+# cells per side of the grid over -GRID_EXTENT <= Re Γ, Im Γ < GRID_EXTENT;
+# points outside fall into the border cells
+GRID_CELLS = 256
+GRID_EXTENT = 1.0
+
+
+class PointIndex:
+    """Uniform grid buckets of points in the complex plane.
+
+    Each layer is stored as its points sorted by cell number together with
+    the original positions, so a query is a binary search per cell row
+    followed by one distance computation over the candidates.
+    """
+
+    def __init__(self, cells: int = GRID_CELLS, extent: float = GRID_EXTENT):
+        self.cells = cells
+        self.extent = extent
+        self._scale = cells / (2 * extent)
+        # name -> (sorted cell numbers, sorted points, original positions, source)
+        self._layers: dict[str, tuple] = {}
+
+    def _cell(self, values):
+        """Return the clipped column and row numbers of ``values``."""
+        col = np.clip(np.floor((np.real(values) + self.extent) * self._scale), 0, self.cells - 1)
+        row = np.clip(np.floor((np.imag(values) + self.extent) * self._scale), 0, self.cells - 1)
+        return col.astype(np.int64), row.astype(np.int64)
+
+    def __len__(self) -> int:
+        return sum(layer[1].size for layer in self._layers.values())
+
+    def layers(self) -> list[str]:
+        return list(self._layers)
+
+    def source(self, name: str):
+        """Return the object ``name`` was built from, or ``None``."""
+        layer = self._layers.get(name)
+        return None if layer is None else layer[3]
+
+    def update(self, name: str, points, source=None) -> bool:
+        """Index ``points`` as layer ``name`` unless ``source`` is unchanged.
+
+        ``source`` identifies the data the points came from (by identity);
+        passing the same object again skips the rebuild.  Returns whether
+        the layer was rebuilt.
+        """
+        if source is not None and self.source(name) is source:
+            return False
+        points = np.asarray(points, dtype=complex).ravel()
+        finite = np.flatnonzero(np.isfinite(points))
+        col, row = self._cell(points[finite])
+        cell = row * self.cells + col
+        order = np.argsort(cell, kind="stable")
+        self._layers[name] = (cell[order], points[finite][order], finite[order], source)
+        return True
+
+    def remove(self, name: str) -> None:
+        self._layers.pop(name, None)
+
+    def clear(self) -> None:
+        self._layers.clear()
+
+    def nearest(self, point: complex, max_dist: float):
+        """Return ``(layer, index, distance)`` of the nearest point.
+
+        Only points closer than ``max_dist`` are considered; ``None`` is
+        returned if there is none.  ``index`` is the position in the array
+        the layer was built from.
+        """
+        col0, row0 = self._cell(point - max_dist * (1 + 1j))
+        col1, row1 = self._cell(point + max_dist * (1 + 1j))
+        best = None
+        for name, (cells, points, positions, _) in self._layers.items():
+            if not cells.size:
+                continue
+            rows = np.arange(int(row0), int(row1) + 1) * self.cells
+            lo = np.searchsorted(cells, rows + int(col0), "left")
+            hi = np.searchsorted(cells, rows + int(col1), "right")
+            spans = [(a, b) for a, b in zip(lo.tolist(), hi.tolist()) if b > a]
+            if not spans:
+                continue
+            take = np.concatenate([np.arange(a, b) for a, b in spans])
+            dist = np.abs(points[take] - point)
+            i = int(np.argmin(dist))
+            if dist[i] < max_dist and (best is None or dist[i] < best[2]):
+                best = (name, int(positions[take[i]]), float(dist[i]))
+        return best
+
+
+__all__ = ["GRID_CELLS", "PointIndex"]
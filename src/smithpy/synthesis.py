@@ -0,0 +1,458 @@
+"""Automatic synthesis of matching networks.
+
+Given a load, a reference impedance and a design frequency, candidate
+networks are generated for a set of topologies, evaluated over a frequency
+band and ranked.  L networks and stub matches are solved in closed form;
+Pi and T networks are searched numerically over the virtual resistance
+between their two L sections.  Snapping lumped values to an E-series
+multiplies the number of candidates, so the work is spread over a process
+pool.  Loads that depend on frequency are sampled once at the band points
+(:func:`sample_load`), so the workers only receive plain arrays.
+
+Components are returned as the same dicts the GUI uses, ordered from the
+load towards the source.
+"""
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from .design import line, lumped
+    from .engine import PI2, match_metrics
+    from .network import chain_response
+except ImportError:  # pragma: no cover - direct execution fallback
+    from design import line, lumped
+    from engine import PI2, match_metrics
+    from network import chain_response
+
+TOPOLOGIES = ("L", "PI", "T", "STUB", "DOUBLE_STUB")
+E_SERIES = {
+    "E6": (1.0, 1.5, 2.2, 3.3, 4.7, 6.8),
+    "E12": (1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2),
+    "E24": (1.0, 1.1, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4, 2.7, 3.0,
+            3.3, 3.6, 3.9, 4.3, 4.7, 5.1, 5.6, 6.2, 6.8, 7.5, 8.2, 9.1),
+}
+# virtual resistances tried per Pi/T network and per pool task
+PI_T_POINTS = 24
+PI_T_TASK_POINTS = 6
+# spacing of the two stubs of a double-stub match in degrees
+DOUBLE_STUB_SPACINGS = (45.0, 135.0)
+# points of the band used to measure bandwidth
+BAND_POINTS = 401
+# candidates whose reflection at the design frequency exceeds this are dropped
+MAX_GAMMA = 0.05
+# reactances and susceptances smaller than this are left out of the network
+_TINY = 1e-9
+
+
+class Candidate:
+    """A synthesized matching network and its figures of merit."""
+
+    def __init__(self, topology: str, components: list, gamma: float,
+                 bandwidth: float, worst_rl: float):
+        self.topology = topology
+        self.components = components
+        self.gamma = gamma
+        self.bandwidth = bandwidth
+        self.worst_rl = worst_rl
+
+    @property
+    def count(self) -> int:
+        return len(self.components)
+
+    def describe(self) -> str:
+        parts = ", ".join(_component_text(c) for c in self.components) or "direct"
+        return (f"{self.topology}: {parts} | BW {self.bandwidth / 1e6:.1f} MHz, "
+                f"|Γ| {self.gamma:.3f}")
+
+    def __repr__(self) -> str:
+        return f"Candidate({self.describe()!r})"
+
+
+def _component_text(comp: dict) -> str:
+    if comp["type"] in ("L", "C", "R"):
+        return f"{comp['type']} {comp['orient']} {comp['disp']}"
+    if comp["type"] == "TL":
+        return f"TL {comp['disp']}"
+    return f"Stub {comp['kind']} {comp['disp']}"
+
+
+def reactance(x: float, freq: float) -> list:
+    """Return the series L or C giving reactance ``x`` (empty if negligible)."""
+    w = PI2 * freq
+    if abs(x) < _TINY:
+        return []
+    if x > 0:
+        return [lumped("L", x / w, "series")]
+    return [lumped("C", -1 / (w * x), "series")]
+
+
+def susceptance(b: float, freq: float) -> list:
+    """Return the shunt L or C giving susceptance ``b`` (empty if negligible)."""
+    w = PI2 * freq
+    if abs(b) < _TINY:
+        return []
+    if b > 0:
+        return [lumped("C", b / w, "shunt")]
+    return [lumped("L", -1 / (w * b), "shunt")]
+
+
+def l_sections(zl: complex, rt: float) -> list:
+    """Return closed-form L sections matching ``zl`` to the resistance ``rt``.
+
+    Each solution is a list of ``("shunt", b)``/``("series", x)`` steps in
+    order from the load.
+    """
+    sols = []
+    y = 1 / zl
+    g, b = y.real, y.imag
+    # shunt element at the load, then a series element
+    if 0 < g <= 1 / rt:
+        root = math.sqrt(max(g / rt - g * g, 0.0))
+        for bp in {root, -root}:
+            sols.append([("shunt", bp - b), ("series", bp / (g * g + bp * bp))])
+    r, x = zl.real, zl.imag
+    # series element at the load, then a shunt element
+    if 0 < r <= rt:
+        root = math.sqrt(max(r * rt - r * r, 0.0))
+        for xp in {root, -root}:
+            sols.append([("series", xp - x), ("shunt", xp / (r * r + xp * xp))])
+    return sols
+
+
+def _merge(steps: list) -> list:
+    """Combine consecutive steps of the same kind."""
+    out = []
+    for kind, val in steps:
+        if out and out[-1][0] == kind:
+            out[-1] = (kind, out[-1][1] + val)
+        else:
+            out.append((kind, val))
+    return out
+
+
+def _lumped_network(steps: list, freq: float) -> list:
+    comps = []
+    for kind, val in _merge(steps):
+        comps += reactance(val, freq) if kind == "series" else susceptance(val, freq)
+    return comps
+
+
+def _stub_length(b: float, z0: float, kind: str) -> float:
+    """Return the stub length in degrees giving shunt susceptance ``b``."""
+    if kind == "open":
+        theta = math.atan(b * z0)
+    else:
+        theta = math.atan2(1.0, -b * z0) if b else math.pi / 2
+    return math.degrees(theta % math.pi) or 180.0
+
+
+def solve_l(zl: complex, z0: float, freq: float) -> list:
+    return [_lumped_network(s, freq) for s in l_sections(zl, z0)]
+
+
+def solve_pi(zl: complex, z0: float, freq: float, rvs) -> list:
+    """Shunt-series-shunt networks through each virtual resistance ``rv``."""
+    nets = []
+    for rv in rvs:
+        first = [s for s in l_sections(zl, rv) if s[0][0] == "shunt"]
+        second = [s for s in l_sections(complex(rv), z0) if s[0][0] == "series"]
+        nets += [_lumped_network(a + b, freq) for a, b in product(first, second)]
+    return nets
+
+
+def solve_t(zl: complex, z0: float, freq: float, rvs) -> list:
+    """Series-shunt-series networks through each virtual resistance ``rv``."""
+    nets = []
+    for rv in rvs:
+        first = [s for s in l_sections(zl, rv) if s[0][0] == "series"]
+        second = [s for s in l_sections(complex(rv), z0) if s[0][0] == "shunt"]
+        nets += [_lumped_network(a + b, freq) for a, b in product(first, second)]
+    return nets
+
+
+def solve_stub(zl: complex, z0: float) -> list:
+    """Single-stub matches: a line from the load, then a shunt stub."""
+    r, x = zl.real, zl.imag
+    if r <= 0:
+        return []
+    if abs(r - z0) < _TINY * z0:
+        ts = [-x / (2 * z0)]
+    else:
+        root = math.sqrt(r * ((z0 - r) ** 2 + x * x) / z0)
+        ts = [(x + root) / (r - z0), (x - root) / (r - z0)]
+    nets = []
+    for t in ts:
+        theta = math.atan(t) % math.pi
+        z = z0 * (zl + 1j * z0 * t) / (z0 + 1j * zl * t)
+        b = -(1 / z).imag
+        for kind in ("open", "short"):
+            comps = [line("TL", math.degrees(theta), z0)] if theta > _TINY else []
+            comps.append(line("STUB", _stub_length(b, z0, kind), z0, kind))
+            nets.append(comps)
+    return nets
+
+
+def solve_double_stub(zl: complex, z0: float, spacing: float) -> list:
+    """Double-stub matches with the first stub at the load.
+
+    The first stub moves the load admittance onto the circle that the line
+    of length ``spacing`` maps onto ``g = 1``; the second stub cancels the
+    remaining susceptance.
+    """
+    y = z0 / zl
+    g, bl = y.real, y.imag
+    t = math.tan(math.radians(spacing))
+    disc = g * (1 + t * t) - g * g * t * t
+    if g <= 0 or disc < 0 or abs(t) < _TINY:
+        return []
+    nets = []
+    for root in {math.sqrt(disc), -math.sqrt(disc)}:
+        b_after = (1 - root) / t
+        y1 = g + 1j * b_after
+        y_in = (y1 + 1j * t) / (1 + 1j * y1 * t)
+        b1 = (b_after - bl) / z0
+        b2 = -y_in.imag / z0
+        for k1, k2 in product(("open", "short"), repeat=2):
+            nets.append([
+                line("STUB", _stub_length(b1, z0, k1), z0, k1),
+                line("TL", spacing, z0),
+                line("STUB", _stub_length(b2, z0, k2), z0, k2),
+            ])
+    return nets
+
+
+def _e_neighbours(value: float, series: str) -> list:
+    """Return the nearest E-series values below and above ``value``."""
+    mantissas = E_SERIES[series]
+    decade = 10 ** math.floor(math.log10(value))
+    steps = [m * decade for m in mantissas]
+    steps = [mantissas[-1] * decade / 10] + steps + [10 * decade]
+    lo = max(v for v in steps if v <= value * (1 + 1e-9))
+    hi = min(v for v in steps if v >= value * (1 - 1e-9))
+    return sorted({lo, hi})
+
+
+def snap_to_series(comps: list, series: str) -> list:
+    """Return every network with lumped values rounded down or up to ``series``."""
+    choices = []
+    for comp in comps:
+        if comp["type"] in ("L", "C", "R"):
+            choices.append([lumped(comp["type"], v, comp["orient"])
+                            for v in _e_neighbours(comp["value"], series)])
+        else:
+            choices.append([comp])
+    return [list(c) for c in product(*choices)]
+
+
+def band_frequencies(freq: float, band=None) -> np.ndarray:
+    """Return the band points used to measure bandwidth, followed by ``freq``.
+
+    ``band`` is ``(start, stop)`` in Hz and defaults to +-50 % around
+    ``freq``.
+    """
+    start, stop = band if band is not None else (freq * 0.5, freq * 1.5)
+    return np.append(np.linspace(start, stop, BAND_POINTS), freq)
+
+
+def sample_load(za, freq: float, band=None) -> np.ndarray:
+    """Return the load at :func:`band_frequencies` as a complex array.
+
+    ``za`` may be a callable of a frequency array, such as
+    :meth:`smithpy.touchstone.Touchstone.impedance_at`, or a constant.
+    """
+    freqs = band_frequencies(freq, band)
+    if not freqs[0] <= freq <= freqs[-2]:
+        raise ValueError(f"design frequency {freq:g} Hz is outside the band")
+    if callable(za):
+        return np.asarray(za(freqs), dtype=complex)
+    return np.full(freqs.size, complex(za))
+
+
+def _design_load(za) -> complex:
+    """Return the load at the design frequency, the last sampled point."""
+    return complex(za[-1]) if np.ndim(za) else complex(za)
+
+
+def evaluate(comps: list, za, z0: float, freq: float, band: np.ndarray,
+             rl_spec: float) -> tuple[float, float, float]:
+    """Return ``(|gamma| at freq, bandwidth in Hz, worst RL in band)``.
+
+    ``za`` is a load impedance, a callable of frequency or an array of
+    loads at ``band`` followed by ``freq`` (see :func:`sample_load`).  The
+    bandwidth is zero if ``freq`` lies outside ``band``.
+    """
+    freqs = np.append(band, freq)
+    load = za(freqs) if callable(za) else za
+    m = match_metrics(chain_response(comps, load, z0, freqs, ref_freq=freq), z0)
+    gamma0 = float(np.abs(m["gamma"][-1]))
+    rl = m["return_loss"][:-1]
+    ok = rl >= rl_spec
+    # the bandwidth is the passing range around freq, so there is none outside
+    if not band[0] <= freq <= band[-1]:
+        return gamma0, 0.0, float(rl.min())
+    i = int(np.searchsorted(band, freq))
+    if not ok[i]:
+        return gamma0, 0.0, float(rl.min())
+    lo = i
+    while lo > 0 and ok[lo - 1]:
+        lo -= 1
+    hi = i
+    while hi < band.size - 1 and ok[hi + 1]:
+        hi += 1
+    return gamma0, float(band[hi] - band[lo]), float(rl.min())
+
+
+def _run_task(task) -> list:
+    topology, arg, za, z0, freq, band, rl_spec, series = task
+    zl = _design_load(za)
+    if topology == "L":
+        nets = solve_l(zl, z0, freq)
+    elif topology == "PI":
+        nets = solve_pi(zl, z0, freq, arg)
+    elif topology == "T":
+        nets = solve_t(zl, z0, freq, arg)
+    elif topology == "STUB":
+        nets = solve_stub(zl, z0)
+    elif topology == "DOUBLE_STUB":
+        nets = solve_double_stub(zl, z0, arg)
+    else:
+        raise ValueError(f"unknown topology: {topology}")
+    if series:
+        nets = [snapped for net in nets for snapped in snap_to_series(net, series)]
+    found = []
+    for comps in nets:
+        gamma0, bw, worst = evaluate(comps, za, z0, freq, band, rl_spec)
+        # snapped values are judged on the spec, ideal ones on the match
+        if (series and -20 * math.log10(max(gamma0, 1e-300)) >= rl_spec) or gamma0 <= MAX_GAMMA:
+            found.append(Candidate(topology, comps, gamma0, bw, worst))
+    return found
+
+
+def _tasks(topologies, za, z0, freq, band, rl_spec, series) -> list:
+    zl = _design_load(za)
+    common = (za, z0, freq, band, rl_spec, series)
+    tasks = []
+    for topology in topologies:
+        if topology in ("PI", "T"):
+            g = (1 / zl).real
+            if topology == "PI":
+                lo, hi = z0 / 100, min(1 / g if g > 0 else z0, z0)
+            else:
+                lo = max(zl.real, z0)
+                hi = lo * 100
+            if hi <= lo:
+                continue
+            rvs = np.geomspace(lo, hi, PI_T_POINTS + 2)[1:-1]
+            for i in range(0, rvs.size, PI_T_TASK_POINTS):
+                tasks.append((topology, rvs[i:i + PI_T_TASK_POINTS]) + common)
+        elif topology == "DOUBLE_STUB":
+            tasks += [(topology, d) + common for d in DOUBLE_STUB_SPACINGS]
+        else:
+            tasks.append((topology, None) + common)
+    return tasks
+
+
+def synthesize(za, z0: float, freq: float, topologies=TOPOLOGIES, band=None,
+               rank: str = "bandwidth", series: str | None = None,
+               rl_spec: float = 10.0, processes: int | None = None,
+               limit: int = 20, progress=None, mp_context=None) -> list[Candidate]:
+    """Return ranked matching networks for the load ``za``.
+
+    Parameters
+    ----------
+    za:
+        Load impedance, a callable returning it for an array of
+        frequencies, or its values at :func:`band_frequencies` as
+        returned by :func:`sample_load`.
+    z0:
+        Reference (source) impedance to match to.
+    freq:
+        Design frequency in Hz; line lengths are electrical degrees here.
+    topologies:
+        Any of ``"L"``, ``"PI"``, ``"T"``, ``"STUB"``, ``"DOUBLE_STUB"``.
+    band:
+        ``(start, stop)`` in Hz used to measure bandwidth; must contain
+        ``freq`` and defaults to +-50 % around it.
+    rank:
+        ``"bandwidth"`` (widest first) or ``"count"`` (fewest parts first).
+    series:
+        E-series name (``"E6"``, ``"E12"``, ``"E24"``) to round lumped
+        values to, or ``None`` for exact values.
+    rl_spec:
+        Return loss in dB that defines the bandwidth.
+    processes:
+        Worker processes; ``1`` runs everything in this process.
+    limit:
+        Maximum number of candidates returned.
+    progress:
+        Called with the fraction of the search done; an exception raised
+        by it (e.g. :class:`smithpy.jobs.JobCancelled`) stops the search.
+    mp_context:
+        ``multiprocessing`` context of the worker processes, e.g. spawn
+        when searching from a GUI process.
+    """
+    unknown = set(topologies) - set(TOPOLOGIES)
+    if unknown:
+        raise ValueError(f"unknown topology: {', '.join(sorted(unknown))}")
+    if series is not None and series not in E_SERIES:
+        raise ValueError(f"unknown E-series: {series}")
+    if rank not in ("bandwidth", "count"):
+        raise ValueError(f"unknown ranking: {rank}")
+    freqs = band_frequencies(freq, band)
+    if not freqs[0] <= freq <= freqs[-2]:
+        raise ValueError(f"design frequency {freq:g} Hz is outside the band")
+    if callable(za):
+        za = sample_load(za, freq, band)
+    elif np.ndim(za):
+        za = np.asarray(za, dtype=complex)
+        if za.shape != freqs.shape:
+            raise ValueError(f"expected {freqs.size} load values, got {za.size}")
+    tasks = _tasks(topologies, za, z0, freq, freqs[:-1], rl_spec, series)
+    results = [None] * len(tasks)
+    if processes == 1 or len(tasks) == 1:
+        for i, task in enumerate(tasks):
+            results[i] = _run_task(task)
+            if progress is not None:
+                progress((i + 1) / len(tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=mp_context) as pool:
+            futures = {pool.submit(_run_task, task): i for i, task in enumerate(tasks)}
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    results[futures[future]] = future.result()
+                    if progress is not None:
+                        progress(done / len(tasks))
+            except BaseException:
+                # do not wait for the queued tasks of an abandoned search
+                for future in futures:
+                    future.cancel()
+                raise
+    found = [c for res in results for c in res]
+    if rank == "bandwidth":
+        found.sort(key=lambda c: (-c.bandwidth, c.count, c.gamma))
+    else:
+        found.sort(key=lambda c: (c.count, -c.bandwidth, c.gamma))
+    return found[:limit]
+
+
+__all__ = [
+    "TOPOLOGIES",
+    "E_SERIES",
+    "Candidate",
+    "band_frequencies",
+    "sample_load",
+    "l_sections",
+    "solve_l",
+    "solve_pi",
+    "solve_t",
+    "solve_stub",
+    "solve_double_stub",
+    "snap_to_series",
+    "evaluate",
+    "synthesize",
+]
@@ -0,0 +1,120 @@
+"""Monte Carlo tolerance analysis of component chains.
+
+Each component may carry a tolerance ``"tol"`` (± percent) and a
+distribution ``"dist"``.  All perturbed chains are evaluated at once: the
+toleranced fields become arrays with one entry per sample and
+:mod:`smithpy.network` stacks the ABCD matrices over them, so 100k samples
+cost a handful of array operations per component instead of a Python loop.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:  # allow running as a module or a script
+    from .engine import match_metrics
+    from .network import chain_response
+except ImportError:  # pragma: no cover - direct execution fallback
+    from engine import match_metrics
+    from network import chain_response
+
+DISTRIBUTIONS = ("uniform", "normal")
+# the tolerance of a normal distribution is its 3 sigma bound
+NORMAL_SIGMAS = 3.0
+MC_SAMPLES = 10000
+# samples evaluated at once, bounds the size of the ABCD stacks
+MC_CHUNK = 1 << 16
+
+
+def tolerance_field(comp: dict) -> str:
+    """Return the field a component's tolerance applies to."""
+    return "length" if comp.get("type") in ("TL", "STUB") else "value"
+
+
+def sample_factors(tol: float, dist: str, n: int, rng) -> np.ndarray:
+    """Return ``n`` multiplicative factors for a tolerance of ``tol`` percent."""
+    frac = tol / 100.0
+    if dist == "uniform":
+        return 1.0 + rng.uniform(-frac, frac, n)
+    if dist == "normal":
+        return 1.0 + rng.normal(0.0, frac / NORMAL_SIGMAS, n)
+    raise ValueError(f"unknown distribution: {dist}")
+
+
+def sample_components(components, n: int, rng=None) -> list:
+    """Return a copy of ``components`` with ``n`` samples per toleranced field.
+
+    Components without a tolerance keep their scalar nominal values, so
+    they broadcast against the sampled ones.
+    """
+    rng = np.random.default_rng(rng)
+    comps = []
+    for comp in components:
+        tol = comp.get("tol", 0.0)
+        if tol:
+            key = tolerance_field(comp)
+            factors = sample_factors(tol, comp.get("dist", "uniform"), n, rng)
+            comp = {**comp, key: comp[key] * factors}
+        comps.append(comp)
+    return comps
+
+
+def monte_carlo(components, za, z0: float = 50.0, freq: float = 1e9,
+                samples: int = MC_SAMPLES, seed=None,
+                ref_freq: float | None = None, chunk: int = MC_CHUNK,
+                progress=None) -> np.ndarray:
+    """Return the end impedance of ``samples`` randomly perturbed chains.
+
+    Parameters
+    ----------
+    components:
+        Component chain; entries with a ``"tol"`` are perturbed.
+    za:
+        Load impedance at ``freq``.
+    seed:
+        Seed or generator for reproducible samples.
+    ref_freq:
+        Frequency at which line lengths are given, as in
+        :func:`smithpy.network.component_abcd`.
+    chunk:
+        Number of samples evaluated at once.
+    progress:
+        Optional callable receiving the completed fraction after each chunk.
+    """
+    if samples < 1:
+        raise ValueError("samples must be positive")
+    rng = np.random.default_rng(seed)
+    out = np.empty(samples, dtype=complex)
+    for first in range(0, samples, chunk):
+        n = min(chunk, samples - first)
+        comps = sample_components(components, n, rng)
+        out[first:first + n] = chain_response(comps, za, z0, freq, ref_freq)
+        if progress is not None:
+            progress((first + n) / samples)
+    return out
+
+
+def tolerance_yield(z, z0: float = 50.0, vswr: float | None = None,
+                    return_loss: float | None = None) -> float:
+    """Return the fraction of impedances ``z`` meeting the given specs.
+
+    ``vswr`` is the maximum VSWR and ``return_loss`` the minimum return
+    loss in dB; either may be omitted.
+    """
+    m = match_metrics(z, z0)
+    ok = np.ones(np.shape(z), dtype=bool)
+    if vswr is not None:
+        ok &= m["vswr"] <= vswr
+    if return_loss is not None:
+        ok &= m["return_loss"] >= return_loss
+    return float(ok.mean()) if ok.size else 0.0
+
+
+__all__ = [
+    "DISTRIBUTIONS",
+    "MC_SAMPLES",
+    "tolerance_field",
+    "sample_factors",
+    "sample_components",
+    "monte_carlo",
+    "tolerance_yield",
+]
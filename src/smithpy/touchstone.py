@@ -0,0 +1,178 @@
+"""Reader for Touchstone (.sNp) network parameter files.
+
+Only version 1 files with S-parameters are supported.  Numeric data is
+parsed in large chunks straight into NumPy arrays instead of line by line,
+so files with hundreds of thousands of points load quickly and with
+bounded temporary memory.
+"""
+from __future__ import annotations
+
+import os
+import re
+import warnings
+
+import numpy as np
+
+UNITS = {
+    "HZ": 1.0,
+    "KHZ": 1e3,
+    "MHZ": 1e6,
+    "GHZ": 1e9,
+}
+FORMATS = ("MA", "DB", "RI")
+# characters of numeric data parsed per chunk
+CHUNK_SIZE = 1 << 22
+
+_COMMENT = re.compile(r"!.*")
+_EXTENSION = re.compile(r"\.s(\d+)p$", re.IGNORECASE)
+
+
+class Touchstone:
+    """Network data of a Touchstone file.
+
+    Attributes
+    ----------
+    freqs:
+        Frequencies in Hz, shape ``(n_freq,)``.
+    s:
+        S-parameters, shape ``(n_freq, n_ports, n_ports)``.
+    z0:
+        Reference impedance in ohms.
+    """
+
+    def __init__(self, freqs: np.ndarray, s: np.ndarray, z0: float = 50.0):
+        self.freqs = freqs
+        self.s = s
+        self.z0 = z0
+
+    @property
+    def nports(self) -> int:
+        return self.s.shape[-1]
+
+    def impedance(self, port: int = 1) -> np.ndarray:
+        """Return the impedance looking into ``port`` (1-based)."""
+        s = self.s[:, port - 1, port - 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.z0 * (1 + s) / (1 - s)
+
+    def impedance_at(self, freqs, port: int = 1):
+        """Return the impedance of ``port`` interpolated at ``freqs``.
+
+        Frequencies outside the file's range use the nearest end point.
+        """
+        s = self.s[:, port - 1, port - 1]
+        re_s = np.interp(freqs, self.freqs, s.real)
+        im_s = np.interp(freqs, self.freqs, s.imag)
+        s = re_s + 1j * im_s
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.z0 * (1 + s) / (1 - s)
+
+
+def parse_options(line: str) -> tuple[float, str, float]:
+    """Parse an option line like ``"# GHz S MA R 50"``.
+
+    Returns the frequency multiplier, data format and reference impedance.
+    """
+    tokens = line.lstrip("#").upper().split()
+    unit, fmt, z0 = UNITS["GHZ"], "MA", 50.0
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok in UNITS:
+            unit = UNITS[tok]
+        elif tok in FORMATS:
+            fmt = tok
+        elif tok == "R":
+            i += 1
+            if i >= len(tokens):
+                raise ValueError("missing reference impedance after R")
+            z0 = float(tokens[i])
+        elif tok != "S":
+            raise ValueError(f"unsupported Touchstone option: {tok}")
+        i += 1
+    return unit, fmt, z0
+
+
+def _to_numbers(text: str) -> np.ndarray:
+    if "!" in text:
+        text = _COMMENT.sub("", text)
+    with warnings.catch_warnings():
+        # fromstring warns instead of failing on malformed input
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype=float, sep=" ")
+        except DeprecationWarning as exc:
+            raise ValueError("invalid numeric data in Touchstone file") from exc
+
+
+def _pairs_to_complex(a: np.ndarray, b: np.ndarray, fmt: str) -> np.ndarray:
+    if fmt == "RI":
+        return a + 1j * b
+    if fmt == "DB":
+        a = 10 ** (a / 20)
+    return a * np.exp(1j * np.radians(b))
+
+
+def read_touchstone(source, nports: int | None = None,
+                    chunk_size: int = CHUNK_SIZE) -> Touchstone:
+    """Read a Touchstone file.
+
+    Parameters
+    ----------
+    source:
+        Path or open text file.
+    nports:
+        Number of ports.  Taken from the ``.sNp`` extension if omitted,
+        otherwise 1.
+    chunk_size:
+        Number of characters parsed at once.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if nports is None:
+            m = _EXTENSION.search(os.fspath(source))
+            nports = int(m.group(1)) if m else None
+        with open(source, encoding="utf-8", errors="replace") as fh:
+            return read_touchstone(fh, nports or 1, chunk_size)
+    nports = nports or 1
+
+    unit, fmt, z0 = UNITS["GHZ"], "MA", 50.0
+    # header: comments and the option line, up to the first data line
+    first = ""
+    while True:
+        line = source.readline()
+        if not line:
+            break
+        stripped = line.strip()
+        if not stripped or stripped.startswith("!"):
+            continue
+        if stripped.startswith("#"):
+            unit, fmt, z0 = parse_options(_COMMENT.sub("", stripped))
+            continue
+        if stripped.startswith("["):
+            raise ValueError("Touchstone 2.0 keywords are not supported")
+        first = line
+        break
+
+    chunks = [_to_numbers(first)] if first else []
+    while True:
+        text = source.read(chunk_size)
+        if not text:
+            break
+        # finish the current line so no number is split between chunks
+        text += source.readline()
+        chunks.append(_to_numbers(text))
+    values = np.concatenate(chunks) if chunks else np.empty(0)
+
+    row = 1 + 2 * nports * nports
+    if values.size % row:
+        raise ValueError(f"expected {row} values per frequency for {nports} port(s)")
+    values = values.reshape(-1, row)
+    s = _pairs_to_complex(values[:, 1::2], values[:, 2::2], fmt)
+    s = s.reshape(-1, nports, nports)
+    if nports == 2:
+        # two-port files list S11 S21 S12 S22
+        s = s.transpose(0, 2, 1)
+    return Touchstone(values[:, 0] * unit, s, z0)
+
+
+__all__ = ["Touchstone", "parse_options", "read_touchstone"]
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from smithpy.adaptive import INITIAL_INTERVALS, adaptive_sample
+from smithpy.engine import component_trace, to_gamma
+
+
+def _chord_error(func, t, f):
+    """Return the largest midpoint distance of the intervals from their chords."""
+    tm = (t[:-1] + t[1:]) / 2
+    return np.max(np.abs(func(tm) - (f[:-1] + f[1:]) / 2))
+
+
+def test_straight_line_keeps_the_initial_grid():
+    t, f = adaptive_sample(lambda t: t * (1 + 1j), 0.0, 1.0, 0.01, max_step=10.0)
+    assert t.size == INITIAL_INTERVALS + 1
+    np.testing.assert_allclose(f, t * (1 + 1j))
+
+
+def test_points_follow_the_curvature():
+    def func(t):
+        # a circle traversed slowly at first, then fast
+        return np.exp(2j * np.pi * t ** 3)
+
+    t, f = adaptive_sample(func, 0.0, 1.0, 1e-3)
+    assert np.all(np.diff(t) > 0) and (t[0], t[-1]) == (0.0, 1.0)
+    np.testing.assert_allclose(f, func(t))
+    assert _chord_error(func, t, f) <= 1e-3
+    assert np.abs(np.diff(f)).max() <= 40 * 1e-3
+    # the fast end gets the dense sampling
+    assert np.sum(t > 0.5) > 3 * np.sum(t < 0.5)
+
+
+def test_depth_limit_and_tolerance():
+    t, _ = adaptive_sample(lambda t: np.exp(50j * t), 0.0, 1.0, 1e-9, initial=4, max_depth=3)
+    assert t.size == 4 * 2 ** 3 + 1
+    with pytest.raises(ValueError):
+        adaptive_sample(np.exp, 0.0, 1.0, 0.0)
+
+
+def test_adaptive_component_trace():
+    comp = {"type": "STUB", "length": 170.0, "z0": 50.0, "kind": "open"}
+    trace = component_trace(25 + 10j, comp, 1e9, 50.0, tol=1e-3)
+    fixed = component_trace(25 + 10j, comp, 1e9, 50.0, steps=2000)
+    assert trace[-1] == pytest.approx(fixed[-1])
+    # every adaptive point lies on the densely sampled path
+    g, dense = to_gamma(trace, 50.0), to_gamma(fixed, 50.0)
+    assert np.abs(g[:, None] - dense[None, :]).min(axis=1).max() < 5e-3
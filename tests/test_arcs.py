@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from smithpy.arcs import Arc, Segment, component_arc
+from smithpy.engine import component_trace, to_gamma
+
+FREQ = 1e9
+Z0 = 50.0
+ZA = 25 + 10j
+COMPONENTS = [
+    {"type": "L", "value": 10e-9, "orient": "series"},
+    {"type": "C", "value": 2e-12, "orient": "series"},
+    {"type": "L", "value": 10e-9, "orient": "shunt"},
+    {"type": "C", "value": 2e-12, "orient": "shunt"},
+    {"type": "R", "value": 40.0, "orient": "series"},
+    {"type": "R", "value": 40.0, "orient": "shunt"},
+    {"type": "TL", "length": 60.0, "z0": 75.0},
+    {"type": "TL", "length": 150.0, "z0": 50.0},
+    {"type": "STUB", "length": 40.0, "z0": 50.0, "kind": "open"},
+    {"type": "STUB", "length": 120.0, "z0": 75.0, "kind": "short"},
+]
+
+
+def _swept(arc, gammas):
+    """Return the angles of ``gammas`` measured from the start along the arc."""
+    angles = np.degrees(np.angle(gammas - arc.center))
+    return (np.sign(arc.extent) * (angles - arc.start)) % 360.0
+
+
+@pytest.mark.parametrize("comp", COMPONENTS, ids=lambda c: f"{c['type']}-{c.get('orient', c.get('kind', 'line'))}")
+def test_arc_follows_the_sampled_trace(comp):
+    arc = component_arc(ZA, comp, FREQ, Z0)
+    gammas = to_gamma(component_trace(ZA, comp, FREQ, Z0, steps=200), Z0)
+    assert isinstance(arc, Arc)
+    np.testing.assert_allclose(np.abs(gammas - arc.center), arc.radius, atol=1e-9)
+    end = arc.start + arc.extent
+    assert arc.point(end) == pytest.approx(gammas[-1], abs=1e-9)
+    # every sample lies on the drawn part of the circle, in drawing order
+    swept = _swept(arc, gammas[1:-1])
+    assert np.all(swept <= abs(arc.extent) + 1e-6)
+    assert np.all(np.diff(swept) >= -1e-6)
+
+
+def test_arc_starts_at_the_load():
+    arc = component_arc(ZA, COMPONENTS[0], FREQ, Z0)
+    assert arc.point(arc.start) == pytest.approx(complex(to_gamma(ZA, Z0)))
+
+
+def test_short_stub_starts_at_the_short_circuit():
+    arc = component_arc(ZA, COMPONENTS[-1], FREQ, Z0)
+    assert arc.point(arc.start) == pytest.approx(-1, abs=1e-9)
+
+
+def test_long_line_covers_the_full_circle():
+    arc = component_arc(ZA, {"type": "TL", "length": 200.0, "z0": 75.0}, FREQ, Z0)
+    assert arc.extent == -360.0
+
+
+def test_real_loads_and_open_ends():
+    # a resistor on a real load stays on the real axis
+    path = component_arc(30.0, {"type": "R", "value": 20.0, "orient": "series"}, FREQ, Z0)
+    assert isinstance(path, Segment)
+    assert path.end == pytest.approx(complex(to_gamma(50.0, Z0)), abs=1e-12)
+    # a path starting at an open circuit has no closed form
+    assert component_arc(np.inf, COMPONENTS[0], FREQ, Z0) is None
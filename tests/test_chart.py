@@ -0,0 +1,93 @@
+import os
+from xml.dom import minidom
+
+import numpy as np
+import pytest
+
+from smithpy.chart import (
+    OffscreenCanvas,
+    design_filenames,
+    render_design,
+    render_designs,
+)
+from smithpy.design import parse_design
+
+DESIGN = parse_design({
+    "name": "L match <1 GHz>",
+    "za": "25+10j",
+    "freq": "1 GHz",
+    "components": [
+        {"type": "L", "value": "10 nH", "orient": "series"},
+        {"type": "C", "value": "2.2 pF", "orient": "shunt"},
+        {"type": "TL", "length": 45, "z0": 75},
+        {"type": "STUB", "length": 30, "kind": "short"},
+    ],
+})
+
+
+def _svg(canvas):
+    return minidom.parseString(canvas.to_svg()).documentElement
+
+
+def test_render_design_stacks_one_panel_per_chart():
+    canvas = render_design(DESIGN, width=300, height=200, freqs=np.linspace(0.5e9, 1.5e9, 51))
+    root = _svg(canvas)
+    assert (root.getAttribute("width"), root.getAttribute("height")) == ("300", "400")
+    panels = [n for n in root.childNodes if n.nodeType == n.ELEMENT_NODE and n.tagName == "svg"]
+    assert [p.getAttribute("y") for p in panels] == ["0", "200"]
+    for panel in panels:
+        # grid, trace arcs and the sweep locus
+        assert panel.getElementsByTagName("path")
+        assert panel.getElementsByTagName("polyline")
+        assert panel.getElementsByTagName("text")
+
+
+def test_polyline_traces_and_single_chart():
+    canvas = render_design(DESIGN, charts="admittance", analytic=False, steps=20)
+    assert len(canvas.panels) == 1
+    _svg(canvas)
+    with pytest.raises(ValueError):
+        render_design(DESIGN, charts=("polar",))
+
+
+def test_text_is_escaped():
+    canvas = OffscreenCanvas(100, 50)
+    canvas.create_text(10, 10, text="a < b & c", anchor="nw", tags="label")
+    canvas.create_arc(0, 0, 40, 40, start=30, extent=-200)
+    assert _svg(canvas).getElementsByTagName("text")[0].firstChild.data == "a < b & c"
+    assert canvas.find_withtag("label") == (1,)
+    canvas.delete("label")
+    assert len(canvas.items) == 1
+
+
+def test_design_filenames():
+    designs = [DESIGN] + [{"name": ""}] * 10
+    names = design_filenames(designs, "png")
+    assert names[0] == "00-L_match_1_GHz.png"
+    assert names[1] == "01-design.png"
+    assert len(set(names)) == 11
+
+
+def test_render_designs_writes_files(tmp_path):
+    paths = render_designs([DESIGN, DESIGN], tmp_path / "out", workers=1, width=200, height=200)
+    assert [os.path.basename(p) for p in paths] == ["0-L_match_1_GHz.svg", "1-L_match_1_GHz.svg"]
+    for path in paths:
+        minidom.parse(path)
+    with pytest.raises(ValueError):
+        render_designs([DESIGN], tmp_path, fmt="gif")
+
+
+def test_save_follows_the_extension(tmp_path):
+    canvas = render_design(DESIGN, width=120, height=120)
+    canvas.save(tmp_path / "chart.SVG")
+    minidom.parse(str(tmp_path / "chart.SVG"))
+    with pytest.raises(ValueError):
+        canvas.save(tmp_path / "chart.jpg")
+
+
+def test_png_output(tmp_path):
+    image = pytest.importorskip("PIL.Image")
+    canvas = render_design(DESIGN, width=120, height=100)
+    canvas.save(tmp_path / "chart.png")
+    with image.open(tmp_path / "chart.png") as png:
+        assert png.size == (120, 200)
@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from smithpy.cli import evaluate_design, evaluate_designs, main
+from smithpy.design import load_designs, parse_design
+
+DESIGN = {
+    "name": "match 1",
+    "z0": 50,
+    "freq": "1 GHz",
+    "za": "25+10j",
+    "components": [
+        {"type": "L", "value": "10 nH", "orient": "series"},
+        {"type": "C", "value": 2e-12, "orient": "shunt"},
+        {"type": "TL", "length": 45, "z0": 75},
+        {"type": "STUB", "length": "0.125 λ", "kind": "open"},
+    ],
+}
+
+
+def test_parse_design():
+    design = parse_design(DESIGN)
+    assert design["freq"] == 1e9 and design["za"] == 25 + 10j
+    comps = design["components"]
+    assert comps[0]["value"] == pytest.approx(10e-9)
+    assert comps[2]["z0"] == 75.0 and comps[3]["z0"] == 50.0
+    assert comps[3]["length"] == pytest.approx(45.0) and comps[3]["kind"] == "open"
+    with pytest.raises(ValueError, match="match 1"):
+        parse_design({**DESIGN, "components": [{"type": "L", "value": "10 nH", "orient": "up"}]})
+    with pytest.raises(ValueError):
+        parse_design({"components": [{"type": "Q"}]})
+
+
+def test_design_defaults(monkeypatch, capsys):
+    design = parse_design({"name": "x", "components": []})
+    assert (design["z0"], design["freq"], design["za"]) == (50.0, 1e9, 50 + 0j)
+    assert parse_design({"za": 30 - 5j})["za"] == 30 - 5j
+    assert parse_design({"za": [30, -5]})["za"] == 30 - 5j
+    # a design without za is evaluated against the default load
+    monkeypatch.setattr(sys, "stdin", io.StringIO('{"name": "x", "components": []}'))
+    assert main(["eval", "-", "--format", "json"]) == 0
+    result = json.loads(capsys.readouterr().out)[0]
+    assert result["z"] == [[50.0, 0.0]] and result["vswr"] == [1.0]
+
+
+def test_load_design_file_layouts():
+    one = json.dumps(DESIGN)
+    assert len(load_designs(one)) == 1
+    assert len(load_designs(json.dumps([DESIGN, DESIGN]))) == 2
+    assert len(load_designs(json.dumps({"designs": [DESIGN] * 3}))) == 3
+    assert len(load_designs(f"{one}\n\n{one}\n")) == 2
+
+
+def test_batched_evaluation_matches_single_designs():
+    designs = [parse_design({**DESIGN, "za": [10 * i + 5, i]}) for i in range(5)]
+    freqs = np.linspace(0.5e9, 1.5e9, 11)
+    results = list(evaluate_designs(designs, freqs, batch=2))
+    assert [d["za"] for d, _ in results] == [d["za"] for d in designs]
+    for design, result in results:
+        expected = evaluate_design(design, freqs)
+        for key in ("z", "gamma", "return_loss", "vswr"):
+            np.testing.assert_allclose(result[key], expected[key])
+    # without frequencies each design is evaluated at its own freq
+    (_, own), = evaluate_designs(designs[:1])
+    assert own["freqs"].tolist() == [1e9]
+
+
+def test_eval_command(tmp_path, capsys):
+    path = tmp_path / "designs.json"
+    path.write_text(json.dumps([DESIGN, {**DESIGN, "name": "match 2"}]))
+    out = tmp_path / "out.csv"
+    assert main(["eval", str(path), "--start", "0.5G", "--stop", "1.5G", "--points", "3",
+                 "--format", "csv", "-o", str(out)]) == 0
+    rows = list(csv.DictReader(io.StringIO(out.read_text())))
+    assert len(rows) == 6 and rows[3]["design"] == "match 2"
+    assert main(["eval", str(path), "-f", "1G", "--format", "json"]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert [d["name"] for d in data] == ["match 1", "match 2"] and data[0]["freq"] == [1e9]
+
+
+def test_eval_errors(tmp_path, capsys):
+    path = tmp_path / "designs.json"
+    path.write_text(json.dumps(DESIGN))
+    assert main(["eval", str(path), "-f", "1G", "--start", "1G", "--stop", "2G"]) == 1
+    assert main(["eval", str(tmp_path / "missing.json")]) == 1
+    assert "smithpy eval: error" in capsys.readouterr().err
+
+
+def test_gui_is_the_default_command(monkeypatch):
+    calls = []
+    fake = types.ModuleType("smithpy.app")
+    fake.run = lambda profile=None: calls.append(profile)
+    monkeypatch.setitem(sys.modules, "smithpy.app", fake)
+    assert main([]) == 0
+    assert main(["--profile"]) == 0
+    assert main(["gui", "--profile", "out.prof"]) == 0
+    assert calls == [None, "smithpy.prof", "out.prof"]
+
+
+def test_app_main_delegates_to_the_gui_command(monkeypatch):
+    app = pytest.importorskip("smithpy.app")
+    calls = []
+    monkeypatch.setattr(app, "run", lambda profile=None: calls.append(profile))
+    monkeypatch.setattr(sys, "argv", ["smithpy-app", "--profile", "gui.prof"])
+    assert app.main() == 0
+    assert calls == ["gui.prof"]
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from smithpy.components import EMPTY, Component, PackedChain, kind_code
+from smithpy.engine import apply_component, component_trace
+from smithpy.network import chain_response
+
+FREQ = 1e9
+Z0 = 50.0
+COMPONENTS = [
+    {"type": "L", "value": 10e-9, "orient": "series"},
+    {"type": "C", "value": 2e-12, "orient": "shunt"},
+    {"type": "R", "value": 20.0, "orient": "series"},
+    {"type": "R", "value": 200.0, "orient": "shunt"},
+    {"type": "TL", "length": 60.0, "z0": 75.0},
+    {"type": "STUB", "length": 40.0, "z0": 50.0, "kind": "open"},
+    {"type": "STUB", "length": 40.0, "kind": "short"},
+]
+
+
+@pytest.mark.parametrize("comp", COMPONENTS, ids=lambda c: c["type"])
+def test_component_matches_apply_component(comp):
+    part = Component.from_dict(comp).prepare(FREQ, Z0)
+    assert complex(part.evaluate(25 + 10j)) == pytest.approx(apply_component(25 + 10j, comp, FREQ, Z0))
+    np.testing.assert_allclose(part.trace(25 + 10j, 20), component_trace(25 + 10j, comp, FREQ, Z0, steps=20))
+    assert Component.from_dict(part.to_dict()).to_dict() == part.to_dict()
+
+
+def test_evaluate_requires_prepare():
+    with pytest.raises(RuntimeError):
+        Component.from_dict(COMPONENTS[0]).evaluate(50.0)
+    with pytest.raises(ValueError):
+        kind_code({"type": "X"})
+
+
+def test_packed_chain_matches_chain_response():
+    rng = np.random.default_rng(1)
+    designs = []
+    for i in range(30):
+        picks = rng.choice(len(COMPONENTS), size=rng.integers(0, 6))
+        designs.append({
+            "components": [COMPONENTS[k] for k in picks],
+            "za": complex(rng.uniform(5, 200), rng.uniform(-100, 100)),
+            "z0": [50.0, 75.0][i % 2],
+            "freq": rng.uniform(0.5e9, 2e9),
+        })
+    packed = PackedChain.from_designs(designs)
+    assert len(packed) == 30 and (packed.kinds == EMPTY).any()
+    freqs = np.linspace(0.5e9, 2e9, 9)
+    z = packed.response(freqs)
+    at_design = packed.response()
+    for d, zi, zd in zip(designs, z, at_design):
+        expected = chain_response(d["components"], d["za"], d["z0"], freqs, ref_freq=d["freq"])
+        np.testing.assert_allclose(zi, expected, rtol=1e-10)
+        own = chain_response(d["components"], d["za"], d["z0"], np.array([d["freq"]]))
+        np.testing.assert_allclose(zd, own, rtol=1e-10)
+
+
+def test_fixed_line_lengths_without_ref_freq():
+    chain = [COMPONENTS[4]]
+    packed = PackedChain.from_chains([chain], 25 + 10j, Z0)
+    freqs = np.array([0.5e9, 1e9, 2e9])
+    np.testing.assert_allclose(packed.response(freqs)[0], chain_response(chain, 25 + 10j, Z0, freqs))
+    assert np.ptp(packed.response(freqs)[0]) == 0
+    # there is no frequency to evaluate at without freqs
+    with pytest.raises(ValueError):
+        packed.response()
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from smithpy.decimate import decimate, decimate_bounds
+
+# a dropped point may sit anywhere in the grid cell of the point before it
+# (stage 1) and then up to ``tol`` off the line through the kept neighbours
+SLACK = 1 + np.sqrt(2)
+
+
+def _deviation(xy, kept):
+    """Return the distance of every point from its segment of the kept polyline."""
+    seg = np.clip(np.searchsorted(kept, np.arange(len(xy)), "right") - 1, 0, len(kept) - 2)
+    a, b = xy[kept[seg]], xy[kept[seg + 1]]
+    d = b - a
+    t = np.einsum("ij,ij->i", xy - a, d) / np.maximum(np.einsum("ij,ij->i", d, d), 1e-300)
+    nearest = a + np.clip(t, 0, 1)[:, None] * d
+    return np.hypot(*(xy - nearest).T)
+
+
+def _spiral(n=20000, turns=6, radius=300.0):
+    t = np.linspace(0, 1, n)
+    angle = 2 * np.pi * turns * t
+    return np.column_stack([400 + radius * t * np.cos(angle), 400 + radius * t * np.sin(angle)])
+
+
+@pytest.mark.parametrize("tol", [0.25, 0.5, 2.0])
+def test_deviation_within_tolerance(tol):
+    xy = _spiral()
+    kept = decimate(xy, tol)
+    assert np.all(np.diff(kept) > 0)
+    assert kept[0] == 0 and kept[-1] == len(xy) - 1
+    assert len(kept) < len(xy) / 5
+    assert _deviation(xy, kept).max() <= SLACK * tol
+
+
+def test_noisy_trace_keeps_the_peaks():
+    x = np.linspace(0, 500, 5000)
+    y = 100 + 40 * np.sin(x / 7) + np.where(np.arange(5000) % 1000 == 500, 30.0, 0.0)
+    xy = np.column_stack([x, y])
+    kept = decimate(xy, 0.5)
+    assert set(range(500, 5000, 1000)) <= set(kept.tolist())
+    assert _deviation(xy, kept).max() <= SLACK * 0.5
+
+
+def test_short_inputs_and_gaps():
+    assert decimate(np.zeros((2, 2))).tolist() == [0, 1]
+    assert decimate(np.zeros((0, 2))).size == 0
+    xy = _spiral(1000)
+    xy[400] = np.nan
+    assert 400 in decimate(xy).tolist()
+
+
+def test_breaks_and_bounds():
+    a, b = _spiral(3000), _spiral(2000, turns=2)[::-1]
+    xy = np.concatenate([a, b])
+    bounds = [(0, 3000), (3000, 5000)]
+    kept = decimate(xy, 0.5, breaks=[0, 2999, 3000, 4999])
+    assert {0, 2999, 3000, 4999} <= set(kept.tolist())
+    (s0, e0), (s1, e1) = decimate_bounds(kept, bounds)
+    assert (kept[s0], kept[e0 - 1], kept[s1], kept[e1 - 1]) == (0, 2999, 3000, 4999)
+    assert e0 == s1 and e1 == len(kept)
+    for (lo, hi), (s, e) in zip(bounds, [(s0, e0), (s1, e1)]):
+        assert _deviation(xy[lo:hi], kept[s:e] - lo).max() <= SLACK * 0.5
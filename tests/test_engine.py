@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+
+from smithpy import engine
+from smithpy.engine import (
+    ChainCache,
+    apply_component,
+    chain_points,
+    component_trace,
+    evaluate_chain,
+    match_metrics,
+    sweep_frequencies,
+    to_gamma,
+)
+
+FREQ = 1e9
+Z0 = 50.0
+W = 2 * np.pi * FREQ
+
+
+def test_to_gamma_special_points():
+    g = to_gamma([50, 0, np.inf, 150], Z0)
+    np.testing.assert_allclose(g, [0, -1, 1, 0.5])
+
+
+@pytest.mark.parametrize("comp, expected", [
+    ({"type": "L", "value": 10e-9, "orient": "series"}, 25 + 10j + 1j * W * 10e-9),
+    ({"type": "C", "value": 2e-12, "orient": "series"}, 25 + 10j - 1j / (W * 2e-12)),
+    ({"type": "R", "value": 20.0, "orient": "series"}, 45 + 10j),
+    ({"type": "C", "value": 2e-12, "orient": "shunt"}, 1 / (1 / (25 + 10j) + 1j * W * 2e-12)),
+    ({"type": "R", "value": 200.0, "orient": "shunt"}, 1 / (1 / (25 + 10j) + 1 / 200)),
+])
+def test_lumped_components(comp, expected):
+    assert apply_component(25 + 10j, comp, FREQ, Z0) == pytest.approx(expected)
+
+
+def test_quarter_wave_line_inverts_the_load():
+    comp = {"type": "TL", "length": 90.0, "z0": 75.0}
+    assert apply_component(25 + 10j, comp, FREQ, Z0) == pytest.approx(75 ** 2 / (25 + 10j))
+
+
+def test_stubs():
+    # a 90° short-circuited stub is an open circuit, an open one a short
+    short = {"type": "STUB", "length": 90.0, "z0": 50.0, "kind": "short"}
+    open_ = {"type": "STUB", "length": 90.0, "z0": 50.0, "kind": "open"}
+    assert apply_component(25 + 10j, short, FREQ, Z0) == pytest.approx(25 + 10j)
+    assert abs(apply_component(25 + 10j, open_, FREQ, Z0)) < 1e-9
+
+
+def test_line_length_scales_with_frequency():
+    comp = {"type": "TL", "length": 45.0, "z0": 75.0}
+    at_double = apply_component(30 + 5j, comp, 2 * FREQ, Z0, ref_freq=FREQ)
+    assert at_double == pytest.approx(apply_component(30 + 5j, {**comp, "length": 90.0}, FREQ, Z0))
+
+
+def test_component_trace_ends_at_full_value():
+    comp = {"type": "L", "value": 10e-9, "orient": "shunt"}
+    trace = component_trace(25 + 10j, comp, FREQ, Z0, steps=50)
+    assert trace.size == 50
+    assert trace[-1] == pytest.approx(apply_component(25 + 10j, comp, FREQ, Z0))
+
+
+def test_evaluate_chain_continues_from_previous_component():
+    comps = [
+        {"type": "L", "value": 5e-9, "orient": "series"},
+        {"type": "C", "value": 1e-12, "orient": "shunt"},
+        {"type": "TL", "length": 30.0, "z0": 75.0},
+    ]
+    traces = evaluate_chain(comps, 25 + 10j, Z0, FREQ, steps=20)
+    z = 25 + 10j
+    for comp, trace in zip(comps, traces):
+        z = apply_component(z, comp, FREQ, Z0)
+        assert trace[-1] == pytest.approx(z)
+    points = chain_points(comps, 25 + 10j, Z0, FREQ, steps=20)
+    assert points.size == 61 and points[0] == 25 + 10j
+
+
+def test_match_metrics():
+    m = match_metrics(np.array([50.0, 100.0]), Z0)
+    assert m["vswr"] == pytest.approx([1.0, 2.0])
+    assert np.isinf(m["return_loss"][0])
+    assert m["return_loss"][1] == pytest.approx(-20 * np.log10(1 / 3))
+    assert m["mismatch_loss"][1] == pytest.approx(-10 * np.log10(1 - 1 / 9))
+
+
+def test_sweep_frequencies():
+    np.testing.assert_allclose(sweep_frequencies(1e6, 1e9, 4, "log"), [1e6, 1e7, 1e8, 1e9])
+    assert sweep_frequencies(1.0, 2.0, 3).tolist() == [1.0, 1.5, 2.0]
+    with pytest.raises(ValueError):
+        sweep_frequencies(2.0, 1.0, 3)
+    with pytest.raises(ValueError):
+        sweep_frequencies(1.0, 2.0, 3, "cubic")
+
+
+CHAIN = [
+    {"type": "L", "value": 5e-9, "orient": "series"},
+    {"type": "C", "value": 1e-12, "orient": "shunt"},
+    {"type": "TL", "length": 30.0, "z0": 75.0},
+    {"type": "STUB", "length": 40.0, "z0": 50.0, "kind": "short"},
+    {"type": "R", "value": 20.0, "orient": "series"},
+]
+
+
+@pytest.fixture
+def computed(monkeypatch):
+    """Record the type of every component whose trace is computed."""
+    calls = []
+    trace = engine.component_trace
+
+    def counting(z, comp, *args):
+        calls.append(comp["type"])
+        return trace(z, comp, *args)
+
+    monkeypatch.setattr(engine, "component_trace", counting)
+    return calls
+
+
+def _check(cache, computed, comps, za=25 + 10j, z0=Z0, freq=FREQ, steps=20):
+    """Compare the cached traces with uncached ones; return what the cache computed."""
+    expected = chain_points(comps, za, z0, freq, steps)
+    start = len(computed)
+    traces = cache.evaluate(comps, za, z0, freq, steps)
+    np.testing.assert_allclose(np.concatenate([[za], *traces]), expected)
+    return computed[start:]
+
+
+@pytest.mark.parametrize("k", range(len(CHAIN)))
+def test_chain_cache_recomputes_from_the_edited_component(computed, k):
+    cache = ChainCache()
+    _check(cache, computed, CHAIN)
+    comps = list(CHAIN)
+    key = "length" if "length" in comps[k] else "value"
+    comps[k] = {**comps[k], key: comps[k][key] * 1.5}
+    assert _check(cache, computed, comps) == [c["type"] for c in CHAIN[k:]]
+    # an unchanged chain is served from the cache
+    assert _check(cache, computed, comps) == []
+
+
+def test_chain_cache_reorder_insert_and_remove(computed):
+    cache = ChainCache()
+    _check(cache, computed, CHAIN)
+    swapped = [CHAIN[0], CHAIN[2], CHAIN[1], *CHAIN[3:]]
+    assert _check(cache, computed, swapped) == ["TL", "C", "STUB", "R"]
+    assert _check(cache, computed, CHAIN[:2]) == ["C"]
+    assert len(cache) == 2
+    inserted = CHAIN[:2] + [{"type": "R", "value": 10.0, "orient": "shunt"}] + CHAIN[2:]
+    assert _check(cache, computed, inserted) == ["R", "TL", "STUB", "R"]
+    # editing a dict in place is seen through its key
+    comps = [dict(c) for c in CHAIN]
+    _check(cache, computed, comps)
+    comps[1]["orient"] = "series"
+    assert len(_check(cache, computed, comps)) == 4
+
+
+@pytest.mark.parametrize("change", [
+    {"za": 30 - 5j}, {"z0": 75.0}, {"freq": 2e9}, {"steps": 7},
+])
+def test_chain_cache_drops_entries_on_new_settings(computed, change):
+    cache = ChainCache()
+    _check(cache, computed, CHAIN)
+    assert len(_check(cache, computed, CHAIN, **change)) == len(CHAIN)
+
+
+def test_chain_cache_invalidate_and_read_only_traces(computed):
+    cache = ChainCache()
+    _check(cache, computed, CHAIN)
+    cache.invalidate(3)
+    assert len(cache) == 3
+    assert _check(cache, computed, CHAIN) == ["STUB", "R"]
+    traces = cache.evaluate(CHAIN, 25 + 10j, Z0, FREQ, 20)
+    with pytest.raises(ValueError):
+        traces[0][0] = 0
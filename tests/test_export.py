@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from smithpy.engine import sweep_frequencies
+from smithpy.export import export_response, frequency_chunks
+from smithpy.network import chain_response
+from smithpy.touchstone import read_touchstone
+
+CHAIN = [
+    {"type": "L", "value": 10e-9, "orient": "series"},
+    {"type": "C", "value": 2e-12, "orient": "shunt"},
+    {"type": "TL", "length": 60.0, "z0": 75.0},
+]
+ZA = 25 + 10j
+
+
+@pytest.mark.parametrize("scale", ["linear", "log"])
+def test_frequency_chunks_match_sweep_frequencies(scale):
+    chunks = list(frequency_chunks(1e6, 1e9, 1001, scale, chunk=64))
+    assert max(c.size for c in chunks) == 64
+    np.testing.assert_allclose(np.concatenate(chunks), sweep_frequencies(1e6, 1e9, 1001, scale))
+
+
+@pytest.mark.parametrize("ext", [".s1p", ".npy", ".npz"])
+def test_export_round_trip(tmp_path, ext):
+    path = tmp_path / f"response{ext}"
+    count = export_response(path, CHAIN, ZA, 50.0, 0.5e9, 1.5e9, 301, ref_freq=1e9, chunk=100)
+    assert count == 301
+    freqs = sweep_frequencies(0.5e9, 1.5e9, 301)
+    z = chain_response(CHAIN, ZA, 50.0, freqs, ref_freq=1e9)
+    if ext == ".s1p":
+        data = read_touchstone(path)
+        np.testing.assert_allclose(data.freqs, freqs, rtol=1e-9)
+        np.testing.assert_allclose(data.impedance(), z, rtol=1e-7)
+        return
+    rec = np.load(path)
+    if ext == ".npz":
+        rec = rec["response"]
+    np.testing.assert_allclose(rec["freq"], freqs)
+    np.testing.assert_allclose(rec["z"], z)
+    np.testing.assert_allclose(rec["s11"], (z - 50) / (z + 50))
+
+
+def test_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        export_response(tmp_path / "out.csv", CHAIN, ZA, 50.0, 1e9, 2e9, 3)
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from smithpy.jobs import CancelToken, JobCancelled, JobManager
+
+
+class FakeWidget:
+    """Records ``after`` callbacks instead of running a Tk main loop."""
+
+    def __init__(self):
+        self.calls = []
+
+    def after(self, ms, func):
+        self.calls.append(func)
+        return len(self.calls)
+
+    def after_cancel(self, job):
+        self.calls[job - 1] = None
+
+    def run(self, manager, timeout=5.0):
+        """Poll like the Tk main loop until no job is pending."""
+        deadline = time.monotonic() + timeout
+        while manager.pending and time.monotonic() < deadline:
+            time.sleep(0.005)
+            calls, self.calls = [c for c in self.calls if c], []
+            for func in calls:
+                func()
+        assert not manager.pending
+
+
+@pytest.fixture
+def jobs():
+    widget = FakeWidget()
+    manager = JobManager(widget)
+    yield widget, manager
+    manager.shutdown()
+
+
+def test_cancel_token():
+    seen = []
+    token = CancelToken(seen.append)
+    token.progress(0.5)
+    assert seen == [0.5] and not token.cancelled
+    token.cancel()
+    with pytest.raises(JobCancelled):
+        token.check()
+    with pytest.raises(JobCancelled):
+        token.progress(1.0)
+    assert seen == [0.5]
+
+
+def test_results_progress_and_errors(jobs):
+    widget, manager = jobs
+    results, errors, progress = [], [], []
+
+    def work(token, n):
+        for i in range(n):
+            token.progress((i + 1) / n)
+        return n * 2
+
+    manager.submit("work", work, 3, callback=results.append, progress=progress.append)
+    manager.submit("fail", lambda token: 1 / 0, error=errors.append)
+    assert manager.pending == {"work", "fail"}
+    widget.run(manager)
+    assert results == [6] and progress == [1 / 3, 2 / 3, 1.0]
+    assert isinstance(errors[0], ZeroDivisionError)
+
+
+def test_resubmitting_cancels_and_drops_the_old_job(jobs):
+    widget, manager = jobs
+    started, release, results = threading.Event(), threading.Event(), []
+
+    def slow(token):
+        started.set()
+        release.wait(5)
+        token.check()
+        return "old"
+
+    old = manager.submit("job", slow, callback=results.append)
+    assert started.wait(5)
+    manager.submit("job", lambda token: "new", callback=results.append)
+    assert old.cancelled
+    release.set()
+    widget.run(manager)
+    assert results == ["new"]
+
+
+def test_cancelled_jobs_deliver_nothing(jobs):
+    widget, manager = jobs
+    release, results = threading.Event(), []
+
+    def slow(token):
+        release.wait(5)
+        return "late"
+
+    manager.submit("job", slow, callback=results.append)
+    manager.cancel("job")
+    release.set()
+    assert not manager.pending
+    time.sleep(0.05)
+    manager.poll()
+    assert results == []
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from smithpy.loadpull import load_response, load_statistics, parse_loads, read_loads
+from smithpy.network import chain_response
+
+FREQ = 1e9
+Z0 = 50.0
+CHAIN = [
+    {"type": "L", "value": 10e-9, "orient": "series"},
+    {"type": "C", "value": 2e-12, "orient": "shunt"},
+    {"type": "TL", "length": 60.0, "z0": 75.0},
+    {"type": "STUB", "length": 40.0, "z0": 50.0, "kind": "short"},
+]
+
+
+def test_parse_load_formats():
+    text = """\
+re, im            # header
+25+10j
+25 + 10j
+25 10
+25,10
+25;10
+25\t10
+25 +10j
+  # only a comment
+
+1e2 -5e1          # exponents are not a header
+"""
+    np.testing.assert_array_equal(parse_loads(text), [25 + 10j] * 7 + [100 - 50j])
+
+
+def test_parse_admittances():
+    np.testing.assert_allclose(parse_loads(["0.02", "0.01 0.01"], admittance=True),
+                               [50, 50 - 50j])
+
+
+@pytest.mark.parametrize("lines", [["25+10j", "load"], ["1,2,3"], ["25 10 5"], ["25 10j"]])
+def test_invalid_loads(lines):
+    with pytest.raises(ValueError, match="line"):
+        parse_loads(lines)
+
+
+def test_read_loads(tmp_path):
+    path = tmp_path / "loads.csv"
+    path.write_text("Re,Im\n10,1\n20,2\n")
+    np.testing.assert_array_equal(read_loads(path), [10 + 1j, 20 + 2j])
+
+
+def test_load_response_matches_chain_response():
+    rng = np.random.default_rng(3)
+    loads = rng.uniform(5, 200, 50) + 1j * rng.uniform(-100, 100, 50)
+    z = load_response(CHAIN, loads, Z0, FREQ)
+    expected = [chain_response(CHAIN, za, Z0, np.array([FREQ]))[0] for za in loads]
+    np.testing.assert_allclose(z, expected, rtol=1e-12)
+    # one row of frequencies per load
+    freqs = np.array([0.8e9, 1e9, 1.2e9])
+    grid = load_response(CHAIN, loads[:, None], Z0, freqs, ref_freq=FREQ)
+    assert grid.shape == (50, 3)
+    np.testing.assert_allclose(grid[7], chain_response(CHAIN, loads[7], Z0, freqs, ref_freq=FREQ))
+
+
+def test_load_statistics():
+    stats = load_statistics([50, 100, 25, 150], Z0, vswr=2.5)
+    assert stats["count"] == 4
+    assert stats["vswr_max"] == pytest.approx(3.0)
+    assert stats["vswr_median"] == pytest.approx(2.0)
+    assert np.isinf(stats["rl_max"])
+    assert stats["rl_min"] == pytest.approx(-20 * np.log10(0.5))
+    assert stats["yield"] == pytest.approx(0.75)
+    assert load_statistics([]) == {"count": 0}
@@ -0,0 +1,116 @@
+import io
+
+import pytest
+
+from smithpy.netlist import netlist_format, read_ladder, read_netlist, read_spice
+
+KEYS = ("type", "value", "orient", "length", "z0", "kind")
+
+
+def _summary(chain):
+    return [{k: c[k] for k in KEYS if k in c} for c in chain]
+
+
+LADDER = """\
+# kind  orientation  value  [line z0]
+L    series  10nH
+C    shunt   2.2p    # trailing comment
+R    shunt   4.7k
+
+TL   45      75
+STUB open    30   50
+STUB short   0.1λ
+"""
+
+
+def test_read_ladder():
+    assert _summary(read_ladder(io.StringIO(LADDER), z0=60.0)) == [
+        {"type": "L", "value": pytest.approx(10e-9), "orient": "series"},
+        {"type": "C", "value": pytest.approx(2.2e-12), "orient": "shunt"},
+        {"type": "R", "value": pytest.approx(4.7e3), "orient": "shunt"},
+        {"type": "TL", "length": 45.0, "z0": 75.0},
+        {"type": "STUB", "length": 30.0, "z0": 50.0, "kind": "open"},
+        {"type": "STUB", "length": pytest.approx(36.0), "z0": 60.0, "kind": "short"},
+    ]
+
+
+@pytest.mark.parametrize("text", ["L diagonal 10n", "X series 1", "STUB closed 30", "C series"])
+def test_ladder_errors_name_the_line(text):
+    with pytest.raises(ValueError, match="line 2"):
+        read_ladder(["L series 1n", text])
+
+
+SPICE = """\
+matching network
+V1 in 0 AC 1
+L1 in mid 10n
+C1 mid 0 2.2pF
+* comment
+R1 mid out
++ 4.7k
+T1 out 0 load 0 Z0=75 TD=125p
+T2 load 0 nc 0 Z0=50 F=1G NL=0.1 ; open stub
+T3 load 0 0 0 Z0=50 F=1G NL=0.25
+RL load 0 1meg
+.end
+R9 ignored 0 1
+"""
+
+
+def test_read_spice_orders_the_chain_from_the_load():
+    # the source node is ``in``, so the chain starts at ``load``; parallel
+    # elements keep the file order, with stubs after the lumped parts
+    assert _summary(read_spice(io.StringIO(SPICE), ref_freq=1e9)) == [
+        {"type": "R", "value": pytest.approx(1e6), "orient": "shunt"},
+        {"type": "STUB", "length": pytest.approx(36.0), "z0": 50.0, "kind": "open"},
+        {"type": "STUB", "length": pytest.approx(90.0), "z0": 50.0, "kind": "short"},
+        {"type": "TL", "length": pytest.approx(45.0), "z0": 75.0},
+        {"type": "R", "value": pytest.approx(4.7e3), "orient": "series"},
+        {"type": "C", "value": pytest.approx(2.2e-12), "orient": "shunt"},
+        {"type": "L", "value": pytest.approx(10e-9), "orient": "series"},
+    ]
+
+
+def test_spice_without_source_starts_at_the_first_named_end():
+    chain = read_spice(["no source", "R1 a b 10", "C1 b 0 1p"])
+    assert [c["type"] for c in chain] == ["C", "R"]
+
+
+@pytest.mark.parametrize("title", [
+    "Test bench for the L match",
+    "R1 a b 10",
+    "Cascade of two sections",
+    "T network 50 to 10 ohm",
+    "* not a comment",
+    "",
+])
+def test_first_line_is_always_the_title(title):
+    chain = read_spice([title, "L1 a b 10n", "C1 b 0 1p"])
+    assert [c["type"] for c in chain] == ["C", "L"]
+    assert read_spice([title]) == []
+
+
+@pytest.mark.parametrize("lines, message", [
+    (["star", "R1 a b 10", "R2 a c 10", "R3 a d 10"], "not a ladder"),
+    (["split", "R1 a b 10", "R2 c d 10"], "not a ladder"),
+    (["title", "X1 a b sub"], "line 2"),
+    (["title", ".subckt amp a b"], "not supported"),
+    (["title", "+ 1k"], "line 2: continuation"),
+    (["title", "* comment", "T1 a b c 0 Z0=50"], "line 3: .*grounded"),
+])
+def test_spice_errors(lines, message):
+    with pytest.raises(ValueError, match=message):
+        read_spice(lines)
+
+
+def test_read_netlist_by_extension(tmp_path):
+    assert netlist_format("amp.CIR") == "spice"
+    assert netlist_format("amp.txt") == "ladder"
+    spice = tmp_path / "net.sp"
+    spice.write_text("series inductor\nL1 a b 10n\n")
+    assert read_netlist(spice)[0]["orient"] == "series"
+    ladder = tmp_path / "net.txt"
+    ladder.write_text("TL 90\n")
+    assert read_netlist(ladder, z0=75.0)[0]["z0"] == 75.0
+    with pytest.raises(ValueError):
+        read_netlist(ladder, fmt="verilog")
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from smithpy.engine import evaluate_chain
+from smithpy.network import (
+    abcd_to_s,
+    cascade,
+    chain_abcd,
+    chain_response,
+    component_abcd,
+    input_impedance,
+    s_to_abcd,
+    series_abcd,
+    shunt_abcd,
+    vary_component,
+)
+
+FREQ = 1e9
+Z0 = 50.0
+ZA = 25 + 10j
+CHAIN = [
+    {"type": "L", "value": 10e-9, "orient": "series"},
+    {"type": "C", "value": 2e-12, "orient": "shunt"},
+    {"type": "R", "value": 20.0, "orient": "series"},
+    {"type": "R", "value": 200.0, "orient": "shunt"},
+    {"type": "TL", "length": 60.0, "z0": 75.0},
+    {"type": "STUB", "length": 40.0, "z0": 50.0, "kind": "open"},
+    {"type": "STUB", "length": 40.0, "z0": 50.0, "kind": "short"},
+    {"type": "L", "value": 10e-9, "orient": "shunt"},
+    {"type": "C", "value": 2e-12, "orient": "series"},
+]
+
+
+def test_chain_response_matches_evaluate_chain():
+    traces = evaluate_chain(CHAIN, ZA, Z0, FREQ, steps=1)
+    z = chain_response(CHAIN, ZA, Z0, np.array([FREQ]))
+    assert z[0] == pytest.approx(traces[-1][-1])
+
+
+def test_chain_response_over_frequency():
+    freqs = np.linspace(0.5e9, 1.5e9, 7)
+    z = chain_response(CHAIN, ZA, Z0, freqs, ref_freq=FREQ)
+    for f, zf in zip(freqs, z):
+        scaled = [{**c, "length": c["length"] * f / FREQ} if "length" in c else c for c in CHAIN]
+        assert zf == pytest.approx(evaluate_chain(scaled, ZA, Z0, f, steps=1)[-1][-1])
+
+
+def test_empty_chain_returns_the_load():
+    assert chain_response([], ZA, Z0, np.array([FREQ]))[0] == ZA
+
+
+def test_abcd_s_round_trip():
+    abcd = chain_abcd(CHAIN, np.linspace(0.5e9, 1.5e9, 11), Z0)
+    np.testing.assert_allclose(s_to_abcd(abcd_to_s(abcd, Z0), Z0), abcd, rtol=1e-9, atol=1e-12)
+
+
+def test_s_parameters_of_a_matched_line():
+    s = abcd_to_s(component_abcd({"type": "TL", "length": 90.0, "z0": 50.0}, FREQ), Z0)
+    np.testing.assert_allclose(s, [[0, -1j], [-1j, 0]], atol=1e-12)
+
+
+def test_cascade_order_is_source_to_load():
+    m = cascade([series_abcd(10.0), shunt_abcd(0.01)])
+    # the shunt admittance terminates the load side, the series part adds on top
+    assert input_impedance(m, 100.0) == pytest.approx(10 + 1 / (0.01 + 1 / 100))
+
+
+def test_input_impedance_of_open_and_shorted_ends():
+    assert np.isinf(input_impedance(series_abcd(5.0), np.inf))
+    assert input_impedance(series_abcd(5.0), 0.0) == pytest.approx(5.0)
+    assert input_impedance(shunt_abcd(0.02), np.inf) == pytest.approx(50.0)
+
+
+def test_vary_component_stacks_values():
+    freqs = np.array([0.9e9, 1e9, 1.1e9])
+    values = [1e-9, 5e-9, 10e-9]
+    z = chain_response(vary_component(CHAIN, 0, "value", values), ZA, Z0, freqs)
+    assert z.shape == (3, 3)
+    for i, v in enumerate(values):
+        comps = [{**CHAIN[0], "value": v}] + CHAIN[1:]
+        np.testing.assert_allclose(z[i], chain_response(comps, ZA, Z0, freqs))
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from smithpy.engine import match_metrics, to_gamma
+from smithpy.network import chain_response
+from smithpy.overlays import (
+    BACKGROUND,
+    CONTOUR_COLOR,
+    HEAT_COLORS,
+    OverlayCache,
+    contour_mask,
+    gamma_grid,
+    heat_colors,
+    overlay_field,
+    overlay_key,
+    render_overlay,
+    to_ppm,
+)
+
+COMPONENTS = [
+    {"type": "L", "value": 10e-9, "orient": "series"},
+    {"type": "C", "value": 2e-12, "orient": "shunt"},
+]
+
+
+def test_gamma_grid_maps_pixel_centres():
+    gamma, inside = gamma_grid(4, 2, (2, 1), 2.0)
+    np.testing.assert_allclose(gamma[0], [-0.75 + 0.25j, -0.25 + 0.25j, 0.25 + 0.25j, 0.75 + 0.25j])
+    np.testing.assert_allclose(gamma[1].imag, -0.25)
+    assert inside.all()
+
+
+def test_fields():
+    gamma = np.array([0, 0.5, 1 / 3j])
+    np.testing.assert_allclose(overlay_field("vswr", gamma), [1, 3, 2])
+    z = 50 * (1 + gamma) / (1 - gamma)
+    np.testing.assert_allclose(overlay_field("q", gamma), np.abs(z.imag) / z.real, atol=1e-12)
+    np.testing.assert_allclose(overlay_field("mismatch", gamma),
+                               match_metrics(z, 50.0)["mismatch_loss"], atol=1e-12)
+    with pytest.raises(ValueError):
+        overlay_field("smith", gamma)
+
+
+@pytest.mark.parametrize("admittance", [False, True])
+def test_response_is_the_return_loss_for_each_load(admittance):
+    loads = np.array([25 + 10j, 80 - 40j, 10 + 0j])
+    gamma = to_gamma(loads, 50.0)
+    field = overlay_field("response", -gamma if admittance else gamma, admittance, COMPONENTS)
+    z = [chain_response(COMPONENTS, za, 50.0, np.array([1e9]))[0] for za in loads]
+    np.testing.assert_allclose(field, match_metrics(np.array(z), 50.0)["return_loss"])
+
+
+def test_contours_and_heat_colors():
+    field = np.array([[1.0, 1.4, 1.6, np.nan]])
+    np.testing.assert_array_equal(contour_mask(field, [1.5]), [[False, True, False, False]])
+    rgb = heat_colors(np.array([-1.0, 0.0, 10.0, 20.0, np.nan]), 0.0, 10.0)
+    np.testing.assert_array_equal(rgb[[0, 1, 4]], [HEAT_COLORS[0], HEAT_COLORS[0], BACKGROUND])
+    np.testing.assert_array_equal(rgb[2], rgb[3])
+    np.testing.assert_array_equal(rgb[2], HEAT_COLORS[-1])
+
+
+def test_render_overlay_and_ppm():
+    rgb = render_overlay("vswr", 101, 81, (50.5, 40.5), 40.0)
+    assert rgb.shape == (81, 101, 3) and rgb.dtype == np.uint8
+    assert (rgb == CONTOUR_COLOR).all(axis=2).any()
+    # nothing is drawn outside the unit circle
+    assert (rgb[0, 0] == BACKGROUND).all() and (rgb[:, :10] == BACKGROUND).all()
+    ppm = to_ppm(rgb)
+    assert ppm.startswith(b"P6 101 81 255\n") and len(ppm) == 14 + rgb.size
+
+
+def test_keys_and_cache():
+    base = overlay_key("vswr", 100, 100, (50, 50), 40.0, components=COMPONENTS)
+    assert base == overlay_key("vswr", 100, 100, (50, 50), 40.0)
+    changed = [{**COMPONENTS[0], "value": 12e-9}, COMPONENTS[1]]
+    assert (overlay_key("response", 100, 100, (50, 50), 40.0, components=COMPONENTS)
+            != overlay_key("response", 100, 100, (50, 50), 40.0, components=changed))
+    cache, made = OverlayCache(size=2), []
+
+    def create(key):
+        return lambda: made.append(key) or key
+
+    for key in ("a", "b", "a", "c", "b"):
+        cache.get(key, create(key))
+    # "a" was used again before "c" arrived, so "b" was evicted first
+    assert made == ["a", "b", "c", "b"] and len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
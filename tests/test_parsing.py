@@ -0,0 +1,141 @@
+import numpy as np
+import pytest
+
+from smithpy.parsing import (
+    PREFIXES,
+    parse_frequency,
+    parse_lc_value,
+    parse_ohm_value,
+    parse_spice_value,
+    parse_value,
+    parse_values,
+)
+
+
+@pytest.mark.parametrize("prefix", sorted(PREFIXES))
+def test_every_prefix(prefix):
+    assert parse_value(f"2.5{prefix}") == pytest.approx(2.5 * PREFIXES[prefix])
+    assert parse_value(f"2.5 {prefix}F", "F") == pytest.approx(2.5 * PREFIXES[prefix])
+
+
+@pytest.mark.parametrize("text, units, expected", [
+    ("10 nH", "H", 10e-9),
+    ("2.2pF", "F", 2.2e-12),
+    ("1F", "F", 1.0),
+    ("1e-9", (), 1e-9),
+    ("-3.3E2m", (), -0.33),
+    (".5k", (), 500.0),
+    ("2.2 GΩ", "ohm", 2.2e9),
+    ("4.7 kohm", "ohm", 4.7e3),
+    ("10 µH", "H", 10e-6),
+    ("10 μH", "H", 10e-6),
+    ("2.4 GHz", "Hz", 2.4e9),
+    ("1meg", (), 1e6),
+])
+def test_values_with_units(text, units, expected):
+    assert parse_value(text, units) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text, units, expected", [
+    ("4k7", "ohm", 4.7e3),
+    ("2n2", "F", 2.2e-9),
+    ("4R7", "ohm", 4.7),
+    ("1M5", "ohm", 1.5e6),
+    ("3p3F", "F", 3.3e-12),
+])
+def test_resistor_code(text, units, expected):
+    assert parse_value(text, units) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text, units", [
+    ("", ()),
+    ("4R7", "F"),
+    ("10 nH", "F"),
+    ("1x", ()),
+    ("nan", ()),
+    ("inf", ()),
+    ("1.2.3", ()),
+    ("1_000", ()),
+])
+def test_invalid_values(text, units):
+    with pytest.raises(ValueError):
+        parse_value(text, units)
+
+
+def test_typed_helpers():
+    assert parse_lc_value("50 uF") == pytest.approx(50e-6)
+    assert parse_ohm_value("75") == 75.0
+    assert parse_frequency("900M") == pytest.approx(900e6)
+    with pytest.raises(ValueError):
+        parse_frequency("0")
+
+
+@pytest.mark.parametrize("parse, text", [
+    (parse_lc_value, "-3n"),
+    (parse_lc_value, "0 pF"),
+    (parse_ohm_value, "-4.7k"),
+    (parse_ohm_value, "0"),
+])
+def test_component_values_must_be_positive(parse, text):
+    with pytest.raises(ValueError, match="positive"):
+        parse(text)
+
+
+def test_lower_case_mhz_is_megahertz():
+    assert parse_frequency("1.5 mhz") == pytest.approx(1.5e6)
+    assert parse_frequency("1.5mhz") == pytest.approx(1.5e6)
+    assert parse_frequency("1.5 mHz") == pytest.approx(1.5e-3)
+    assert parse_frequency("1.5 MHz") == pytest.approx(1.5e6)
+    # only frequencies read it that way
+    assert parse_value("1.5m") == pytest.approx(1.5e-3)
+
+
+def test_parse_values_agrees_with_parse_value():
+    texts = ["10 nH", "4k7", "1e-9", "2.2p", "4R7", "100"]
+    expected = [parse_value(t, ("H", "ohm")) for t in texts]
+    np.testing.assert_allclose(parse_values(texts, ("H", "ohm")), expected)
+    # the all-numeric fast path
+    np.testing.assert_allclose(parse_values(["1", " 2.5", "-3e3"]), [1, 2.5, -3e3])
+    assert parse_values([]).size == 0
+
+
+@pytest.mark.parametrize("texts", [
+    ["1", "nan"], ["inf", "2"], ["1", "x"], ["1", "-Infinity"], ["1_000", "2"],
+])
+def test_parse_values_rejects_what_parse_value_rejects(texts):
+    with pytest.raises(ValueError):
+        parse_values(texts)
+    out = parse_values(texts, errors="nan")
+    assert np.isnan(out).sum() == 1 and np.isfinite(out).sum() == 1
+
+
+def test_parse_values_errors_mode():
+    with pytest.raises(ValueError):
+        parse_values(["1"], errors="ignore")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("10", 10.0),
+    ("10n", 10e-9),
+    ("2.2pF", 2.2e-12),
+    ("1meg", 1e6),
+    ("1MEG", 1e6),
+    ("1M", 1e-3),
+    ("1m", 1e-3),
+    ("25mil", 25 * 25.4e-6),
+    ("4.7K", 4.7e3),
+    ("1g", 1e9),
+    ("3T", 3e12),
+    ("5f", 5e-15),
+    ("1uH", 1e-6),
+    ("75ohm", 75.0),
+    ("-1e-3u", -1e-9),
+])
+def test_spice_scale_factors(text, expected):
+    assert parse_spice_value(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text", ["", "k10", "1 0", "1.2.3"])
+def test_invalid_spice_values(text):
+    with pytest.raises(ValueError):
+        parse_spice_value(text)
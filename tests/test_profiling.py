@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from smithpy.profiling import JOB_PREFIX, Profiler
+
+
+def test_disabled_profiler_records_nothing():
+    prof = Profiler()
+    with prof.span("draw"):
+        prof.count("items", 5)
+    prof.end_frame(0.01)
+    assert not prof.totals and not prof.counters and prof.frames == 0
+
+
+def test_frame_spans_and_counters():
+    prof = Profiler()
+    prof.enable()
+    with prof.span("draw"):
+        with prof.span("grid"):
+            prof.count("items", 3)
+    prof.count("items")
+    prof.end_frame(0.02)
+    spans, counters, seconds = prof.last_frame
+    assert set(spans) == {"draw", "grid"} and spans["draw"] >= spans["grid"]
+    assert counters == {"items": 4} and seconds == 0.02
+    # the next frame starts empty, the totals keep growing
+    prof.add_time("draw", 0.5)
+    prof.end_frame(0.04)
+    assert prof.last_frame[0] == {"draw": 0.5} and prof.last_frame[1] == {}
+    assert prof.calls["draw"] == 2 and prof.counters["items"] == 4
+    assert prof.fps() == pytest.approx(2 / 0.06)
+    assert "2 frames" in prof.summary()
+
+
+def test_background_spans_stay_out_of_frames():
+    prof = Profiler()
+    prof.enable()
+
+    def job():
+        with prof.span("sweep"):
+            prof.count("points", 100)
+
+    worker = threading.Thread(target=job)
+    worker.start()
+    worker.join()
+    prof.end_frame(0.01)
+    assert prof.last_frame[:2] == ({}, {})
+    assert set(prof.job_spans) == {JOB_PREFIX + "sweep"}
+    assert prof.calls[JOB_PREFIX + "sweep"] == 1
+    assert prof.counters == {JOB_PREFIX + "points": 100}
+
+
+def test_reset():
+    prof = Profiler()
+    prof.enable()
+    prof.add_time("draw", 0.1)
+    prof.end_frame(0.1)
+    prof.reset()
+    assert prof.frames == 0 and not prof.totals and prof.fps() == 0.0
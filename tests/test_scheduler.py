@@ -0,0 +1,86 @@
+import pytest
+
+from smithpy.scheduler import RenderScheduler
+
+
+class FakeWidget:
+    """Records scheduled callbacks instead of running a Tk main loop."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.delays = []
+
+    def after(self, ms, func):
+        self.delays.append(ms)
+        self.jobs[len(self.delays)] = func
+        return len(self.delays)
+
+    def after_idle(self, func):
+        return self.after(0, func)
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run(self):
+        while self.jobs:
+            job = min(self.jobs)
+            self.jobs.pop(job)()
+
+
+def _scheduler(widget, drawn, **kwargs):
+    layers = [(name, lambda name=name: drawn.append(name)) for name in ("grid", "traces", "overlay")]
+    return RenderScheduler(widget, layers, **kwargs)
+
+
+def test_invalidations_are_merged_into_one_frame():
+    widget, drawn, frames = FakeWidget(), [], []
+    sched = _scheduler(widget, drawn, on_frame=lambda: frames.append(len(drawn)))
+    sched.invalidate("overlay")
+    sched.invalidate("grid")
+    sched.invalidate("overlay")
+    assert len(widget.jobs) == 1
+    widget.run()
+    # layers are drawn in drawing order, each once
+    assert drawn == ["grid", "overlay"] and frames == [2]
+    assert not sched.dirty
+
+
+def test_invalidate_all_and_unknown_layers():
+    widget, drawn = FakeWidget(), []
+    sched = _scheduler(widget, drawn)
+    sched.invalidate()
+    widget.run()
+    assert drawn == ["grid", "traces", "overlay"]
+    with pytest.raises(ValueError):
+        sched.invalidate("axes")
+
+
+def test_frames_are_spaced_by_frame_ms():
+    widget, drawn = FakeWidget(), []
+    sched = _scheduler(widget, drawn, frame_ms=1000)
+    sched.invalidate("grid")
+    widget.run()
+    sched.invalidate("traces")
+    # the next frame waits for the rest of the interval
+    assert widget.delays[-1] > 900
+
+
+def test_layers_invalidated_while_drawing_go_to_the_next_frame():
+    widget, drawn, frames = FakeWidget(), [], []
+    sched = RenderScheduler(widget, [("a", lambda: drawn.append("a")),
+                                     ("b", lambda: (drawn.append("b"), sched.invalidate("a")))],
+                            frame_ms=0, on_frame=lambda: frames.append(list(drawn)))
+    sched.invalidate("b")
+    sched.flush()
+    assert frames == [["b"]] and sched.dirty == {"a"}
+    widget.run()
+    assert frames == [["b"], ["b", "a"]]
+
+
+def test_cancel_drops_pending_work():
+    widget, drawn = FakeWidget(), []
+    sched = _scheduler(widget, drawn)
+    sched.invalidate("grid")
+    sched.cancel()
+    widget.run()
+    assert drawn == [] and not sched.dirty
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from smithpy.spatial import PointIndex
+
+
+def _brute_force(layers, point, max_dist):
+    best = None
+    for name, points in layers.items():
+        dist = np.abs(points - point)
+        dist[~np.isfinite(dist)] = np.inf
+        i = int(np.argmin(dist))
+        if dist[i] < max_dist and (best is None or dist[i] < best[2]):
+            best = (name, i, float(dist[i]))
+    return best
+
+
+@pytest.mark.parametrize("cells", [1, 16, 256])
+def test_nearest_matches_brute_force(cells):
+    rng = np.random.default_rng(cells)
+    # a few points lie outside the unit circle and land in the border cells
+    layers = {
+        "traces": rng.uniform(-1.2, 1.2, 500) + 1j * rng.uniform(-1.2, 1.2, 500),
+        "cloud": 0.3 * (rng.standard_normal(300) + 1j * rng.standard_normal(300)),
+    }
+    layers["traces"][::50] = np.nan
+    index = PointIndex(cells)
+    for name, points in layers.items():
+        index.update(name, points)
+    assert len(index) == 790
+    queries = rng.uniform(-1.3, 1.3, 200) + 1j * rng.uniform(-1.3, 1.3, 200)
+    for q in queries:
+        for max_dist in (0.01, 0.05, 0.5):
+            assert index.nearest(q, max_dist) == _brute_force(layers, q, max_dist)
+
+
+def test_update_skips_the_same_source():
+    index = PointIndex()
+    data = np.array([0.1 + 0.1j, -0.5j])
+    assert index.update("sweep", data, source=data)
+    assert not index.update("sweep", data * 0, source=data)
+    assert index.nearest(0.1 + 0.1j, 0.01)[:2] == ("sweep", 0)
+    assert index.update("sweep", [0.7], source=object())
+    assert index.nearest(0.1 + 0.1j, 0.01) is None
+    assert index.source("other") is None
+
+
+def test_remove_and_clear():
+    index = PointIndex()
+    index.update("a", [0.2])
+    index.update("b", [0.3])
+    index.remove("a")
+    index.remove("missing")
+    assert index.layers() == ["b"]
+    assert index.nearest(0.2, 0.05) is None
+    index.clear()
+    assert len(index) == 0 and index.nearest(0.3, 1.0) is None
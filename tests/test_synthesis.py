@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from smithpy.network import chain_response
+from smithpy.synthesis import (
+    BAND_POINTS,
+    E_SERIES,
+    band_frequencies,
+    evaluate,
+    sample_load,
+    snap_to_series,
+    solve_double_stub,
+    solve_l,
+    solve_pi,
+    solve_stub,
+    solve_t,
+    synthesize,
+)
+
+FREQ = 1e9
+Z0 = 50.0
+ZL = 20 - 30j
+
+
+def _match(comps, zl=ZL):
+    return chain_response(comps, zl, Z0, np.array([FREQ]))[0]
+
+
+@pytest.mark.parametrize("nets", [
+    solve_l(ZL, Z0, FREQ),
+    solve_pi(ZL, Z0, FREQ, [10.0, 15.0]),
+    solve_t(ZL, Z0, FREQ, [100.0, 200.0]),
+    solve_stub(ZL, Z0),
+    solve_double_stub(ZL, Z0, 45.0),
+], ids=["L", "PI", "T", "STUB", "DOUBLE_STUB"])
+def test_closed_form_networks_match_the_load(nets):
+    assert nets
+    for comps in nets:
+        assert _match(comps) == pytest.approx(Z0, abs=1e-6)
+
+
+def test_snap_to_series_uses_neighbouring_values():
+    comps = [{"type": "L", "value": 4.0e-9, "orient": "series", "disp": "4 nH"},
+             {"type": "TL", "length": 30.0, "z0": 50.0, "kind": "line"}]
+    nets = snap_to_series(comps, "E6")
+    assert sorted(n[0]["value"] for n in nets) == pytest.approx([3.3e-9, 4.7e-9])
+    assert all(n[1] is comps[1] for n in nets)
+    for net in nets:
+        mantissa = net[0]["value"] / 10 ** np.floor(np.log10(net[0]["value"]))
+        assert min(abs(mantissa - m) for m in E_SERIES["E6"]) < 1e-9
+
+
+def test_band_frequencies_and_sampled_loads():
+    freqs = band_frequencies(FREQ, (0.8e9, 1.2e9))
+    assert freqs.size == BAND_POINTS + 1
+    assert (freqs[0], freqs[-2], freqs[-1]) == (0.8e9, 1.2e9, FREQ)
+    np.testing.assert_allclose(sample_load(ZL, FREQ), np.full(BAND_POINTS + 1, ZL))
+    load = sample_load(lambda f: ZL * f / FREQ, FREQ)
+    assert load.dtype == complex and load[-1] == pytest.approx(ZL)
+
+
+def test_synthesize_accepts_sampled_loads():
+    args = (Z0, FREQ, ("L", "STUB"))
+    direct = synthesize(ZL, *args, processes=1)
+    sampled = synthesize(sample_load(ZL, FREQ), *args, processes=1)
+    assert [c.describe() for c in direct] == [c.describe() for c in sampled]
+    assert all(c.gamma <= 0.05 for c in direct)
+    widths = [c.bandwidth for c in direct]
+    assert widths == sorted(widths, reverse=True)
+    counts = [c.count for c in synthesize(ZL, *args, rank="count", processes=1)]
+    assert counts == sorted(counts)
+
+
+def test_synthesize_reports_progress():
+    seen = []
+    synthesize(ZL, Z0, FREQ, ("L", "DOUBLE_STUB"), processes=1, progress=seen.append)
+    assert seen == sorted(seen) and seen[-1] == 1.0
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"topologies": ("L", "BOGUS")},
+    {"series": "E7"},
+    {"rank": "price"},
+    {"band": (1.2e9, 1.5e9)},
+])
+def test_synthesize_rejects_bad_arguments(kwargs):
+    with pytest.raises(ValueError):
+        synthesize(ZL, Z0, FREQ, processes=1, **kwargs)
+
+
+def test_synthesize_rejects_wrong_load_length():
+    with pytest.raises(ValueError):
+        synthesize(np.full(3, ZL), Z0, FREQ, processes=1)
+
+
+def test_no_bandwidth_outside_the_band():
+    comps = solve_l(ZL, Z0, FREQ)[0]
+    band = np.linspace(0.5e9, 1.5e9, 101)
+    gamma, bandwidth, _ = evaluate(comps, ZL, Z0, FREQ, band, 10.0)
+    assert gamma < 1e-6 and bandwidth > 0
+    # the same network judged against a band above the design frequency
+    assert evaluate(comps, ZL, Z0, FREQ, band + 1e9, 10.0)[1] == 0.0
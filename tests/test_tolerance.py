@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from smithpy.network import chain_response
+from smithpy.tolerance import (
+    monte_carlo,
+    sample_components,
+    sample_factors,
+    tolerance_field,
+    tolerance_yield,
+)
+
+FREQ = 1e9
+Z0 = 50.0
+ZA = 25 + 10j
+CHAIN = [
+    {"type": "L", "value": 10e-9, "orient": "series", "tol": 5},
+    {"type": "C", "value": 2e-12, "orient": "shunt", "tol": 10, "dist": "normal"},
+    {"type": "TL", "length": 60.0, "z0": 75.0, "tol": 2},
+    {"type": "R", "value": 20.0, "orient": "series"},
+]
+
+
+def test_sample_factors_bounds():
+    rng = np.random.default_rng(0)
+    uniform = sample_factors(5, "uniform", 100000, rng)
+    assert uniform.min() >= 0.95 and uniform.max() <= 1.05
+    normal = sample_factors(9, "normal", 100000, rng)
+    assert normal.std() == pytest.approx(0.03, rel=0.02)
+    with pytest.raises(ValueError):
+        sample_factors(5, "triangle", 10, rng)
+
+
+def test_sample_components_perturbs_toleranced_fields():
+    comps = sample_components(CHAIN, 50, rng=1)
+    assert comps[0]["value"].shape == (50,)
+    assert comps[2]["length"].shape == (50,)
+    assert comps[3] is CHAIN[3]
+    assert CHAIN[0]["value"] == 10e-9
+
+
+def test_monte_carlo_matches_per_sample_chains():
+    z = monte_carlo(CHAIN, ZA, Z0, FREQ, samples=200, seed=7, chunk=64)
+    comps = sample_components(CHAIN, 64, np.random.default_rng(7))
+    for i in range(64):
+        sample = [{**c, tolerance_field(c): c[tolerance_field(c)][i]} if "tol" in c else c
+                  for c in comps]
+        assert z[i] == pytest.approx(chain_response(sample, ZA, Z0, np.array([FREQ]))[0])
+    np.testing.assert_array_equal(z, monte_carlo(CHAIN, ZA, Z0, FREQ, samples=200, seed=7, chunk=64))
+
+
+def test_monte_carlo_progress_and_arguments():
+    seen = []
+    monte_carlo(CHAIN, ZA, samples=100, chunk=30, progress=seen.append)
+    assert seen == pytest.approx([0.3, 0.6, 0.9, 1.0])
+    with pytest.raises(ValueError):
+        monte_carlo(CHAIN, ZA, samples=0)
+
+
+def test_tolerance_yield():
+    z = np.array([50, 100, 25, 150])
+    assert tolerance_yield(z, Z0, vswr=2.5) == 0.75
+    assert tolerance_yield(z, Z0, return_loss=10) == 0.25
+    assert tolerance_yield(z, Z0) == 1.0
+    assert tolerance_yield(np.array([]), Z0) == 0.0
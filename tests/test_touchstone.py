@@ -0,0 +1,72 @@
+import io
+
+import numpy as np
+import pytest
+
+from smithpy.touchstone import parse_options, read_touchstone
+
+# the same reflection coefficient 0.5 at 30°, once per format
+S11 = 0.5 * np.exp(1j * np.radians(30.0))
+ROWS = {
+    "MA": "0.5 30",
+    "DB": f"{20 * np.log10(0.5):.12f} 30",
+    "RI": f"{S11.real:.12f} {S11.imag:.12f}",
+}
+
+
+@pytest.mark.parametrize("fmt", sorted(ROWS))
+def test_data_formats(fmt):
+    text = f"! comment\n# MHZ S {fmt} R 75\n100 {ROWS[fmt]}\n200 {ROWS[fmt]} ! trailing\n"
+    data = read_touchstone(io.StringIO(text))
+    assert data.z0 == 75.0
+    np.testing.assert_allclose(data.freqs, [100e6, 200e6])
+    np.testing.assert_allclose(data.s[:, 0, 0], [S11, S11])
+
+
+@pytest.mark.parametrize("unit, scale", [("HZ", 1.0), ("KHZ", 1e3), ("MHZ", 1e6), ("GHZ", 1e9)])
+def test_frequency_units(unit, scale):
+    data = read_touchstone(io.StringIO(f"# {unit} S RI\n1.5 0 0\n"))
+    assert data.freqs[0] == pytest.approx(1.5 * scale)
+
+
+def test_option_defaults():
+    assert parse_options("#") == (1e9, "MA", 50.0)
+    assert parse_options("# khz s db r 25") == (1e3, "DB", 25.0)
+    with pytest.raises(ValueError):
+        parse_options("# GHZ Y MA")
+    with pytest.raises(ValueError):
+        parse_options("# GHZ S MA R")
+
+
+def test_two_port_order_and_extension(tmp_path):
+    # two-port rows list S11 S21 S12 S22
+    path = tmp_path / "amp.s2p"
+    path.write_text("# GHZ S RI R 50\n1 0.1 0 2 0 0.01 0 0.2 0\n"
+                    "2 0.3 0\n  4 0 0.03 0 0.4 0\n")
+    data = read_touchstone(path)
+    assert data.nports == 2
+    np.testing.assert_allclose(data.s[0], [[0.1, 0.01], [2, 0.2]])
+    np.testing.assert_allclose(data.s[1], [[0.3, 0.03], [4, 0.4]])
+
+
+def test_impedance_and_interpolation():
+    data = read_touchstone(io.StringIO("# HZ S RI R 50\n1 0 0\n3 0.5 0\n"))
+    np.testing.assert_allclose(data.impedance(), [50, 150])
+    # S is interpolated, then converted; outside the range the end points hold
+    np.testing.assert_allclose(data.impedance_at([0, 2, 5]), [50, 50 * 1.25 / 0.75, 150])
+
+
+def test_chunked_reading_matches_single_read():
+    lines = "".join(f"{f} {0.001 * f:.6f} {f % 360}\n" for f in range(1, 2001))
+    text = "# HZ S MA R 50\n" + lines
+    whole = read_touchstone(io.StringIO(text))
+    chunked = read_touchstone(io.StringIO(text), chunk_size=100)
+    np.testing.assert_array_equal(whole.freqs, chunked.freqs)
+    np.testing.assert_array_equal(whole.s, chunked.s)
+
+
+def test_invalid_files():
+    with pytest.raises(ValueError):
+        read_touchstone(io.StringIO("# HZ S RI\n1 0\n"))
+    with pytest.raises(ValueError):
+        read_touchstone(io.StringIO("[Version] 2.0\n"))